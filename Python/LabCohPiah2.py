@@ -1,5 +1,7 @@
 import re
 
+import cohpiah
+
 def le_assinatura():
     '''A funcao le os valores dos tracos linguisticos do modelo e devolve uma assinatura a ser comparada com os textos fornecidos'''
     print("Bem-vindo ao detector automático de COH-PIAH.")
@@ -84,9 +86,10 @@ def compara_assinatura(as_a, as_b):
     similaridade = 0
     
     while p <= 5:
-        soma_dif  += (as_a[p]-as_b[p])
+        # Diferenca absoluta por traco: diferencas de sinais opostos nao podem se anular
+        soma_dif  += abs(as_a[p]-as_b[p])
         p += 1
-    similaridade = abs(soma_dif)/6
+    similaridade = soma_dif/6
 
     #print(similaridade)
     #print(soma_dif)
@@ -95,25 +98,9 @@ def compara_assinatura(as_a, as_b):
 def calcula_assinatura(texto):
     '''IMPLEMENTADO! Essa funcao recebe um texto e deve devolver a assinatura do texto.'''
     
-    lista_palavras = []
-    lista_frases = []
-    lista_sentencas = separa_sentencas(texto)
-    sentencas = separa_sentencas(texto)
-    for sentenca in sentencas:
-        frases = separa_frases(sentenca)
-        lista_frases.extend(frases)
-        for frase in frases:
-            palavras = separa_palavras(frase)
-            lista_palavras.extend(palavras)
-    wal_calc = tamanho_médio_de_palavra(letras_texto(lista_palavras), lista_palavras)
-    ttr_calc = relação_Type_Token(lista_palavras, n_palavras_diferentes)
-    hlr_calc = razão_Hapax_Legomana(lista_palavras, n_palavras_unicas)
-    sal_calc = tamanho_médio_de_sentença(numero_caracteres(sentencas), lista_sentencas)
-    sac_calc = complexidade_de_sentença(lista_frases, lista_sentencas)
-    pal_calc = tamanho_médio_de_frase(numero_caracteres_frase(lista_frases), lista_frases)
-    lista = [wal_calc, ttr_calc, hlr_calc, sal_calc, sac_calc, pal_calc]
-    #print(lista)
-    return lista
+    # Uma unica passada com contadores e uma tabela de frequencias (veja cohpiah.py);
+    # o resultado e o mesmo de montar as listas de sentencas, frases e palavras
+    return cohpiah.calcula_assinatura(texto)
 
 def letras_texto(lista_palavras):
     soma_letras_palavras = 0
@@ -205,5 +192,6 @@ def main():
     # compara_assinatura(as_a, as_b)
 
 
-main()
+if __name__ == "__main__":
+    main()
 
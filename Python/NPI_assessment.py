@@ -7,6 +7,8 @@ from typing import Dict, List, Tuple
 import json
 from datetime import datetime
 
+from escores_preparados import EscoresPreparados
+
 # Set seaborn style for better visualizations
 sns.set_style("whitegrid")
 sns.set_palette("husl")
@@ -188,13 +190,16 @@ class NarcissismScreeningTool:
         fig = plt.figure(figsize=(20, 14))
         fig.patch.set_facecolor('white')
         
+        # Subscale order, values and risk bands prepared once for all panels
+        prepared = EscoresPreparados(scores, 'Overall_Narcissism', (50, 70))
+        
         # 1. Overall Narcissism Gauge
         ax1 = plt.subplot(2, 4, 1)
         self._create_narcissism_gauge(ax1, scores['Overall_Narcissism'])
         
         # 2. Subscale Radar Chart
         ax2 = plt.subplot(2, 4, (2, 3), projection='polar')
-        self._create_subscale_radar(ax2, scores)
+        self._create_subscale_radar(ax2, prepared)
         
         # 3. Risk Level Bar Chart
         ax3 = plt.subplot(2, 4, 4)
@@ -202,7 +207,7 @@ class NarcissismScreeningTool:
         
         # 4. Subscale Breakdown
         ax4 = plt.subplot(2, 4, (5, 6))
-        self._create_subscale_breakdown(ax4, scores)
+        self._create_subscale_breakdown(ax4, prepared)
         
         # 5. Percentile Comparison
         ax5 = plt.subplot(2, 4, 7)
@@ -425,17 +430,12 @@ class NarcissismScreeningTool:
         ax.set_yticks([])
         ax.set_title('Overall Narcissism Level', fontweight='bold', pad=25, fontsize=14)
     
-    def _create_subscale_radar(self, ax, scores):
+    def _create_subscale_radar(self, ax, prepared):
         """Create radar chart for subscales with seaborn styling"""
-        subscales = [k for k in scores.keys() if k != 'Overall_Narcissism']
-        values = [scores[k] for k in subscales]
+        subscales = prepared.subescalas
         
-        # Close the polygon
-        values += values[:1]
-        
-        # Calculate angles
-        angles = np.linspace(0, 2 * np.pi, len(subscales), endpoint=False).tolist()
-        angles += angles[:1]
+        # Closed polygon values and cached angles
+        values, angles, _ = prepared.radar()
         
         # Use seaborn color palette
         colors = sns.color_palette("husl", 2)
@@ -511,25 +511,17 @@ class NarcissismScreeningTool:
         # Rotate x labels for better readability
         plt.setp(ax.get_xticklabels(), fontsize=10, fontweight='bold')
     
-    def _create_subscale_breakdown(self, ax, scores):
+    def _create_subscale_breakdown(self, ax, prepared):
         """Create horizontal bar chart of subscales with seaborn styling"""
-        subscales = [k for k in scores.keys() if k != 'Overall_Narcissism']
-        values = [scores[k] for k in subscales]
-        
-        # Create DataFrame for seaborn
-        df = pd.DataFrame({
-            'Subscale': subscales,
-            'Score': values,
-            'Risk_Level': ['High' if score >= 70 else 'Moderate' if score >= 50 else 'Low' 
-                          for score in values]
-        })
+        subscales = prepared.subescalas
+        values = prepared.valores
         
-        # Use seaborn color palette
-        risk_colors = {'Low': '#2ECC71', 'Moderate': '#F39C12', 'High': '#E74C3C'}
+        # Colors indexed by risk band: Low (<50), Moderate (50-69), High (>=70)
+        risk_colors = ['#2ECC71', '#F39C12', '#E74C3C']
         
         # Create enhanced horizontal bar plot
         y_pos = np.arange(len(subscales))
-        bars = ax.barh(y_pos, values, color=[risk_colors[level] for level in df['Risk_Level']], 
+        bars = ax.barh(y_pos, values, color=[risk_colors[band] for band in prepared.faixas], 
                       alpha=0.85, edgecolor='white', linewidth=1.5)
         
         # Add value labels with better styling
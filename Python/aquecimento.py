@@ -0,0 +1,52 @@
+import functools
+import threading
+from typing import Callable
+
+# Preparação em segundo plano durante a aplicação interativa dos questionários.
+#
+# Importar matplotlib/seaborn e montar as distribuições populacionais de
+# referência leva alguns segundos. Enquanto o usuário responde às perguntas a
+# thread principal fica parada em input(); as ferramentas de triagem usam esse
+# tempo para executar essas tarefas numa thread daemon, e o relatório pode ser
+# montado logo após a última resposta.
+
+
+def uma_vez(funcao: Callable) -> Callable:
+    """
+    Decorador: executar a função (sem argumentos) uma única vez, mesmo com
+    chamadas concorrentes. Quem chega durante a execução espera o resultado;
+    se a função falhar, a próxima chamada tenta de novo.
+    """
+    trava = threading.Lock()
+    resultado = []
+
+    @functools.wraps(funcao)
+    def envoltorio():
+        with trava:
+            if not resultado:
+                resultado.append(funcao())
+        return resultado[0]
+    return envoltorio
+
+
+class Aquecimento:
+    """Executar tarefas de preparação, em ordem, numa thread daemon"""
+
+    def __init__(self, *tarefas: Callable):
+        self.tarefas = tarefas
+        self.erros = []
+        self._thread = threading.Thread(target=self._executar, name='aquecimento', daemon=True)
+
+    def _executar(self):
+        for tarefa in self.tarefas:
+            try:
+                tarefa()
+            except Exception as erro:
+                # Não interromper o questionário: a thread principal executa a
+                # tarefa de novo quando precisar dela e verá o erro nesse momento
+                self.erros.append((tarefa.__name__, erro))
+
+    def iniciar(self) -> 'Aquecimento':
+        """Iniciar a thread e devolver o próprio objeto"""
+        self._thread.start()
+        return self
@@ -0,0 +1,252 @@
+import argparse
+import hashlib
+import math
+import os
+from typing import Iterable, List, Tuple
+
+import numpy as np
+
+import cohpiah
+
+# Assinatura COH-PIAH aproximada, em memória fixa, para corpora enormes.
+#
+# O cálculo exato guarda a tabela de frequências de todas as palavras (em
+# minúsculas) para contar palavras diferentes (ttr) e hapax (hlr); num corpus
+# da web essa tabela domina a memória. Aqui a tabela é trocada por dois
+# esboços de tamanho fixo; os outros quatro traços continuam exatos.
+#
+# Palavras diferentes: HyperLogLog com 2^precisao registradores de um byte.
+#   Erro relativo padrão de 1,04 / sqrt(2^precisao): 0,81% com precisao=14
+#   (16 KB). Para poucas palavras a estimativa usa contagem linear e é
+#   praticamente exata. Como estimativa, ela pode passar do número de
+#   palavras num texto curto (ttr > 1); por isso é limitada ao intervalo
+#   [hapax, palavras], em que o valor exato sempre está.
+#
+# Hapax: esboço tipo count-min com `profundidade` linhas de `largura` células
+#   de um byte, saturadas em 2 (só importa se a palavra apareceu 0, 1 ou mais
+#   vezes), com atualização conservadora. Antes de somar uma palavra, o mínimo
+#   das suas células diz quantas vezes ela já apareceu; 0 -> 1 torna o hash da
+#   palavra um candidato a hapax e 1 -> 2 o descarta. O esboço nunca
+#   subestima, então só erra quando todas as células da palavra já foram
+#   ocupadas por outras: com D palavras diferentes, a chance de um erro é no
+#   máximo (D / largura) ^ profundidade. Com o padrão (largura 2^22,
+#   profundidade 4: 16 MB) isso dá cerca de 3e-7 para D = 100 mil e 0,3% para
+#   D = 1 milhão. Os candidatos são só hashes de 8 bytes num vetor ordenado
+#   (não as palavras), e a memória deles cresce com o número de hapax.
+#
+# Contadores de trechos consecutivos são combinados como os exatos
+# (cohpiah.calcula_assinatura(..., contador=ContadorAproximado)): os
+# registradores do HyperLogLog pelo máximo, as tabelas do esboço pela soma
+# (saturada em 2), e um candidato de um lado continua hapax se a tabela do
+# outro lado diz que a palavra não apareceu lá.
+#
+# As palavras de cada pedaço são agrupadas numa tabela pequena antes de ir
+# para os esboços, então o custo dos hashes é por palavra distinta do pedaço.
+# O caminho exato (cohpiah.ContadorAssinatura) continua sendo o padrão; o
+# aproximado só é usado a partir de LIMITE_EXATO bytes ou quando pedido.
+
+PRECISAO = 14
+LARGURA = 1 << 22
+PROFUNDIDADE = 4
+LIMITE_EXATO = 256 << 20  # arquivos menores usam a tabela exata
+
+
+def _hashes(palavras: Iterable[str]) -> np.ndarray:
+    """Hash de 64 bits de cada palavra (estável entre processos, ao contrário de hash())"""
+    return np.fromiter((int.from_bytes(hashlib.blake2b(p.encode('utf-8', 'surrogatepass'), digest_size=8).digest(),
+                                       'little') for p in palavras), dtype=np.uint64)
+
+
+def _comprimento_bits(x: np.ndarray) -> np.ndarray:
+    """int.bit_length() de cada elemento de um vetor uint64"""
+    x = x.copy()
+    bits = np.zeros(x.shape, dtype=np.uint8)
+    for deslocamento in (32, 16, 8, 4, 2, 1):
+        grandes = x >= (np.uint64(1) << np.uint64(deslocamento))
+        x[grandes] >>= np.uint64(deslocamento)
+        bits[grandes] += deslocamento
+    return bits + (x > 0)
+
+
+class HyperLogLog:
+    """Estimador do número de elementos distintos (Flajolet et al., 2007)"""
+
+    def __init__(self, precisao: int = PRECISAO):
+        self.precisao = precisao
+        self.registros = np.zeros(1 << precisao, dtype=np.uint8)
+
+    def adicionar(self, hashes: np.ndarray):
+        """Registrar um vetor de hashes de 64 bits"""
+        p = np.uint64(self.precisao)
+        indices = (hashes >> (np.uint64(64) - p)).astype(np.intp)
+        # Posição do primeiro bit 1 nos 64 - p bits restantes (o bit-sentinela limita o máximo)
+        resto = (hashes << p) | (np.uint64(1) << (p - np.uint64(1)))
+        postos = (65 - _comprimento_bits(resto)).astype(np.uint8)
+        np.maximum.at(self.registros, indices, postos)
+
+    def combinar(self, outro: 'HyperLogLog') -> 'HyperLogLog':
+        """União com outro estimador de mesma precisão; devolve self"""
+        if outro.precisao != self.precisao:
+            raise ValueError("estimadores com precisões diferentes")
+        np.maximum(self.registros, outro.registros, out=self.registros)
+        return self
+
+    def estimativa(self) -> float:
+        """Número estimado de elementos distintos"""
+        m = len(self.registros)
+        alfa = 0.7213 / (1 + 1.079 / m)
+        estimativa = alfa * m * m / np.sum(np.ldexp(1.0, -self.registros.astype(np.int64)))
+        vazios = int(np.count_nonzero(self.registros == 0))
+        if estimativa <= 2.5 * m and vazios:
+            # Contagem linear: mais precisa enquanto há registradores vazios
+            estimativa = m * math.log(m / vazios)
+        return float(estimativa)
+
+
+class EsbocoHapax:
+    """Esboço count-min saturado em 2 que acompanha o número de hapax"""
+
+    def __init__(self, largura: int = LARGURA, profundidade: int = PROFUNDIDADE):
+        if largura & (largura - 1):
+            raise ValueError("largura deve ser uma potência de 2")
+        self.tabela = np.zeros((profundidade, largura), dtype=np.uint8)
+        self._candidatos = np.empty(0, dtype=np.uint64)  # ordenado, sem repetições
+        # Mudanças ainda não aplicadas a _candidatos: cada hash entra no máximo uma vez e
+        # sai no máximo uma vez depois de entrar (a contagem satura em 2)
+        self._entradas = []
+        self._saidas = []
+        self._pendentes = 0
+
+    def _celulas(self, hashes: np.ndarray) -> np.ndarray:
+        """Célula de cada hash em cada linha (profundidade x len(hashes))"""
+        profundidade, largura = self.tabela.shape
+        # Hash duplo: célula da linha k = h1 + k * h2 (h2 ímpar)
+        h1 = hashes & np.uint64(0xFFFFFFFF)
+        h2 = (hashes >> np.uint64(32)) | np.uint64(1)
+        linhas = np.arange(profundidade, dtype=np.uint64)[:, None]
+        return ((h1 + linhas * h2) & np.uint64(largura - 1)).astype(np.intp)
+
+    def contagens(self, hashes: np.ndarray) -> np.ndarray:
+        """Ocorrências estimadas (0, 1 ou 2 = duas ou mais) de cada hash; nunca subestima"""
+        celulas = self._celulas(hashes)
+        return self.tabela[np.arange(self.tabela.shape[0])[:, None], celulas].min(axis=0)
+
+    def adicionar(self, hashes: np.ndarray, contagens: np.ndarray):
+        """Somar contagens[i] ocorrências da palavra de hash hashes[i]"""
+        celulas = self._celulas(hashes)
+        antes = self.tabela[np.arange(self.tabela.shape[0])[:, None], celulas].min(axis=0)
+        depois = np.minimum(antes.astype(np.int64) + contagens, 2).astype(np.uint8)
+        entradas = hashes[(antes == 0) & (depois == 1)]
+        saidas = hashes[(antes == 1) & (depois == 2)]
+        for k in range(len(self.tabela)):
+            np.maximum.at(self.tabela[k], celulas[k], depois)
+        self._entradas.append(entradas)
+        self._saidas.append(saidas)
+        self._pendentes += len(entradas) + len(saidas)
+        if self._pendentes > max(len(self._candidatos), 1 << 16):
+            # Aplicar em lote mantém o custo amortizado em O(log n) por mudança
+            self._aplicar()
+
+    def _aplicar(self):
+        if self._pendentes:
+            candidatos = np.union1d(self._candidatos, np.concatenate(self._entradas))
+            self._candidatos = np.setdiff1d(candidatos, np.concatenate(self._saidas), assume_unique=True)
+        self._entradas, self._saidas, self._pendentes = [], [], 0
+
+    def candidatos(self) -> np.ndarray:
+        """Hashes das palavras que apareceram uma só vez (ordenados)"""
+        self._aplicar()
+        return self._candidatos
+
+    @property
+    def hapax(self) -> int:
+        return len(self.candidatos())
+
+    def combinar(self, outro: 'EsbocoHapax') -> 'EsbocoHapax':
+        """Somar as contagens de outro esboço de mesma forma; devolve self"""
+        if outro.tabela.shape != self.tabela.shape:
+            raise ValueError("esboços com largura ou profundidade diferentes")
+        meus, deles = self.candidatos(), outro.candidatos()
+        # Hapax de um lado que não apareceu no outro continua hapax
+        candidatos = np.union1d(meus[outro.contagens(meus) == 0], deles[self.contagens(deles) == 0])
+        np.minimum(self.tabela + outro.tabela, 2, out=self.tabela)
+        self._candidatos = candidatos
+        return self
+
+
+class ContadorAproximado(cohpiah.ContadorAssinatura):
+    """ContadorAssinatura com palavras diferentes e hapax estimados em memória fixa"""
+
+    def __init__(self, precisao: int = PRECISAO, largura: int = LARGURA, profundidade: int = PROFUNDIDADE):
+        super().__init__()
+        self.tipos = HyperLogLog(precisao)
+        self.esboco = EsbocoHapax(largura, profundidade)
+
+    def alimentar(self, trecho: str):
+        super().alimentar(trecho)
+        self._descarregar()
+
+    def _descarregar(self):
+        """Passar as palavras do último pedaço da tabela de frequências para os esboços"""
+        if self.frequencias:
+            hashes = _hashes(self.frequencias)
+            self.tipos.adicionar(hashes)
+            self.esboco.adicionar(hashes, np.fromiter(self.frequencias.values(), dtype=np.int64))
+            self.frequencias.clear()
+
+    def combinar(self, outra: 'ContadorAproximado') -> 'ContadorAproximado':
+        super().combinar(outra)
+        # Palavras da junção, contadas agora, vão para os esboços antes de somá-los
+        self._descarregar()
+        self.tipos.combinar(outra.tipos)
+        self.esboco.combinar(outra.esboco)
+        return self
+
+    def assinatura(self) -> List[float]:
+        """Os seis traços do texto; conclui a leitura (chamar depois do último pedaço)"""
+        self.concluir()
+        self._descarregar()
+        return super().assinatura()
+
+    def _distintas_e_hapax(self, bordas) -> Tuple[float, float]:
+        # Toda palavra diferente aparece ao menos uma vez, e todo hapax é uma palavra diferente
+        hapax = self.esboco.hapax
+        palavras = self.palavras + bordas.palavras
+        return min(max(self.tipos.estimativa(), hapax), palavras), hapax
+
+
+def assinatura_fluxo(pedacos: Iterable[str], **opcoes) -> List[float]:
+    """Assinatura aproximada de um texto entregue como sequência de pedaços"""
+    contador = ContadorAproximado(**opcoes)
+    for pedaco in pedacos:
+        contador.alimentar(pedaco)
+    return contador.assinatura()
+
+
+def assinatura_arquivo(caminho: str, encoding: str = 'utf-8', aproximado: bool = None,
+                       tamanho_bloco: int = cohpiah.TAMANHO_BLOCO) -> List[float]:
+    """
+    Assinatura de um arquivo lido em blocos. Sem aproximado explícito, o
+    cálculo é exato para arquivos menores que LIMITE_EXATO e aproximado acima.
+    """
+    if aproximado is None:
+        aproximado = os.path.getsize(caminho) >= LIMITE_EXATO
+    if not aproximado:
+        return cohpiah.assinatura_arquivo(caminho, encoding, tamanho_bloco)
+    with open(caminho, encoding=encoding, newline='') as f:
+        return assinatura_fluxo(iter(lambda: f.read(tamanho_bloco), ''))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Assinatura COH-PIAH de um arquivo grande, com ttr e hlr aproximados")
+    parser.add_argument('arquivo', help="texto (UTF-8)")
+    modo = parser.add_mutually_exclusive_group()
+    modo.add_argument('--exato', dest='aproximado', action='store_false', default=None,
+                      help="usar a tabela exata de frequências")
+    modo.add_argument('--aproximado', dest='aproximado', action='store_true',
+                      help="usar os esboços mesmo para arquivos pequenos")
+    args = parser.parse_args()
+
+    assinatura = assinatura_arquivo(args.arquivo, aproximado=args.aproximado)
+    for traco, valor in zip(cohpiah.TRACOS, assinatura):
+        print(f"{traco}: {valor:.6f}")
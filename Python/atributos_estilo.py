@@ -0,0 +1,182 @@
+import argparse
+from typing import List, Tuple
+
+import numpy as np
+
+import cohpiah
+from quase_duplicatas import misturar
+
+# Atributos estilométricos estendidos, calculados na mesma passada dos seis traços.
+#
+# A assinatura de seis números separa mal autores num grupo grande. Junto com
+# ela, ContadorAtributos acumula:
+#   - n-gramas de caracteres (texto em minúsculas, com espaços e pontuação),
+#     contados em DIMENSAO_NGRAMAS posições por hashing (colisões somam);
+#   - a frequência relativa de cada palavra funcional do português
+#     (PALAVRAS_FUNCIONAIS), lida da tabela de frequências da própria assinatura.
+# vetor() devolve um float32 de tamanho fixo: cada bloco normalizado (norma L2)
+# e ponderado, e o vetor inteiro com norma 1, de modo que a similaridade de
+# cosseno entre dois textos é um produto escalar. Comparar n textos com m
+# referências é uma multiplicação de matrizes (similaridade_cosseno).
+#
+# Os n-gramas que cruzam o corte entre pedaços são contados com os n - 1
+# últimos caracteres do pedaço anterior, então o resultado não depende de
+# como o texto é dividido, e contadores de trechos consecutivos podem ser
+# combinados como os de cohpiah.ContadorAssinatura.
+
+N_GRAMA = 3
+DIMENSAO_NGRAMAS = 1 << 12
+PESO_NGRAMAS = 1.0
+PESO_FUNCIONAIS = 1.0
+PALAVRAS_FUNCIONAIS = (
+    # artigos e contrações
+    'o', 'a', 'os', 'as', 'um', 'uma', 'uns', 'umas',
+    'do', 'da', 'dos', 'das', 'no', 'na', 'nos', 'nas', 'ao', 'à', 'aos', 'às',
+    'pelo', 'pela', 'pelos', 'pelas', 'num', 'numa', 'dum', 'duma', 'deste', 'desta', 'desse', 'dessa',
+    'disso', 'disto', 'daquele', 'daquela', 'naquele', 'naquela', 'nisso', 'nisto',
+    # preposições
+    'de', 'em', 'por', 'para', 'com', 'sem', 'sob', 'sobre', 'entre', 'até', 'desde', 'contra', 'após', 'perante',
+    # conjunções
+    'e', 'ou', 'mas', 'porém', 'contudo', 'todavia', 'pois', 'porque', 'que', 'se', 'como', 'quando',
+    'enquanto', 'embora', 'logo', 'portanto', 'nem', 'também', 'senão',
+    # pronomes
+    'eu', 'tu', 'ele', 'ela', 'nós', 'vós', 'eles', 'elas', 'você', 'vocês', 'me', 'te', 'lhe', 'lhes',
+    'mim', 'ti', 'si', 'comigo', 'consigo', 'meu', 'minha', 'teu', 'tua', 'seu', 'sua', 'seus', 'suas',
+    'nosso', 'nossa', 'este', 'esta', 'esse', 'essa', 'aquele', 'aquela', 'isto', 'isso', 'aquilo',
+    'qual', 'quem', 'cujo', 'onde', 'algum', 'alguma', 'nenhum', 'nenhuma', 'todo', 'toda', 'tudo', 'outro', 'outra',
+    # advérbios e verbos auxiliares frequentes
+    'não', 'já', 'ainda', 'mais', 'menos', 'muito', 'pouco', 'tão', 'bem', 'mal', 'só', 'sempre', 'nunca',
+    'aqui', 'ali', 'lá', 'então', 'assim', 'é', 'era', 'foi', 'ser', 'são', 'está', 'estava', 'há', 'havia',
+    'tem', 'tinha', 'ter', 'vai', 'ia',
+)
+_POSICAO_FUNCIONAL = {palavra: i for i, palavra in enumerate(PALAVRAS_FUNCIONAIS)}
+_MULTIPLICADOR = np.uint64(0x100000001B3)
+
+
+def contar_ngramas(texto: str, n: int = N_GRAMA, dimensao: int = DIMENSAO_NGRAMAS) -> np.ndarray:
+    """Contagem dos n-gramas de caracteres do texto em `dimensao` posições (potência de 2)"""
+    codigos = np.frombuffer(texto.encode('utf-32-le', 'surrogatepass'), dtype=np.uint32).astype(np.uint64)
+    m = len(codigos) - n + 1
+    if m <= 0:
+        return np.zeros(dimensao, dtype=np.int64)
+    valores = np.zeros(m, dtype=np.uint64)
+    for j in range(n):
+        valores = valores * _MULTIPLICADOR + codigos[j:j + m]
+    posicoes = (misturar(valores) & np.uint64(dimensao - 1)).astype(np.intp)
+    return np.bincount(posicoes, minlength=dimensao)
+
+
+class ContadorAtributos(cohpiah.ContadorAssinatura):
+    """ContadorAssinatura que também acumula n-gramas de caracteres para vetor()"""
+
+    def __init__(self, n: int = N_GRAMA, dimensao: int = DIMENSAO_NGRAMAS):
+        if dimensao & (dimensao - 1):
+            raise ValueError("dimensao deve ser uma potência de 2")
+        super().__init__()
+        self.n = n
+        self.ngramas = np.zeros(dimensao, dtype=np.int64)
+        self._inicio = ''  # primeiros n - 1 caracteres, para combinar()
+        self._fim = ''  # últimos n - 1 caracteres, início dos n-gramas do próximo pedaço
+
+    def alimentar(self, trecho: str):
+        super().alimentar(trecho)
+        minusculo = trecho.lower()
+        if len(self._inicio) < self.n - 1:
+            self._inicio = (self._inicio + minusculo)[:self.n - 1]
+        texto = self._fim + minusculo
+        self.ngramas += contar_ngramas(texto, self.n, len(self.ngramas))
+        self._fim = texto[max(0, len(texto) - (self.n - 1)):]
+
+    def combinar(self, outra: 'ContadorAtributos') -> 'ContadorAtributos':
+        if (outra.n, len(outra.ngramas)) != (self.n, len(self.ngramas)):
+            raise ValueError("contadores com n ou dimensão diferentes")
+        super().combinar(outra)
+        # Só cruzam a junção os n-gramas do fim deste trecho com o início do outro
+        self.ngramas += contar_ngramas(self._fim + outra._inicio, self.n, len(self.ngramas))
+        self.ngramas += outra.ngramas
+        self._inicio = (self._inicio + outra._inicio)[:self.n - 1]
+        if len(outra._fim) < self.n - 1:
+            # O outro trecho é mais curto que n - 1: o fim inclui caracteres deste
+            texto = self._fim + outra._fim
+            self._fim = texto[max(0, len(texto) - (self.n - 1)):]
+        else:
+            self._fim = outra._fim
+        return self
+
+    def funcionais(self) -> np.ndarray:
+        """Frequência relativa de cada palavra de PALAVRAS_FUNCIONAIS no texto lido"""
+        contagens = np.zeros(len(PALAVRAS_FUNCIONAIS))
+        bordas = self._contar_bordas()
+        palavras = self.palavras + bordas.palavras
+        for frequencias in (self.frequencias, bordas.frequencias):
+            for palavra, n in frequencias.items():
+                posicao = _POSICAO_FUNCIONAL.get(palavra)
+                if posicao is not None:
+                    contagens[posicao] += n
+        return contagens / palavras if palavras else contagens
+
+    def vetor(self, peso_ngramas: float = PESO_NGRAMAS, peso_funcionais: float = PESO_FUNCIONAIS) -> np.ndarray:
+        """Vetor float32 de norma 1: n-gramas e palavras funcionais, cada bloco normalizado e ponderado"""
+        blocos = []
+        for bloco, peso in ((self.ngramas.astype(np.float64), peso_ngramas), (self.funcionais(), peso_funcionais)):
+            norma = np.linalg.norm(bloco)
+            blocos.append(bloco * (peso / norma) if norma else bloco)
+        vetor = np.concatenate(blocos)
+        norma = np.linalg.norm(vetor)
+        return (vetor / norma if norma else vetor).astype(np.float32)
+
+
+def extrair(texto: str, **opcoes) -> Tuple[List[float], np.ndarray]:
+    """A assinatura de seis traços e o vetor de atributos de um texto, numa única passada"""
+    contador = ContadorAtributos(**opcoes)
+    for i in range(0, len(texto), cohpiah.TAMANHO_BLOCO):
+        contador.alimentar(texto[i:i + cohpiah.TAMANHO_BLOCO])
+    return contador.assinatura(), contador.vetor()
+
+
+def extrair_arquivo(caminho: str, encoding: str = 'utf-8', **opcoes) -> Tuple[List[float], np.ndarray]:
+    """Como extrair(), para um arquivo lido em blocos"""
+    contador = ContadorAtributos(**opcoes)
+    with open(caminho, encoding=encoding, newline='') as f:
+        for bloco in iter(lambda: f.read(cohpiah.TAMANHO_BLOCO), ''):
+            contador.alimentar(bloco)
+    return contador.assinatura(), contador.vetor()
+
+
+def similaridade_cosseno(vetores, referencias, linhas_por_bloco: int = 4096) -> np.ndarray:
+    """Cosseno entre cada linha de vetores (n x d) e cada linha de referencias (m x d): n x m, float32"""
+    a = np.atleast_2d(np.asarray(vetores, dtype=np.float32))
+    b = np.atleast_2d(np.asarray(referencias, dtype=np.float32))
+    # Vetores de vetor() já têm norma 1; normalizar de novo permite vetores de outra origem
+    normas_b = np.linalg.norm(b, axis=1)
+    b = b / np.where(normas_b == 0, 1, normas_b)[:, None]
+    resultado = np.empty((a.shape[0], b.shape[0]), dtype=np.float32)
+    for inicio in range(0, a.shape[0], linhas_por_bloco):
+        bloco = a[inicio:inicio + linhas_por_bloco]
+        normas = np.linalg.norm(bloco, axis=1)
+        np.matmul(bloco / np.where(normas == 0, 1, normas)[:, None], b.T, out=resultado[inicio:inicio + len(bloco)])
+    return resultado
+
+
+def mais_parecidos(vetores, referencias, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+    """Índices e cossenos das k referências mais parecidas com cada vetor, do maior cosseno ao menor"""
+    cossenos = similaridade_cosseno(vetores, referencias)
+    k = min(k, cossenos.shape[1])
+    indices = np.argpartition(-cossenos, k - 1, axis=1)[:, :k]
+    valores = np.take_along_axis(cossenos, indices, axis=1)
+    ordem = np.argsort(-valores, axis=1, kind='stable')
+    return np.take_along_axis(indices, ordem, axis=1), np.take_along_axis(valores, ordem, axis=1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Comparar textos por n-gramas de caracteres e palavras funcionais")
+    parser.add_argument('texto', help="texto a atribuir (UTF-8)")
+    parser.add_argument('referencias', nargs='+', help="textos de autores conhecidos (UTF-8)")
+    args = parser.parse_args()
+
+    assinatura, vetor = extrair_arquivo(args.texto)
+    vetores = np.stack([extrair_arquivo(caminho)[1] for caminho in args.referencias])
+    cossenos = similaridade_cosseno(vetor, vetores)[0]
+    print("Assinatura:", ', '.join(f"{traco}={valor:.4f}" for traco, valor in zip(cohpiah.TRACOS, assinatura)))
+    for posicao, i in enumerate(np.argsort(-cossenos, kind='stable'), 1):
+        print(f"{posicao:3d}. {args.referencias[i]}  (cosseno {cossenos[i]:.4f})")
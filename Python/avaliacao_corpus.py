@@ -0,0 +1,200 @@
+import argparse
+import contextlib
+import io
+import os
+import tarfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple
+
+import cache_assinaturas
+import cohpiah
+import LabCohPiah2
+
+# Avaliação em lote de um corpus de redações contra a assinatura COH-PIAH.
+#
+# avalia_textos() recebe os textos digitados um a um; aqui a origem é um
+# diretório (procurado recursivamente) ou um arquivo .zip/.tar/.tar.gz com os
+# textos. Os nomes são divididos em lotes e cada processo do pool calcula as
+# assinaturas de um lote inteiro, abrindo o arquivo compactado uma única vez
+# por lote. Os textos são ordenados pelo grau de similaridade com a
+# assinatura de referência (menor = mais provável de estar infectado).
+#
+# Com um cache (cache_assinaturas.CacheAssinaturas), cada processo calcula
+# primeiro o hash dos textos do lote e só tokeniza os que não estão no cache.
+# Com normalizar=True (--normalizar), os textos passam por
+# cache_assinaturas.normalizar_fluxo() antes do hash e da assinatura, e cópias
+# que só diferem em quebras de linha ou composição Unicode usam a mesma
+# entrada do cache.
+#
+# Um texto que não pode ser lido (erro de E/S) ou decodificado no encoding
+# dado é ignorado sem interromper o corpus: fica fora das assinaturas e, se
+# for passada uma lista `ignorados`, entra nela como (nome, motivo).
+
+EXTENSAO_PADRAO = '.txt'
+
+
+def listar_textos(origem: str, extensao: str = EXTENSAO_PADRAO) -> List[str]:
+    """Nomes dos textos da origem, em ordem (caminhos relativos à origem)"""
+    if os.path.isdir(origem):
+        nomes = []
+        for raiz, _, arquivos in os.walk(origem):
+            for arquivo in arquivos:
+                if arquivo.endswith(extensao):
+                    nomes.append(os.path.relpath(os.path.join(raiz, arquivo), origem))
+        return sorted(nomes)
+    if zipfile.is_zipfile(origem):
+        with zipfile.ZipFile(origem) as z:
+            return sorted(n for n in z.namelist() if n.endswith(extensao))
+    if tarfile.is_tarfile(origem):
+        with tarfile.open(origem) as t:
+            return sorted(m.name for m in t.getmembers() if m.isfile() and m.name.endswith(extensao))
+    raise ValueError(f"{origem} não é um diretório nem um arquivo .zip/.tar")
+
+
+@contextlib.contextmanager
+def abrir_origem(origem: str):
+    """Função que abre um texto da origem pelo nome, em modo binário; o arquivo compactado é aberto uma vez"""
+    if os.path.isdir(origem):
+        yield lambda nome: open(os.path.join(origem, nome), 'rb')
+        return
+    compactado = zipfile.ZipFile(origem) if zipfile.is_zipfile(origem) else tarfile.open(origem)
+    try:
+        yield compactado.open if isinstance(compactado, zipfile.ZipFile) else compactado.extractfile
+    finally:
+        compactado.close()
+
+
+def _assinatura_binario(arquivo, encoding: str, normalizar: bool = False) -> List[float]:
+    """Assinatura de um arquivo aberto em modo binário, lido em blocos (normalizados, se pedido)"""
+    texto = io.TextIOWrapper(arquivo, encoding=encoding, newline='')
+    pedacos = iter(lambda: texto.read(cohpiah.TAMANHO_BLOCO), '')
+    return cohpiah.assinatura_fluxo(cache_assinaturas.normalizar_fluxo(pedacos) if normalizar else pedacos)
+
+
+def _motivo(erro: Exception) -> str:
+    return f"{type(erro).__name__}: {erro}"
+
+
+def _assinaturas_lote(origem: str, nomes: List[str], encoding: str,
+                      cache: cache_assinaturas.CacheAssinaturas = None, normalizar: bool = False
+                      ) -> Tuple[List[Tuple[str, List[float]]], List[Tuple[str, str]]]:
+    """
+    Worker: assinaturas de um lote de textos (textos sem palavras recebem None)
+    e os textos ignorados, com o motivo
+    """
+    resultados = []
+    ignorados = {}
+    with abrir_origem(origem) as abrir:
+        chaves = {}
+        guardadas = {}
+        if cache is not None:
+            for nome in nomes:
+                try:
+                    with abrir(nome) as arquivo:
+                        chaves[nome] = cache_assinaturas.chave_binario(arquivo, encoding, normalizar=normalizar)
+                except (UnicodeDecodeError, OSError) as erro:
+                    ignorados[nome] = _motivo(erro)
+            guardadas = cache.obter_varios(chaves.values())
+
+        novas = []
+        for nome in nomes:
+            if nome in ignorados:
+                continue
+            chave = chaves.get(nome)
+            if chave in guardadas:
+                resultados.append((nome, guardadas[chave]))
+                continue
+            try:
+                with abrir(nome) as arquivo:
+                    assinatura = _assinatura_binario(arquivo, encoding, normalizar)
+            except ZeroDivisionError:
+                # Texto vazio ou sem palavras: não há assinatura a comparar
+                assinatura = None
+            except (UnicodeDecodeError, OSError) as erro:
+                # Ilegível: fica fora do resultado e do cache
+                ignorados[nome] = _motivo(erro)
+                continue
+            resultados.append((nome, assinatura))
+            if chave is not None:
+                novas.append((chave, assinatura))
+        if novas:
+            cache.gravar_varios(novas)
+    return resultados, list(ignorados.items())
+
+
+def calcular_assinaturas(origem: str, extensao: str = EXTENSAO_PADRAO, processos: int = None,
+                         tamanho_lote: int = 64, encoding: str = 'utf-8',
+                         cache: cache_assinaturas.CacheAssinaturas = None,
+                         nomes: List[str] = None,
+                         ignorados: List[Tuple[str, str]] = None,
+                         normalizar: bool = False) -> List[Tuple[str, List[float]]]:
+    """
+    Assinaturas dos textos da origem, calculadas em paralelo, na ordem de
+    listar_textos() (ou só dos nomes dados, nessa ordem). Os textos que não
+    puderam ser lidos ficam de fora e são acrescentados a `ignorados`, se dada,
+    como (nome, motivo). Com normalizar=True, as assinaturas (e as chaves do
+    cache) são as dos textos normalizados.
+    """
+    nomes = listar_textos(origem, extensao) if nomes is None else nomes
+    lotes = [nomes[i:i + tamanho_lote] for i in range(0, len(nomes), tamanho_lote)]
+    assinaturas = []
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+        futuros = [executor.submit(_assinaturas_lote, origem, lote, encoding, cache, normalizar) for lote in lotes]
+        for futuro in futuros:
+            resultados, ignorados_lote = futuro.result()
+            assinaturas.extend(resultados)
+            if ignorados is not None:
+                ignorados.extend(ignorados_lote)
+    return assinaturas
+
+
+def avaliar_corpus(origem: str, ass_cp: List[float], extensao: str = EXTENSAO_PADRAO,
+                   processos: int = None, tamanho_lote: int = 64,
+                   encoding: str = 'utf-8',
+                   cache: cache_assinaturas.CacheAssinaturas = None,
+                   ignorados: List[Tuple[str, str]] = None,
+                   normalizar: bool = False) -> List[Tuple[str, float]]:
+    """
+    Ranquear os textos da origem pelo grau de similaridade com ass_cp
+    (compara_assinatura), do mais provável de estar infectado ao menos provável.
+    Textos sem palavras ficam de fora; os ilegíveis vão para `ignorados`.
+    """
+    assinaturas = calcular_assinaturas(origem, extensao, processos, tamanho_lote, encoding, cache,
+                                       ignorados=ignorados, normalizar=normalizar)
+    graus = [(nome, LabCohPiah2.compara_assinatura(assinatura, ass_cp))
+             for nome, assinatura in assinaturas if assinatura is not None]
+    # sorted() é estável: empates mantêm a ordem dos nomes
+    return sorted(graus, key=lambda par: par[1])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Avaliar um corpus de textos contra a assinatura COH-PIAH")
+    parser.add_argument('origem', help="diretório ou arquivo .zip/.tar com os textos")
+    parser.add_argument('--assinatura', type=float, nargs=6, metavar=cohpiah.TRACOS,
+                        help="assinatura do aluno infectado (padrão: perguntar no console)")
+    parser.add_argument('--extensao', default=EXTENSAO_PADRAO, help="extensão dos textos (padrão: .txt)")
+    parser.add_argument('--top', type=int, default=10, help="quantos textos mostrar")
+    parser.add_argument('--processos', type=int, help="número de processos (padrão: todos os núcleos)")
+    parser.add_argument('--lote', type=int, default=64, help="textos por tarefa enviada a cada processo")
+    parser.add_argument('--encoding', default='utf-8')
+    parser.add_argument('--cache', help="banco SQLite do cache de assinaturas (padrão: sem cache)")
+    parser.add_argument('--limite-cache', type=int, default=cache_assinaturas.LIMITE_PADRAO,
+                        help="máximo de assinaturas no cache")
+    parser.add_argument('--normalizar', action='store_true',
+                        help="normalizar quebras de linha e Unicode (NFC) antes de calcular e procurar no cache")
+    args = parser.parse_args()
+
+    ass_cp = args.assinatura or LabCohPiah2.le_assinatura()
+    cache = cache_assinaturas.CacheAssinaturas(args.cache, args.limite_cache) if args.cache else None
+    ignorados = []
+    ranking = avaliar_corpus(args.origem, ass_cp, args.extensao, args.processos, args.lote, args.encoding, cache,
+                             ignorados, args.normalizar)
+
+    print(f"{len(ranking)} textos avaliados. Mais prováveis de estarem infectados com COH-PIAH:")
+    for posicao, (nome, grau) in enumerate(ranking[:args.top], 1):
+        print(f"{posicao:4d}. {nome}  (similaridade {grau:.4f})")
+    if ignorados:
+        print(f"\n⚠️  {len(ignorados)} textos ignorados por não poderem ser lidos:")
+        for nome, motivo in ignorados:
+            print(f"   {nome}: {motivo}")
@@ -0,0 +1,156 @@
+import argparse
+import ast
+import os
+import re
+import tempfile
+import time
+from typing import List, Tuple
+
+import numpy as np
+
+import corpus_mapeado
+import distancias
+import exportacao_assinaturas
+import LabCohPiah2
+
+# Benchmark e verificação de regressão do detector COH-PIAH.
+#
+# Os três textos de exemplo e as assinaturas que o laboratório calculou para
+# eles estão registrados no log Resultado3TextosCOH-PIAH. O benchmark repete
+# os textos (um por linha, no formato de corpus_mapeado) até formar corpora de
+# 1 MB, 100 MB e 1 GB e mede, para cada tamanho:
+#   tokenização -> separa_sentencas / separa_frases / separa_palavras
+#   assinaturas -> corpus_mapeado.assinaturas_arquivo (ContadorAssinatura)
+#   comparação  -> compara_assinatura, um par por vez, e distancias.matriz_distancias
+#   exportação  -> exportacao_assinaturas em NPY e, se pyarrow estiver
+#                  instalado, em Parquet e Arrow, relidos com carregar()
+# Cada assinatura é conferida com o valor registrado, as duas comparações
+# precisam concordar e cada formato exportado precisa devolver os mesmos
+# documentos e assinaturas; qualquer diferença interrompe o benchmark com
+# AssertionError. Os corpora gerados ficam no diretório de trabalho e são
+# reaproveitados nas execuções seguintes.
+
+LOG = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Resultado3TextosCOH-PIAH')
+TAMANHOS = ('1M', '100M', '1G')
+_UNIDADES = {'K': 1 << 10, 'M': 1 << 20, 'G': 1 << 30}
+# Par de teste registrado no log: compara_assinatura(ass1, ass2) deve dar 1.84
+_TESTE_COMPARACAO = re.compile(r'ass1 = (\[.*?\]), ass2 = (\[.*?\])\).*\n.*Esperado: ([\d.]+)')
+
+
+def amostras(log: str = LOG) -> Tuple[List[str], List[List[float]], Tuple[List[float], List[float], float]]:
+    """Textos de exemplo, assinaturas registradas e o par de teste de comparação do log"""
+    with open(log, encoding='utf-8') as f:
+        conteudo = f.read()
+    # Os textos foram digitados no console; input() não guarda o espaço do fim
+    textos = [linha.split('sair): ', 1)[1].strip() for linha in conteudo.splitlines()
+              if linha.startswith('Digite o texto') and linha.split('sair):', 1)[1].strip()]
+    assinaturas = [ast.literal_eval(linha) for linha in conteudo.splitlines() if linha.startswith('[')]
+    ass1, ass2, esperado = _TESTE_COMPARACAO.search(conteudo).groups()
+    return textos, assinaturas, (ast.literal_eval(ass1), ast.literal_eval(ass2), float(esperado))
+
+
+def tamanho_em_bytes(tamanho: str) -> int:
+    """'100M' -> 104857600"""
+    unidade = tamanho[-1].upper()
+    return int(float(tamanho[:-1]) * _UNIDADES[unidade]) if unidade in _UNIDADES else int(tamanho)
+
+
+def gerar_corpus(caminho: str, textos: List[str], tamanho: int) -> int:
+    """Gravar os textos repetidos, um por linha, até atingir o tamanho; devolve o número de documentos"""
+    ciclo = ''.join(texto + '\n' for texto in textos).encode('utf-8')
+    repeticoes = -(-tamanho // len(ciclo))
+    if not (os.path.exists(caminho) and os.path.getsize(caminho) == repeticoes * len(ciclo)):
+        bloco = ciclo * max(1, (8 << 20) // len(ciclo))
+        restantes = repeticoes
+        with open(caminho + '.tmp', 'wb') as f:
+            while restantes:
+                n = min(restantes, len(bloco) // len(ciclo))
+                f.write(bloco[:n * len(ciclo)])
+                restantes -= n
+        os.replace(caminho + '.tmp', caminho)
+    return repeticoes * len(textos)
+
+
+def _cronometrar(funcao, *args):
+    inicio = time.perf_counter()
+    resultado = funcao(*args)
+    return resultado, time.perf_counter() - inicio
+
+
+def _tokenizar(caminho: str) -> int:
+    """Tokenização do laboratório sobre cada documento; devolve o número de palavras"""
+    palavras = 0
+    with corpus_mapeado.abrir_mapeado(caminho) as mapa:
+        for inicio, fim in corpus_mapeado.intervalos_documentos(mapa, b'\n'):
+            for sentenca in LabCohPiah2.separa_sentencas(mapa[inicio:fim].decode('utf-8')):
+                for frase in LabCohPiah2.separa_frases(sentenca):
+                    palavras += len(LabCohPiah2.separa_palavras(frase))
+    return palavras
+
+
+def _comparar_pares(assinaturas: List[List[float]], ass_cp: List[float]) -> List[float]:
+    return [LabCohPiah2.compara_assinatura(assinatura, ass_cp) for assinatura in assinaturas]
+
+
+def _exportar_e_reler(assinaturas: List[List[float]], diretorio: str, tamanho: str):
+    """Exportar as assinaturas em cada formato disponível e conferir a releitura"""
+    try:
+        import pyarrow  # noqa: F401
+        destinos = ('', '.parquet', '.arrow')
+    except ImportError:
+        destinos = ('',)
+        print("  exportação       Parquet/Arrow não conferidos (pyarrow não instalado)")
+    esperadas = np.array(assinaturas, dtype=np.float64)
+    for extensao in destinos:
+        destino = os.path.join(diretorio, f'assinaturas_{tamanho}{extensao}')
+        formato = exportacao_assinaturas.formato_destino(destino)
+        total, segundos = _cronometrar(exportacao_assinaturas.exportar, destino, enumerate(assinaturas, 1))
+        documentos, relidas = exportacao_assinaturas.carregar(destino)
+        print(f"  exportação {formato:7s}{segundos:7.2f} s  {total / max(segundos, 1e-9):8.0f} documentos/s")
+        assert total == len(assinaturas), f"{formato}: Esperados {len(assinaturas)} documentos; gravados {total}"
+        assert list(documentos) == [str(i) for i in range(1, total + 1)], f"{formato}: identificadores diferentes"
+        assert np.array_equal(np.asarray(relidas), esperadas), f"{formato}: assinaturas relidas diferentes"
+
+
+def executar(tamanho: str, diretorio: str, processos: int = None):
+    """Gerar (ou reaproveitar) o corpus de um tamanho, medir as etapas e conferir os resultados"""
+    textos, registradas, (ass1, ass2, esperado) = amostras()
+    recebido = round(LabCohPiah2.compara_assinatura(ass1, ass2), 2)
+    assert recebido == esperado, f"compara_assinatura: Esperado: {esperado}; recebido: {recebido}"
+
+    caminho = os.path.join(diretorio, f'corpus_cohpiah_{tamanho}.txt')
+    n_documentos = gerar_corpus(caminho, textos, tamanho_em_bytes(tamanho))
+    megabytes = os.path.getsize(caminho) / (1 << 20)
+    print(f"\n== {tamanho}: {n_documentos} documentos, {megabytes:.1f} MB ==")
+
+    palavras, segundos = _cronometrar(_tokenizar, caminho)
+    print(f"  tokenização      {segundos:9.2f} s  {megabytes / segundos:8.1f} MB/s  ({palavras} palavras)")
+
+    assinaturas, segundos = _cronometrar(lambda: list(corpus_mapeado.assinaturas_arquivo(caminho, '\n', 'utf-8', processos)))
+    print(f"  assinaturas      {segundos:9.2f} s  {megabytes / segundos:8.1f} MB/s")
+    assert len(assinaturas) == n_documentos, f"Esperados {n_documentos} documentos; recebidos {len(assinaturas)}"
+    for i, assinatura in enumerate(assinaturas):
+        registrada = registradas[i % len(registradas)]
+        assert assinatura == registrada, f"Documento {i + 1}: Esperado: {registrada}; recebido: {assinatura}"
+
+    graus, segundos = _cronometrar(_comparar_pares, assinaturas, ass1)
+    print(f"  comparação (par) {segundos:9.2f} s  {len(graus) / segundos:8.0f} pares/s")
+    matriz, segundos = _cronometrar(distancias.matriz_distancias, assinaturas, ass1)
+    print(f"  comparação (vet) {segundos:9.2f} s  {len(graus) / max(segundos, 1e-9):8.0f} pares/s")
+    assert np.allclose(matriz[:, 0], graus), "matriz_distancias difere de compara_assinatura"
+
+    _exportar_e_reler(assinaturas, diretorio, tamanho)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark e verificação de regressão do detector COH-PIAH")
+    parser.add_argument('tamanhos', nargs='*', default=TAMANHOS, help="tamanhos dos corpora (padrão: 1M 100M 1G)")
+    parser.add_argument('--diretorio', default=os.path.join(tempfile.gettempdir(), 'benchmark_cohpiah'),
+                        help="onde gravar os corpora gerados")
+    parser.add_argument('--processos', type=int, help="processos no cálculo das assinaturas (padrão: todos os núcleos)")
+    args = parser.parse_args()
+
+    os.makedirs(args.diretorio, exist_ok=True)
+    for tamanho in args.tamanhos:
+        executar(tamanho, args.diretorio, args.processos)
+    print("\n✅ Todas as assinaturas conferem com Resultado3TextosCOH-PIAH")
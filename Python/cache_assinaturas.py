@@ -0,0 +1,202 @@
+import codecs
+import contextlib
+import hashlib
+import os
+import sqlite3
+import time
+import unicodedata
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import cohpiah
+
+# Cache persistente de assinaturas COH-PIAH por hash do conteúdo.
+#
+# Redações reenviadas não precisam ser tokenizadas de novo: a chave é o
+# SHA-256 do texto (em UTF-8), e reavaliar um texto já visto custa só o hash.
+# O hash é do texto exato, porque qualquer mudança de espaços, quebras de
+# linha ou composição Unicode muda a contagem de caracteres e, com ela, a
+# assinatura. Com normalizar=True o texto passa antes por normalizar_texto()
+# (NFC e quebras de linha '\n') e a assinatura é a do texto normalizado; assim
+# cópias que só diferem nesses detalhes compartilham a mesma entrada. Para
+# arquivos lidos em blocos, normalizar_fluxo() faz o mesmo sem juntar o texto:
+# cada bloco é normalizado até a última quebra de linha, que nunca se combina
+# com o caractere seguinte, e o resto fica para o próximo bloco.
+#
+# O cache é um banco SQLite em modo WAL, que aceita leitores e escritores de
+# vários processos ao mesmo tempo. Cada entrada guarda o instante do último
+# uso; ao passar de `limite` entradas, as usadas há mais tempo são removidas
+# (LRU). Textos sem palavras também são guardados, como assinatura None.
+#
+# VERSAO entra na chave: mudar o cálculo da assinatura invalida o cache antigo.
+
+VERSAO = 1
+LIMITE_PADRAO = 100_000
+_PREFIXO = f'cohpiah-v{VERSAO}\0'.encode()
+_CONSULTA_MAXIMA = 500  # chaves por SELECT ... IN (...)
+
+
+def normalizar_texto(texto: str) -> str:
+    """Forma NFC com quebras de linha '\\n'"""
+    return unicodedata.normalize('NFC', texto.replace('\r\n', '\n').replace('\r', '\n'))
+
+
+def normalizar_fluxo(pedacos: Iterable[str]) -> Iterator[str]:
+    """normalizar_texto() de um texto entregue em pedaços; o resultado, juntado, é o mesmo"""
+    pendente = ''
+    for pedaco in pedacos:
+        pedaco = pendente + pedaco
+        # Depois de um '\n', ou de um '\r' que não é o último (não pode ser o início de um '\r\n' cortado)
+        corte = max(pedaco.rfind('\n'), pedaco.rfind('\r', 0, len(pedaco) - 1)) + 1
+        if corte:
+            yield normalizar_texto(pedaco[:corte])
+        pendente = pedaco[corte:]
+    yield normalizar_texto(pendente)
+
+
+def chave_texto(texto: str) -> str:
+    """Chave do cache para um texto"""
+    return hashlib.sha256(_PREFIXO + texto.encode('utf-8', 'surrogatepass')).hexdigest()
+
+
+def _decodificar_blocos(arquivo, encoding: str, tamanho_bloco: int) -> Iterator[str]:
+    decodificador = codecs.getincrementaldecoder(encoding)()
+    for bloco in iter(lambda: arquivo.read(tamanho_bloco), b''):
+        yield decodificador.decode(bloco)
+    yield decodificador.decode(b'', final=True)
+
+
+def chave_binario(arquivo, encoding: str = 'utf-8', tamanho_bloco: int = cohpiah.TAMANHO_BLOCO,
+                  normalizar: bool = False) -> str:
+    """
+    Chave do cache para um arquivo aberto em modo binário, lido em blocos (a
+    mesma de chave_texto; com normalizar=True, a de chave_texto(normalizar_texto(texto)))
+    """
+    h = hashlib.sha256(_PREFIXO)
+    if codecs.lookup(encoding).name == 'utf-8' and not normalizar:
+        # Os bytes já são o texto em UTF-8: basta o hash, sem decodificar
+        for bloco in iter(lambda: arquivo.read(tamanho_bloco), b''):
+            h.update(bloco)
+    else:
+        pedacos = _decodificar_blocos(arquivo, encoding, tamanho_bloco)
+        for pedaco in normalizar_fluxo(pedacos) if normalizar else pedacos:
+            h.update(pedaco.encode('utf-8', 'surrogatepass'))
+    return h.hexdigest()
+
+
+class CacheAssinaturas:
+    """Cache de assinaturas em disco, compartilhável entre processos"""
+
+    def __init__(self, caminho: str, limite: int = LIMITE_PADRAO):
+        self.caminho = caminho
+        self.limite = limite
+        self._conexao = None
+        self._pid = None
+
+    def __getstate__(self):
+        # A conexão não passa para outro processo; cada processo abre a sua
+        return {'caminho': self.caminho, 'limite': self.limite}
+
+    def __setstate__(self, estado):
+        self.__init__(estado['caminho'], estado['limite'])
+
+    def _conectar(self) -> sqlite3.Connection:
+        """Conexão deste processo, criada na primeira chamada (e de novo após um fork)"""
+        if self._conexao is None or self._pid != os.getpid():
+            diretorio = os.path.dirname(os.path.abspath(self.caminho))
+            os.makedirs(diretorio, exist_ok=True)
+            conexao = sqlite3.connect(self.caminho, timeout=60, isolation_level=None)
+            conexao.execute('PRAGMA journal_mode=WAL')
+            conexao.execute('PRAGMA synchronous=NORMAL')
+            colunas = ', '.join(f'{traco} REAL' for traco in cohpiah.TRACOS)
+            conexao.execute(f'CREATE TABLE IF NOT EXISTS assinaturas '
+                            f'(chave TEXT PRIMARY KEY, {colunas}, uso INTEGER NOT NULL)')
+            conexao.execute('CREATE INDEX IF NOT EXISTS assinaturas_uso ON assinaturas (uso)')
+            self._conexao = conexao
+            self._pid = os.getpid()
+        return self._conexao
+
+    def __len__(self) -> int:
+        return self._conectar().execute('SELECT COUNT(*) FROM assinaturas').fetchone()[0]
+
+    def obter_varios(self, chaves: Iterable[str]) -> Dict[str, Optional[List[float]]]:
+        """Assinaturas guardadas para as chaves dadas; chaves ausentes ficam fora do dicionário"""
+        conexao = self._conectar()
+        chaves = list(dict.fromkeys(chaves))
+        encontradas = {}
+        for i in range(0, len(chaves), _CONSULTA_MAXIMA):
+            parte = chaves[i:i + _CONSULTA_MAXIMA]
+            marcadores = ', '.join('?' * len(parte))
+            for chave, *tracos in conexao.execute(
+                    f"SELECT chave, {', '.join(cohpiah.TRACOS)} FROM assinaturas "
+                    f"WHERE chave IN ({marcadores})", parte):
+                encontradas[chave] = None if tracos[0] is None else tracos
+        if encontradas:
+            agora = time.time_ns()
+            with self._transacao(conexao):
+                conexao.executemany('UPDATE assinaturas SET uso = ? WHERE chave = ?',
+                                    [(agora, chave) for chave in encontradas])
+        return encontradas
+
+    def obter(self, chave: str) -> Tuple[bool, Optional[List[float]]]:
+        """(encontrada, assinatura) para uma chave"""
+        encontradas = self.obter_varios([chave])
+        return chave in encontradas, encontradas.get(chave)
+
+    def gravar_varios(self, itens: Iterable[Tuple[str, Optional[List[float]]]]):
+        """Guardar pares (chave, assinatura) e remover as entradas menos usadas além do limite"""
+        agora = time.time_ns()
+        linhas = [(chave, *(assinatura or [None] * len(cohpiah.TRACOS)), agora) for chave, assinatura in itens]
+        if not linhas:
+            return
+        conexao = self._conectar()
+        marcadores = ', '.join('?' * (len(cohpiah.TRACOS) + 2))
+        with self._transacao(conexao):
+            conexao.executemany(f'INSERT OR REPLACE INTO assinaturas VALUES ({marcadores})', linhas)
+            excesso = conexao.execute('SELECT COUNT(*) FROM assinaturas').fetchone()[0] - self.limite
+            if excesso > 0:
+                conexao.execute('DELETE FROM assinaturas WHERE chave IN '
+                                '(SELECT chave FROM assinaturas ORDER BY uso LIMIT ?)', (excesso,))
+
+    def gravar(self, chave: str, assinatura: Optional[List[float]]):
+        """Guardar uma assinatura"""
+        self.gravar_varios([(chave, assinatura)])
+
+    @staticmethod
+    @contextlib.contextmanager
+    def _transacao(conexao: sqlite3.Connection):
+        """Transação de escrita: BEGIN IMMEDIATE pega o lock já no início e evita deadlocks entre processos"""
+        conexao.execute('BEGIN IMMEDIATE')
+        try:
+            yield
+        except BaseException:
+            conexao.execute('ROLLBACK')
+            raise
+        conexao.execute('COMMIT')
+
+    def calcula_assinatura(self, texto: str, normalizar: bool = False) -> List[float]:
+        """Como cohpiah.calcula_assinatura, consultando o cache antes de tokenizar"""
+        if normalizar:
+            texto = normalizar_texto(texto)
+        chave = chave_texto(texto)
+        encontrada, assinatura = self.obter(chave)
+        if not encontrada:
+            try:
+                assinatura = cohpiah.calcula_assinatura(texto)
+            except ZeroDivisionError:
+                assinatura = None
+            self.gravar(chave, assinatura)
+        if assinatura is None:
+            raise ZeroDivisionError("texto sem palavras")
+        return assinatura
+
+    def limpar(self):
+        """Remover todas as entradas"""
+        conexao = self._conectar()
+        with self._transacao(conexao):
+            conexao.execute('DELETE FROM assinaturas')
+
+    def fechar(self):
+        """Fechar a conexão deste processo"""
+        if self._conexao is not None and self._pid == os.getpid():
+            self._conexao.close()
+        self._conexao = None
@@ -0,0 +1,276 @@
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Optional, Tuple
+
+import tokenizador
+
+# Cálculo da assinatura COH-PIAH em uma única passada.
+#
+# calcula_assinatura() de LabCohPiah2.py monta listas de sentenças, frases e
+# palavras e percorre essas listas várias vezes. Os seis traços, porém, são
+# razões entre contagens que podem ser acumuladas enquanto o texto é lido:
+#   sentenças              = sequências de [.!?] + 1 (menos 1 se o texto termina
+#                            numa delas, como o '' final descartado por separa_sentencas)
+#   frases                 = sequências de [,:;] + número de sentenças
+#   caracteres de sentença = total de caracteres - caracteres [.!?]
+#   caracteres de frase    = caracteres de sentença - caracteres [,:;]
+#   palavras               = sequências de caracteres que não são espaço nem [.!?,:;]
+# Palavras diferentes e hapax saem de uma única tabela de frequências.
+#
+# O texto pode chegar em pedaços (arquivo, rede, gerador): o último token de
+# cada pedaço fica pendente e é completado pelo pedaço seguinte, então o
+# resultado não depende de onde os pedaços são cortados.
+#
+# Os contadores são estatísticas suficientes e podem ser combinados: trechos
+# consecutivos contados separadamente (por exemplo em processos diferentes)
+# são somados com combinar(). Para isso o primeiro token também fica pendente,
+# e na junção o último token de um trecho e o primeiro do seguinte são
+# tokenizados de novo juntos (uma palavra cortada ao meio é contada uma vez).
+#
+# Entre o primeiro e o último token de cada pedaço a contagem é feita em bloco
+# sobre os intervalos do texto (tokenizador.py): tamanhos e número de
+# separadores saem de findall/len, e só as palavras viram strings, porque a
+# tabela de frequências precisa delas.
+#
+# Um documento muito grande pode ser dividido em trechos cortados logo depois
+# de uma sequência de [.!?] e contado em vários processos
+# (calcula_assinatura(texto, processos=n)); os contadores dos trechos são
+# somados em ordem com combinar(), e os seis traços saem idênticos aos da
+# contagem serial.
+
+TRACOS = ('wal', 'ttr', 'hlr', 'sal', 'sac', 'pal')
+TAMANHO_BLOCO = 1 << 16
+_TOKEN = tokenizador.TOKEN
+_CAUDA = 256  # caracteres examinados, de trás para a frente, para achar o último token
+TAMANHO_MINIMO_TRECHO = 1 << 20  # abaixo disso, dividir o texto entre processos não compensa
+TRECHOS_POR_PROCESSO = 4
+
+
+class ContadorAssinatura:
+    """Contadores acumulados de um texto lido em pedaços"""
+
+    def __init__(self):
+        self.caracteres = 0
+        self.letras = 0
+        self.palavras = 0
+        self.separadores_sentenca = 0
+        self.caracteres_sentenca = 0
+        self.separadores_frase = 0
+        self.caracteres_frase = 0
+        self.frequencias = Counter()
+        self.termina_em_sentenca = False
+        self._cabeca = None  # primeiro token, se houver mais de um
+        self._pendente = ''  # último token
+
+    def alimentar(self, trecho: str):
+        """Processar o próximo pedaço do texto"""
+        texto = self._pendente + trecho
+        if not texto:
+            return
+        # O último token pode continuar no próximo pedaço: fica pendente
+        fim = len(texto) - _comprimento_ultimo_token(texto)
+        inicio = 0
+        if self._cabeca is None:
+            if fim == 0:
+                self._pendente = texto
+                return
+            # O primeiro token completo fica guardado para uma combinação com o trecho anterior
+            inicio = _TOKEN.match(texto).end()
+            self._cabeca = texto[:inicio]
+        self._contar_intervalo(texto, inicio, fim)
+        self._pendente = texto[fim:]
+
+    def _contar_intervalo(self, texto: str, inicio: int, fim: int):
+        """Acumular os tokens de texto[inicio:fim], um intervalo que começa e termina em limites de token"""
+        if inicio == fim:
+            return
+        palavras = tokenizador.SEQUENCIA_PALAVRA.findall(texto, inicio, fim)
+        sentencas = tokenizador.SEQUENCIA_SENTENCA.findall(texto, inicio, fim)
+        frases = tokenizador.SEQUENCIA_FRASE.findall(texto, inicio, fim)
+        self.caracteres += fim - inicio
+        self.palavras += len(palavras)
+        self.letras += sum(map(len, palavras))
+        self.frequencias.update(map(str.lower, palavras))
+        self.separadores_sentenca += len(sentencas)
+        self.caracteres_sentenca += sum(map(len, sentencas))
+        self.separadores_frase += len(frases)
+        self.caracteres_frase += sum(map(len, frases))
+        self.termina_em_sentenca = texto[fim - 1] in '.!?'
+
+    def _bordas(self) -> List[Optional[str]]:
+        """Tokens pendentes em ordem; None marca os tokens já contados entre eles"""
+        if self._cabeca is not None:
+            return [self._cabeca, None, self._pendente]
+        return [self._pendente] if self._pendente else []
+
+    def _contar_bordas(self) -> 'ContadorAssinatura':
+        """Contador novo só com os tokens pendentes"""
+        bordas = ContadorAssinatura()
+        for token in self._bordas():
+            if token is not None:
+                bordas._contar(_TOKEN.fullmatch(token))
+        return bordas
+
+    def combinar(self, outra: 'ContadorAssinatura') -> 'ContadorAssinatura':
+        """Somar a este contador o de `outra`, o trecho que vem logo depois deste; devolve self"""
+        direita = outra._bordas()
+        if not direita:
+            return self
+        esquerda = self._bordas()
+        juncao = [token.group() for token in _TOKEN.finditer((esquerda[-1] if esquerda else '') + direita[0])]
+        sequencia = esquerda[:-1] + juncao + direita[1:]
+
+        self.caracteres += outra.caracteres
+        self.letras += outra.letras
+        self.palavras += outra.palavras
+        self.separadores_sentenca += outra.separadores_sentenca
+        self.caracteres_sentenca += outra.caracteres_sentenca
+        self.separadores_frase += outra.separadores_frase
+        self.caracteres_frase += outra.caracteres_frase
+        self.frequencias.update(outra.frequencias)
+        # Os tokens entre o primeiro e o último deixam de ser bordas e são contados
+        for token in sequencia[1:-1]:
+            if token is not None:
+                self._contar(_TOKEN.fullmatch(token))
+        self._cabeca = sequencia[0] if len(sequencia) > 1 else None
+        self._pendente = sequencia[-1]
+        return self
+
+    def concluir(self):
+        """Contar os tokens pendentes; chamar depois do último pedaço"""
+        for token in self._bordas():
+            if token is not None:
+                self._contar(_TOKEN.fullmatch(token))
+        self._cabeca = None
+        self._pendente = ''
+
+    def _contar(self, token):
+        """Acumular um token nos contadores"""
+        tipo = token.lastindex
+        tamanho = token.end() - token.start()
+        self.caracteres += tamanho
+        if tipo == 1:
+            self.palavras += 1
+            self.letras += tamanho
+            self.frequencias[token.group(1).lower()] += 1
+        elif tipo == 2:
+            self.separadores_sentenca += 1
+            self.caracteres_sentenca += tamanho
+        elif tipo == 3:
+            self.separadores_frase += 1
+            self.caracteres_frase += tamanho
+        self.termina_em_sentenca = tipo == 2
+
+    def n_sentencas(self) -> int:
+        """Número de sentenças, como len(separa_sentencas(texto)), depois de concluir()"""
+        vazia_no_fim = self.caracteres == 0 or self.termina_em_sentenca
+        return self.separadores_sentenca + (0 if vazia_no_fim else 1)
+
+    def assinatura(self) -> List[float]:
+        """Os seis traços [wal, ttr, hlr, sal, sac, pal] do texto lido até aqui"""
+        # Os tokens pendentes são contados à parte: o contador continua aceitando pedaços e combinações
+        bordas = self._contar_bordas()
+        caracteres = self.caracteres + bordas.caracteres
+        palavras = self.palavras + bordas.palavras
+        termina_em_sentenca = bordas.termina_em_sentenca if bordas.caracteres else self.termina_em_sentenca
+        vazia_no_fim = caracteres == 0 or termina_em_sentenca
+        n_sentencas = self.separadores_sentenca + bordas.separadores_sentenca + (0 if vazia_no_fim else 1)
+        n_frases = self.separadores_frase + bordas.separadores_frase + n_sentencas
+        chars_sentencas = caracteres - self.caracteres_sentenca - bordas.caracteres_sentenca
+        chars_frases = chars_sentencas - self.caracteres_frase - bordas.caracteres_frase
+
+        distintas, hapax = self._distintas_e_hapax(bordas)
+
+        wal = (self.letras + bordas.letras) / palavras
+        ttr = distintas / palavras
+        hlr = hapax / palavras
+        sal = chars_sentencas / n_sentencas
+        sac = n_frases / n_sentencas
+        pal = chars_frases / n_frases
+        return [wal, ttr, hlr, sal, sac, pal]
+
+    def _distintas_e_hapax(self, bordas: 'ContadorAssinatura') -> Tuple[float, float]:
+        """Palavras diferentes e hapax do texto, somando as palavras pendentes contadas em bordas"""
+        distintas = len(self.frequencias)
+        hapax = sum(1 for n in self.frequencias.values() if n == 1)
+        for palavra, n in bordas.frequencias.items():
+            antes = self.frequencias.get(palavra, 0)
+            distintas += antes == 0
+            hapax += (antes + n == 1) - (antes == 1)
+        return distintas, hapax
+
+
+def _comprimento_ultimo_token(texto: str) -> int:
+    """Tamanho do último token: a sequência máxima da classe do último caractere, lida de trás para a frente"""
+    cauda = _CAUDA
+    while True:
+        invertido = texto[:-cauda - 1:-1]
+        comprimento = _TOKEN.match(invertido).end()
+        if comprimento < len(invertido) or cauda >= len(texto):
+            return comprimento
+        cauda *= 4
+
+
+def assinatura_fluxo(pedacos: Iterable[str]) -> List[float]:
+    """Assinatura de um texto entregue como sequência de pedaços"""
+    contador = ContadorAssinatura()
+    for pedaco in pedacos:
+        contador.alimentar(pedaco)
+    return contador.assinatura()
+
+
+def limites_trechos(texto: str, n_trechos: int) -> List[Tuple[int, int]]:
+    """
+    Intervalos [inicio, fim) de até n_trechos trechos consecutivos do texto,
+    cada um terminando logo depois de uma sequência de [.!?] (o último, no fim
+    do texto)
+    """
+    limites = []
+    inicio = 0
+    for i in range(1, n_trechos):
+        alvo = max(inicio, len(texto) * i // n_trechos)
+        separador = tokenizador.SEQUENCIA_SENTENCA.search(texto, alvo)
+        if separador is None:
+            break
+        if separador.end() < len(texto):
+            limites.append((inicio, separador.end()))
+            inicio = separador.end()
+    limites.append((inicio, len(texto)))
+    return limites
+
+
+def _contador_trecho(trecho: str, contador=ContadorAssinatura) -> ContadorAssinatura:
+    """Worker: contador de um trecho, ainda com as bordas pendentes para combinar()"""
+    contador = contador()
+    for i in range(0, len(trecho), TAMANHO_BLOCO):
+        contador.alimentar(trecho[i:i + TAMANHO_BLOCO])
+    return contador
+
+
+def calcula_assinatura(texto: str, processos: Optional[int] = 1, contador=ContadorAssinatura) -> List[float]:
+    """
+    Assinatura de um texto completo, lido em blocos de TAMANHO_BLOCO caracteres.
+    Com processos > 1 (None = todos os núcleos), um texto grande é dividido em
+    trechos contados em paralelo; o resultado é o mesmo da contagem serial.
+    contador é a classe do contador (uma subclasse de ContadorAssinatura).
+    """
+    processos = processos or os.cpu_count() or 1
+    n_trechos = min(processos * TRECHOS_POR_PROCESSO, len(texto) // TAMANHO_MINIMO_TRECHO)
+    if processos == 1 or n_trechos < 2:
+        return _contador_trecho(texto, contador).assinatura()
+
+    trechos = [texto[inicio:fim] for inicio, fim in limites_trechos(texto, n_trechos)]
+    with ProcessPoolExecutor(max_workers=min(processos, len(trechos))) as executor:
+        contadores = executor.map(_contador_trecho, trechos, [contador] * len(trechos))
+        contador = next(contadores)
+        for outro in contadores:
+            contador.combinar(outro)
+    return contador.assinatura()
+
+
+def assinatura_arquivo(caminho: str, encoding: str = 'utf-8', tamanho_bloco: int = TAMANHO_BLOCO) -> List[float]:
+    """Assinatura de um arquivo de texto lido em blocos, sem carregá-lo inteiro na memória"""
+    # newline='' preserva '\r\n' e mantém a contagem de caracteres igual à do texto original
+    with open(caminho, encoding=encoding, newline='') as f:
+        return assinatura_fluxo(iter(lambda: f.read(tamanho_bloco), ''))
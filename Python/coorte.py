@@ -0,0 +1,59 @@
+import json
+import os
+from typing import Dict, Tuple
+
+import numpy as np
+
+import instrumentos
+
+# Formato compacto de coorte
+#
+# Um diretório com dois arquivos:
+#   meta.json      -> instrumento, versão em que as respostas foram coletadas,
+#                     número de respondentes e de perguntas
+#   respostas.npy  -> matriz uint8 (n_respondentes x n_perguntas) com as
+#                     respostas brutas 1-5, sem inversão de pontuação
+#
+# Um byte por resposta: um milhão de respondentes do instrumento bipolar
+# ocupa ~46 MB e pode ser lido por fatias com memória mapeada.
+
+ARQUIVO_META = 'meta.json'
+ARQUIVO_RESPOSTAS = 'respostas.npy'
+
+
+def criar_coorte(diretorio: str, instrumento: str, n_respondentes: int, versao: str = None):
+    """Criar uma coorte vazia e devolver a matriz mapeada em memória para escrita"""
+    definicao = instrumentos.obter_versao(instrumento, versao)
+    versao = versao or instrumentos.VERSAO_ATUAL[instrumento]
+    n_perguntas = instrumentos.numero_perguntas(definicao)
+
+    os.makedirs(diretorio, exist_ok=True)
+    meta = {
+        'instrumento': instrumento,
+        'versao': versao,
+        'n_respondentes': n_respondentes,
+        'n_perguntas': n_perguntas
+    }
+    with open(os.path.join(diretorio, ARQUIVO_META), 'w', encoding='utf-8') as f:
+        json.dump(meta, f, indent=2, ensure_ascii=False)
+
+    return np.lib.format.open_memmap(os.path.join(diretorio, ARQUIVO_RESPOSTAS), mode='w+',
+                                     dtype=np.uint8, shape=(n_respondentes, n_perguntas))
+
+
+def salvar_coorte(diretorio: str, instrumento: str, respostas, versao: str = None):
+    """Gravar uma matriz de respostas brutas já em memória no formato compacto"""
+    respostas = np.asarray(respostas)
+    destino = criar_coorte(diretorio, instrumento, respostas.shape[0], versao)
+    if respostas.shape != destino.shape:
+        raise ValueError(f"Matriz com formato {respostas.shape}, esperado {destino.shape}")
+    destino[:] = respostas
+    destino.flush()
+
+
+def carregar_coorte(diretorio: str, modo: str = 'r') -> Tuple[Dict, np.ndarray]:
+    """Abrir uma coorte; as respostas são devolvidas como matriz mapeada em memória"""
+    with open(os.path.join(diretorio, ARQUIVO_META), encoding='utf-8') as f:
+        meta = json.load(f)
+    respostas = np.load(os.path.join(diretorio, ARQUIVO_RESPOSTAS), mmap_mode=modo)
+    return meta, respostas
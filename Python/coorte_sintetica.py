@@ -0,0 +1,157 @@
+import argparse
+import collections
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterator
+
+import numpy as np
+
+import coorte
+import instrumentos
+
+# Gerador de coortes sintéticas para testes de carga e de regressão.
+#
+# Modelo de traço latente (resposta graduada de Samejima):
+#   - cada respondente tem um fator geral g ~ N(0, 1) e, para cada subescala,
+#     theta_s = media_s + desvio * (sqrt(rho) * g + sqrt(1 - rho) * e_s)
+#   - cada pergunta tem discriminação a e limiares b_1 < b_2 < b_3 < b_4;
+#     P(resposta >= k + 1) = 1 / (1 + exp(-a * (theta - b_k)))
+#   - perguntas de pontuação reversa recebem a resposta invertida (6 - x),
+#     como faria um respondente real
+#
+# Cada lote usa um gerador derivado de SeedSequence(semente).spawn(), então o
+# resultado depende só da semente e do tamanho do lote, não do número de
+# processos nem da ordem em que os lotes terminam.
+#
+# Só LOTES_POR_PROCESSO lotes por processo ficam submetidos ao mesmo tempo: o
+# CSV de cada lote é gravado assim que chega a sua vez e descartado, então a
+# memória usada não cresce com o tamanho da coorte.
+
+PARAMETROS_PADRAO = {
+    'correlacao': 0.5,
+    'desvio': 1.0,
+    'discriminacao': 1.7,
+    'variacao_discriminacao': 0.3,
+    'limiares': (-1.5, -0.5, 0.5, 1.5),
+    'medias': {}
+}
+
+LOTES_POR_PROCESSO = 2
+
+
+def _parametros_itens(definicao: Dict, parametros: Dict, semente: int):
+    """Sortear discriminações e limiares por pergunta (fixos para toda a coorte)"""
+    n_perguntas = instrumentos.numero_perguntas(definicao)
+    rng = np.random.default_rng([semente, 0])
+    a = parametros['discriminacao'] * np.exp(rng.normal(0, parametros['variacao_discriminacao'], n_perguntas))
+    b = np.asarray(parametros['limiares'], dtype=np.float64) + rng.normal(0, 0.2, (n_perguntas, 1))
+    return a, np.sort(b, axis=1)
+
+
+def gerar_respostas(rng, n: int, definicao: Dict, parametros: Dict, a, b):
+    """Gerar uma matriz uint8 (n x n_perguntas) de respostas brutas 1-5"""
+    limites = instrumentos.limites_subescalas(definicao)
+    rho = parametros['correlacao']
+
+    geral = rng.standard_normal((n, 1))
+    especifico = rng.standard_normal((n, len(limites)))
+    medias = np.array([parametros['medias'].get(subescala, 0.0) for subescala, _, _ in limites])
+    theta_subescalas = medias + parametros['desvio'] * (np.sqrt(rho) * geral + np.sqrt(1 - rho) * especifico)
+
+    # Expandir o traço de cada subescala para as suas perguntas
+    tamanhos = [fim - inicio for _, inicio, fim in limites]
+    theta = np.repeat(theta_subescalas, tamanhos, axis=1)
+
+    # P(X >= k+1) para k = 1..4; a resposta é 1 + número de limiares superados
+    prob_acima = 1.0 / (1.0 + np.exp(-a[None, :, None] * (theta[:, :, None] - b[None, :, :])))
+    sorteio = rng.random((n, theta.shape[1], 1))
+    respostas = 1 + (sorteio < prob_acima).sum(axis=2)
+
+    reversa = np.array(instrumentos.mascara_reversa(definicao))
+    respostas[:, reversa] = 6 - respostas[:, reversa]
+    return respostas.astype(np.uint8)
+
+
+def _gerar_lote(instrumento: str, versao: str, parametros: Dict, semente: int,
+                semente_lote, inicio: int, fim: int, destino: str, formato: str):
+    """Worker: gerar as linhas [inicio, fim) e gravá-las no destino"""
+    definicao = instrumentos.obter_versao(instrumento, versao)
+    a, b = _parametros_itens(definicao, parametros, semente)
+    respostas = gerar_respostas(np.random.default_rng(semente_lote), fim - inicio, definicao, parametros, a, b)
+
+    if formato == 'coorte':
+        _, saida = coorte.carregar_coorte(destino, modo='r+')
+        saida[inicio:fim] = respostas
+        saida.flush()
+        return None
+
+    linhas = [','.join(map(str, linha)) for linha in respostas.tolist()]
+    return '\n'.join(linhas) + '\n'
+
+
+def _em_ordem(executor, funcao, tarefas, janela: int) -> Iterator:
+    """Resultados de funcao(*tarefa) na ordem das tarefas, com no máximo `janela` tarefas submetidas"""
+    pendentes = collections.deque()
+    for tarefa in tarefas:
+        pendentes.append(executor.submit(funcao, *tarefa))
+        if len(pendentes) >= janela:
+            yield pendentes.popleft().result()
+    while pendentes:
+        yield pendentes.popleft().result()
+
+
+def gerar_coorte(instrumento: str, n_respondentes: int, destino: str, formato: str = 'coorte',
+                 versao: str = None, semente: int = 42, tamanho_lote: int = 50000,
+                 processos: int = None, parametros: Dict = None):
+    """
+    Gerar n_respondentes sintéticos e gravar em destino, no formato compacto
+    de coorte (diretório) ou em CSV (arquivo com cabeçalho q1..qN).
+    """
+    versao = versao or instrumentos.VERSAO_ATUAL[instrumento]
+    definicao = instrumentos.obter_versao(instrumento, versao)
+    parametros = {**PARAMETROS_PADRAO, **(parametros or {})}
+
+    inicios = list(range(0, n_respondentes, tamanho_lote))
+    sementes = np.random.SeedSequence(semente).spawn(len(inicios))
+    tarefas = [(instrumento, versao, parametros, semente, sementes[i],
+                inicio, min(inicio + tamanho_lote, n_respondentes), destino, formato)
+               for i, inicio in enumerate(inicios)]
+
+    if formato == 'coorte':
+        coorte.criar_coorte(destino, instrumento, n_respondentes, versao).flush()
+
+    processos = processos or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+        resultados = _em_ordem(executor, _gerar_lote, tarefas, LOTES_POR_PROCESSO * processos)
+        if formato == 'csv':
+            n_perguntas = instrumentos.numero_perguntas(definicao)
+            with open(destino, 'w', encoding='utf-8') as f:
+                f.write(','.join(f'q{i}' for i in range(1, n_perguntas + 1)) + '\n')
+                # Gravar na ordem dos lotes para que o arquivo seja reprodutível
+                for texto in resultados:
+                    f.write(texto)
+        else:
+            for _ in resultados:
+                pass
+
+    print(f"✅ {n_respondentes} respondentes sintéticos de '{instrumento}' (v{versao}) gravados em {destino}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gerar coortes sintéticas de respostas para testes de carga")
+    parser.add_argument('instrumento', choices=instrumentos.nomes_instrumentos())
+    parser.add_argument('n', type=int, help="número de respondentes")
+    parser.add_argument('destino', help="diretório da coorte ou arquivo CSV")
+    parser.add_argument('--formato', choices=['coorte', 'csv'], default='coorte')
+    parser.add_argument('--versao', help="versão do instrumento (padrão: a atual)")
+    parser.add_argument('--semente', type=int, default=42)
+    parser.add_argument('--lote', type=int, default=50000, help="respondentes por lote")
+    parser.add_argument('--processos', type=int, help="número de processos (padrão: todos os núcleos)")
+    parser.add_argument('--correlacao', type=float, default=PARAMETROS_PADRAO['correlacao'],
+                        help="peso do fator geral entre subescalas (0-1)")
+    parser.add_argument('--desvio', type=float, default=PARAMETROS_PADRAO['desvio'],
+                        help="desvio-padrão do traço latente")
+    args = parser.parse_args()
+
+    gerar_coorte(args.instrumento, args.n, args.destino, args.formato, args.versao, args.semente,
+                 args.lote, args.processos, {'correlacao': args.correlacao, 'desvio': args.desvio})
@@ -0,0 +1,175 @@
+import argparse
+import codecs
+import collections
+import contextlib
+import itertools
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterator, List, Optional, Tuple
+
+import cohpiah
+import LabCohPiah2
+
+# Entrada de corpora grandes por memória mapeada.
+#
+# Em vez de ler cada texto com input() (le_textos), os documentos ficam num
+# único arquivo UTF-8, separados por um delimitador (uma linha por documento,
+# por padrão). O arquivo é mapeado em memória: os limites dos documentos são
+# achados com mmap.find() sobre o próprio mapeamento, e cada documento é
+# decodificado em janelas de tamanho fixo e entregue ao ContadorAssinatura.
+# Nenhum documento, nem o arquivo, é carregado inteiro na memória; o sistema
+# operacional pagina o arquivo conforme a leitura avança.
+#
+# assinaturas_arquivo() é um gerador: os intervalos são agrupados em lotes à
+# medida que são encontrados, no máximo LOTES_POR_PROCESSO lotes por processo
+# ficam em andamento e cada assinatura é entregue assim que o seu lote termina,
+# então nem a lista de intervalos nem a de assinaturas existe inteira.
+#
+# Um arquivo com '\r\n' e delimitador '\n' deixa o '\r' no fim de cada
+# documento, o que conta como um caractere a mais; use '\r\n' nesse caso.
+#
+# Um documento com bytes inválidos no encoding recebe None, como um documento
+# sem palavras, sem interromper os demais; com uma lista `ignorados`, o seu
+# número e o motivo são acrescentados a ela.
+
+DELIMITADOR_PADRAO = '\n'
+JANELA = 1 << 20  # bytes decodificados por vez
+LOTES_POR_PROCESSO = 2
+
+Motivo = Optional[str]  # por que um documento foi ignorado; None se não foi
+
+
+def intervalos_documentos(mapa, delimitador: bytes) -> Iterator[Tuple[int, int]]:
+    """Intervalos [inicio, fim) em bytes de cada documento do mapeamento"""
+    inicio = 0
+    tamanho = len(mapa)
+    while inicio < tamanho:
+        fim = mapa.find(delimitador, inicio)
+        if fim == -1:
+            fim = tamanho
+        yield inicio, fim
+        inicio = fim + len(delimitador)
+
+
+def assinatura_intervalo(mapa, inicio: int, fim: int, encoding: str = 'utf-8',
+                         janela: int = JANELA) -> List[float]:
+    """Assinatura dos bytes [inicio, fim) do mapeamento, decodificados por janelas"""
+    # O decodificador incremental guarda caracteres multibyte cortados entre janelas
+    decodificador = codecs.getincrementaldecoder(encoding)()
+    contador = cohpiah.ContadorAssinatura()
+    for posicao in range(inicio, fim, janela):
+        contador.alimentar(decodificador.decode(mapa[posicao:min(posicao + janela, fim)]))
+    contador.alimentar(decodificador.decode(b'', final=True))
+    return contador.assinatura()
+
+
+@contextlib.contextmanager
+def abrir_mapeado(caminho: str):
+    """Mapear um arquivo em memória, somente leitura (arquivo vazio dá b''), e fechar o mapeamento na saída do with"""
+    with open(caminho, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b''
+            return
+        mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    with contextlib.closing(mapa):
+        yield mapa
+
+
+def _assinatura_ou_none(mapa, inicio: int, fim: int, encoding: str) -> Tuple[Optional[List[float]], Motivo]:
+    """
+    Assinatura do documento e o motivo de ignorá-lo: (None, None) se ele não
+    tiver palavras, (None, motivo) se não puder ser decodificado
+    """
+    try:
+        return assinatura_intervalo(mapa, inicio, fim, encoding), None
+    except ZeroDivisionError:
+        return None, None
+    except UnicodeDecodeError as erro:
+        return None, f"{type(erro).__name__}: {erro}"
+
+
+def _assinaturas_intervalos(caminho: str, intervalos: List[Tuple[int, int]],
+                            encoding: str) -> List[Tuple[Optional[List[float]], Motivo]]:
+    """Worker: _assinatura_ou_none() de uma lista de documentos"""
+    with abrir_mapeado(caminho) as mapa:
+        return [_assinatura_ou_none(mapa, inicio, fim, encoding) for inicio, fim in intervalos]
+
+
+def assinaturas_arquivo(caminho: str, delimitador: str = DELIMITADOR_PADRAO, encoding: str = 'utf-8',
+                        processos: int = None, tamanho_lote: int = 256,
+                        ignorados: List[Tuple[int, str]] = None) -> Iterator[Optional[List[float]]]:
+    """
+    Gerar a assinatura de cada documento do arquivo, na ordem do arquivo. Com
+    processos diferente de 1, lotes de documentos são calculados em paralelo,
+    cada processo com o seu próprio mapeamento do arquivo. Documentos que não
+    puderam ser decodificados recebem None e vão para `ignorados`, se dada,
+    como (número do documento, motivo).
+    """
+    pares = _assinaturas_e_motivos(caminho, delimitador.encode(encoding), encoding, processos, tamanho_lote)
+    for numero, (assinatura, motivo) in enumerate(pares, 1):
+        if motivo is not None and ignorados is not None:
+            ignorados.append((numero, motivo))
+        yield assinatura
+
+
+def _assinaturas_e_motivos(caminho: str, separador: bytes, encoding: str, processos: Optional[int],
+                           tamanho_lote: int) -> Iterator[Tuple[Optional[List[float]], Motivo]]:
+    """_assinatura_ou_none() de cada documento, na ordem do arquivo"""
+    with abrir_mapeado(caminho) as mapa:
+        intervalos = intervalos_documentos(mapa, separador)
+        if processos == 1:
+            for inicio, fim in intervalos:
+                yield _assinatura_ou_none(mapa, inicio, fim, encoding)
+            return
+
+        processos = processos or os.cpu_count() or 1
+        lotes = iter(lambda: list(itertools.islice(intervalos, tamanho_lote)), [])
+        pendentes = collections.deque()
+        with ProcessPoolExecutor(max_workers=processos) as executor:
+            for lote in lotes:
+                pendentes.append(executor.submit(_assinaturas_intervalos, caminho, lote, encoding))
+                if len(pendentes) >= LOTES_POR_PROCESSO * processos:
+                    yield from pendentes.popleft().result()
+            while pendentes:
+                yield from pendentes.popleft().result()
+
+
+def avaliar_arquivo(caminho: str, ass_cp: List[float], delimitador: str = DELIMITADOR_PADRAO,
+                    encoding: str = 'utf-8', processos: int = None,
+                    ignorados: List[Tuple[int, str]] = None) -> List[Tuple[int, float]]:
+    """
+    Ranquear os documentos (numerados de 1 a n, como em avalia_textos) pelo grau
+    de similaridade com ass_cp, do mais provável de estar infectado ao menos provável.
+    Os documentos que não puderam ser decodificados vão para `ignorados`.
+    """
+    assinaturas = assinaturas_arquivo(caminho, delimitador, encoding, processos, ignorados=ignorados)
+    graus = [(numero, LabCohPiah2.compara_assinatura(assinatura, ass_cp))
+             for numero, assinatura in enumerate(assinaturas, 1) if assinatura is not None]
+    return sorted(graus, key=lambda par: par[1])
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Avaliar os documentos de um arquivo grande contra a assinatura COH-PIAH")
+    parser.add_argument('arquivo', help="arquivo UTF-8 com os documentos")
+    parser.add_argument('--delimitador', default='\\n',
+                        help="separador de documentos, aceita escapes como \\n ou \\x1e (padrão: \\n)")
+    parser.add_argument('--assinatura', type=float, nargs=6, metavar=cohpiah.TRACOS,
+                        help="assinatura do aluno infectado (padrão: perguntar no console)")
+    parser.add_argument('--top', type=int, default=10, help="quantos documentos mostrar")
+    parser.add_argument('--processos', type=int, help="número de processos (padrão: todos os núcleos)")
+    parser.add_argument('--encoding', default='utf-8')
+    args = parser.parse_args()
+
+    delimitador = codecs.decode(args.delimitador, 'unicode_escape')
+    ass_cp = args.assinatura or LabCohPiah2.le_assinatura()
+    ignorados = []
+    ranking = avaliar_arquivo(args.arquivo, ass_cp, delimitador, args.encoding, args.processos, ignorados)
+
+    print(f"{len(ranking)} documentos avaliados. Mais prováveis de estarem infectados com COH-PIAH:")
+    for posicao, (numero, grau) in enumerate(ranking[:args.top], 1):
+        print(f"{posicao:4d}. documento {numero}  (similaridade {grau:.4f})")
+    if ignorados:
+        print(f"\n⚠️  {len(ignorados)} documentos ignorados por não poderem ser decodificados:")
+        for numero, motivo in ignorados:
+            print(f"   documento {numero}: {motivo}")
@@ -0,0 +1,89 @@
+from typing import Sequence
+
+import numpy as np
+
+import cohpiah
+
+# Comparação vetorizada de assinaturas COH-PIAH.
+#
+# compara_assinatura() compara um par de assinaturas por vez. Aqui uma matriz
+# (n_textos x 6) é comparada com uma matriz (m_referencias x 6) numa única
+# chamada, com a mesma métrica: a média das diferenças absolutas traço a
+# traço. O laço é feito sobre os seis traços, não sobre os pares, então a
+# memória usada é a da própria matriz de saída (n x m).
+#
+# Opções:
+#   pesos        -> peso de cada traço; o grau vira sum(w * |a - b|) / sum(w)
+#   normalizacao -> 'desvio' ou 'amplitude': divide cada traço pelo desvio-padrão
+#                   ou pela amplitude observados nas duas matrizes juntas, para
+#                   que traços em escalas grandes (sal, pal) não dominem o grau
+
+NORMALIZACOES = ('desvio', 'amplitude')
+LINHAS_POR_BLOCO = 1 << 15  # elementos (linhas x referências) por bloco de cálculo
+
+
+def _como_matriz(assinaturas, nome: str) -> np.ndarray:
+    """Converter para matriz float64 (k x 6), aceitando uma única assinatura"""
+    matriz = np.atleast_2d(np.asarray(assinaturas, dtype=np.float64))
+    if matriz.ndim != 2 or matriz.shape[1] != len(cohpiah.TRACOS):
+        raise ValueError(f"{nome}: esperada matriz com {len(cohpiah.TRACOS)} colunas, recebida {matriz.shape}")
+    return matriz
+
+
+def escalas_tracos(assinaturas, referencias, normalizacao: str) -> np.ndarray:
+    """Divisor de cada traço para a normalização pedida (1 onde o traço é constante)"""
+    if normalizacao not in NORMALIZACOES:
+        raise ValueError(f"Normalização desconhecida: {normalizacao} (use {', '.join(NORMALIZACOES)})")
+    todas = np.vstack([_como_matriz(assinaturas, 'assinaturas'), _como_matriz(referencias, 'referencias')])
+    if normalizacao == 'desvio':
+        escalas = todas.std(axis=0)
+    else:
+        escalas = todas.max(axis=0) - todas.min(axis=0)
+    escalas[escalas == 0] = 1.0
+    return escalas
+
+
+def matriz_distancias(assinaturas, referencias, pesos: Sequence[float] = None,
+                      normalizacao: str = None, escalas: Sequence[float] = None) -> np.ndarray:
+    """
+    Grau de similaridade (menor = mais parecido) entre cada linha de
+    assinaturas (n x 6) e cada linha de referencias (m x 6). Devolve n x m.
+    escalas, se dado, substitui o divisor calculado pela normalização.
+    """
+    a = _como_matriz(assinaturas, 'assinaturas')
+    b = _como_matriz(referencias, 'referencias')
+
+    w = np.ones(len(cohpiah.TRACOS)) if pesos is None else np.asarray(pesos, dtype=np.float64)
+    if w.shape != (len(cohpiah.TRACOS),) or (w < 0).any() or w.sum() == 0:
+        raise ValueError(f"pesos: esperados {len(cohpiah.TRACOS)} valores não negativos com soma positiva")
+
+    if escalas is None and normalizacao is not None:
+        escalas = escalas_tracos(a, b, normalizacao)
+    if escalas is not None:
+        w = w / np.asarray(escalas, dtype=np.float64)
+
+    # Blocos de linhas para que o bloco de saída e o temporário caibam no cache
+    distancias = np.zeros((a.shape[0], b.shape[0]))
+    linhas = max(1, LINHAS_POR_BLOCO // max(1, b.shape[0]))
+    temporario = np.empty((min(linhas, a.shape[0]), b.shape[0]))
+    for inicio in range(0, a.shape[0], linhas):
+        bloco = distancias[inicio:inicio + linhas]
+        tmp = temporario[:bloco.shape[0]]
+        for k in np.flatnonzero(w):
+            np.subtract(a[inicio:inicio + linhas, k, None], b[None, :, k], out=tmp)
+            np.abs(tmp, out=tmp)
+            tmp *= w[k]
+            bloco += tmp
+    # Com pesos unitários e sem normalização, o mesmo valor de compara_assinatura
+    distancias /= len(cohpiah.TRACOS) if pesos is None else np.sum(pesos)
+    return distancias
+
+
+def mais_proximos(assinaturas, referencias, k: int = 1, **opcoes):
+    """Índices e graus das k referências mais próximas de cada assinatura (n x k)"""
+    distancias = matriz_distancias(assinaturas, referencias, **opcoes)
+    k = min(k, distancias.shape[1])
+    indices = np.argpartition(distancias, k - 1, axis=1)[:, :k]
+    graus = np.take_along_axis(distancias, indices, axis=1)
+    ordem = np.argsort(graus, axis=1, kind='stable')
+    return np.take_along_axis(indices, ordem, axis=1), np.take_along_axis(graus, ordem, axis=1)
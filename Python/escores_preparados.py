@@ -0,0 +1,76 @@
+import functools
+import types
+from typing import Callable, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+
+@functools.lru_cache(maxsize=None)
+def angulos_radar(n_eixos: int) -> Tuple[float, ...]:
+    """Ângulos de um gráfico radar com n eixos, já com o polígono fechado"""
+    angulos = np.linspace(0, 2 * np.pi, n_eixos, endpoint=False).tolist()
+    return tuple(angulos + angulos[:1])
+
+
+class EscoresPreparados:
+    """
+    Pontuações de um relatório preparadas uma única vez para todos os painéis.
+
+    Guarda a ordem das subescalas, os valores, os rótulos, a faixa de risco de
+    cada subescala (e da pontuação geral), a matriz usada nos mapas de calor,
+    as categorias e cores das barras e a ordem decrescente das pontuações.
+    Os painéis consomem este objeto em vez de filtrar o dicionário de novo.
+    Tudo o que ele expõe é somente leitura (tuplas, vetores NumPy e mapeamento),
+    para que um painel não altere o que os seguintes vão ler.
+    """
+
+    __slots__ = ('geral', 'subescalas', 'valores', 'rotulos', 'rotulos_quebrados',
+                 'faixas', 'faixa_geral', 'matriz_faixas', 'categorias', 'cores',
+                 'cores_categorias', 'ordem', '_radares')
+
+    def __init__(self, pontuacoes: Dict[str, float], chave_geral: str,
+                 limites_faixas: Sequence[float], limites_geral: Sequence[float] = None,
+                 categorizar: Callable[[str], str] = None, cores_categorias: Dict[str, str] = None):
+        self.geral = pontuacoes[chave_geral]
+        self.subescalas = tuple(k for k in pontuacoes if k != chave_geral)
+        self.valores = tuple(pontuacoes[k] for k in self.subescalas)
+        self.rotulos = tuple(s.replace('_', ' ') for s in self.subescalas)
+        self.rotulos_quebrados = tuple(s.replace('_', '\n') for s in self.subescalas)
+
+        # Faixa = número de limites atingidos (abaixo do primeiro limite -> 0)
+        self.faixas = np.searchsorted(limites_faixas, self.valores, side='right')
+        self.matriz_faixas = (np.arange(len(limites_faixas) + 1) <= self.faixas[:, None]).astype(int)
+        self.faixas.flags.writeable = False
+        self.matriz_faixas.flags.writeable = False
+        limites_geral = limites_faixas if limites_geral is None else limites_geral
+        self.faixa_geral = int(np.searchsorted(limites_geral, self.geral, side='right'))
+
+        self.cores_categorias = types.MappingProxyType(dict(cores_categorias or {}))
+        if categorizar is not None:
+            self.categorias = tuple(categorizar(s) for s in self.subescalas)
+            self.cores = tuple(self.cores_categorias[c] for c in self.categorias)
+        else:
+            self.categorias = ()
+            self.cores = ()
+
+        # sorted() é estável: empates mantêm a ordem original, como antes
+        self.ordem = tuple(sorted(range(len(self.valores)), key=lambda i: self.valores[i], reverse=True))
+        self._radares = {}
+
+    def maiores(self, k: int) -> List[Tuple[str, float]]:
+        """As k subescalas de maior pontuação, em ordem decrescente"""
+        return [(self.subescalas[i], self.valores[i]) for i in self.ordem[:k]]
+
+    def radar(self, chaves: Sequence[str] = None):
+        """
+        Valores fechados, ângulos e rótulos do radar para as subescalas dadas
+        (todas, por padrão). O resultado fica guardado para chamadas seguintes.
+        """
+        chaves = self.subescalas if chaves is None else tuple(chaves)
+        if chaves not in self._radares:
+            indice = {s: i for i, s in enumerate(self.subescalas)}
+            valores = tuple(self.valores[indice[k]] for k in chaves)
+            self._radares[chaves] = (valores + valores[:1],
+                                     angulos_radar(len(chaves)),
+                                     tuple(s.replace('_', '\n') for s in chaves))
+        return self._radares[chaves]
@@ -0,0 +1,193 @@
+import argparse
+import codecs
+import itertools
+import json
+import os
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+import avaliacao_corpus
+import cache_assinaturas
+import cohpiah
+import corpus_mapeado
+
+# Exportação das assinaturas de um corpus em formato colunar.
+#
+# Em vez de assinaturas impressas no console (como em Resultado3TextosCOH-PIAH),
+# as assinaturas de um corpus inteiro são gravadas de uma vez, com o
+# identificador de cada documento, num formato que as análises seguintes
+# (agrupamento, atribuição de autoria) abrem por memória mapeada:
+#   destino.parquet          -> Parquet (requer pyarrow)
+#   destino.arrow / .feather -> Arrow IPC (requer pyarrow)
+#   destino/ (sem extensão)  -> diretório com assinaturas.npy (n x 6, float64)
+#                               e documentos.npy (identificadores) + indice.json
+# Todas as variantes têm a coluna 'documento' e uma coluna por traço
+# (cohpiah.TRACOS). Documentos sem palavras ficam com NaN nos traços.
+#
+# Parquet e Arrow são gravados em lotes de LINHAS_POR_LOTE, sem montar a
+# tabela inteira na memória. No NPY o cabeçalho precisa do número de linhas
+# (e da largura dos identificadores) antes dos dados: os lotes vão primeiro
+# para dois arquivos temporários (valores brutos e um identificador JSON por
+# linha), e os .npy são escritos no fim, copiando esses arquivos em blocos.
+
+LINHAS_POR_LOTE = 1 << 16
+ARQUIVO_ASSINATURAS = 'assinaturas.npy'
+ARQUIVO_DOCUMENTOS = 'documentos.npy'
+ARQUIVO_INDICE = 'indice.json'
+
+
+def formato_destino(destino: str) -> str:
+    """'parquet', 'arrow' ou 'npy', pela extensão do destino"""
+    extensao = os.path.splitext(destino)[1].lower()
+    if extensao == '.parquet':
+        return 'parquet'
+    if extensao in ('.arrow', '.feather'):
+        return 'arrow'
+    if extensao:
+        raise ValueError(f"Extensão desconhecida: {extensao} (use .parquet, .arrow ou um diretório)")
+    return 'npy'
+
+
+def _lotes(linhas: Iterable[Tuple[str, Optional[List[float]]]]):
+    """Agrupar (documento, assinatura) em lotes: (lista de documentos, matriz k x 6)"""
+    documentos = []
+    valores = []
+    for documento, assinatura in linhas:
+        documentos.append(str(documento))
+        valores.append(assinatura if assinatura is not None else [np.nan] * len(cohpiah.TRACOS))
+        if len(documentos) == LINHAS_POR_LOTE:
+            yield documentos, np.array(valores, dtype=np.float64)
+            documentos, valores = [], []
+    if documentos:
+        yield documentos, np.array(valores, dtype=np.float64)
+
+
+def _tabela_arrow(documentos: List[str], valores: np.ndarray):
+    import pyarrow as pa
+
+    colunas = [pa.array(documentos, type=pa.string())] + [pa.array(valores[:, i]) for i in range(valores.shape[1])]
+    return pa.Table.from_arrays(colunas, names=['documento', *cohpiah.TRACOS])
+
+
+def _gravar_npy(caminho: str, dtype, forma: Tuple[int, ...], blocos: Iterable[bytes]):
+    """Gravar um .npy a partir do cabeçalho e dos bytes dos dados, bloco a bloco"""
+    with open(caminho + '.tmp', 'wb') as f:
+        np.lib.format.write_array_header_1_0(f, {'descr': np.lib.format.dtype_to_descr(np.dtype(dtype)),
+                                                 'fortran_order': False, 'shape': forma})
+        for bloco in blocos:
+            f.write(bloco)
+    os.replace(caminho + '.tmp', caminho)
+
+
+def _blocos_documentos(f, dtype) -> Iterable[bytes]:
+    """Identificadores de um arquivo JSON-por-linha, como bytes de arrays de largura fixa"""
+    while True:
+        lote = [json.loads(linha) for linha in itertools.islice(f, LINHAS_POR_LOTE)]
+        if not lote:
+            return
+        yield np.array(lote, dtype=dtype).tobytes()
+
+
+def _exportar_npy(destino: str, linhas: Iterable[Tuple[str, Optional[List[float]]]]) -> int:
+    os.makedirs(destino, exist_ok=True)
+    caminho_valores = os.path.join(destino, ARQUIVO_ASSINATURAS)
+    caminho_documentos = os.path.join(destino, ARQUIVO_DOCUMENTOS)
+    total = 0
+    largura = 1
+    try:
+        with open(caminho_valores + '.bruto', 'wb') as valores, \
+                open(caminho_documentos + '.jsonl', 'w', encoding='utf-8') as documentos:
+            for lote_documentos, lote_valores in _lotes(linhas):
+                valores.write(lote_valores.tobytes())
+                documentos.writelines(json.dumps(d, ensure_ascii=False) + '\n' for d in lote_documentos)
+                largura = max(largura, *map(len, lote_documentos))
+                total += len(lote_documentos)
+
+        with open(caminho_valores + '.bruto', 'rb') as valores:
+            _gravar_npy(caminho_valores, np.float64, (total, len(cohpiah.TRACOS)),
+                        iter(lambda: valores.read(1 << 24), b''))
+        # Identificadores em largura fixa (dtype '<U'), também abertos com mmap_mode
+        dtype_documentos = np.dtype(f'U{largura}')
+        with open(caminho_documentos + '.jsonl', encoding='utf-8') as documentos:
+            _gravar_npy(caminho_documentos, dtype_documentos, (total,), _blocos_documentos(documentos, dtype_documentos))
+    finally:
+        for temporario in (caminho_valores + '.bruto', caminho_documentos + '.jsonl'):
+            if os.path.exists(temporario):
+                os.remove(temporario)
+
+    with open(os.path.join(destino, ARQUIVO_INDICE), 'w', encoding='utf-8') as f:
+        json.dump({'tracos': list(cohpiah.TRACOS), 'documentos': total}, f)
+    return total
+
+
+def exportar(destino: str, linhas: Iterable[Tuple[str, Optional[List[float]]]]) -> int:
+    """Gravar pares (documento, assinatura) no destino; devolve o número de documentos"""
+    formato = formato_destino(destino)
+    if formato == 'npy':
+        return _exportar_npy(destino, linhas)
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    # O esquema é fixo: o gravador é aberto antes do primeiro lote (um corpus vazio dá um arquivo sem linhas)
+    esquema = _tabela_arrow([], np.empty((0, len(cohpiah.TRACOS)))).schema
+    total = 0
+    with (pq.ParquetWriter(destino, esquema) if formato == 'parquet' else pa.ipc.new_file(destino, esquema)) as gravador:
+        for lote_documentos, lote_valores in _lotes(linhas):
+            gravador.write_table(_tabela_arrow(lote_documentos, lote_valores))
+            total += len(lote_documentos)
+    return total
+
+
+def carregar(origem: str) -> Tuple[np.ndarray, np.ndarray]:
+    """(documentos, assinaturas n x 6) de um arquivo gravado por exportar(), mapeados em memória quando possível"""
+    formato = formato_destino(origem)
+    if formato == 'npy':
+        documentos = np.load(os.path.join(origem, ARQUIVO_DOCUMENTOS), mmap_mode='r')
+        assinaturas = np.load(os.path.join(origem, ARQUIVO_ASSINATURAS), mmap_mode='r')
+        return documentos, assinaturas
+
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    if formato == 'parquet':
+        tabela = pq.read_table(origem, memory_map=True)
+    else:
+        tabela = pa.ipc.open_file(pa.memory_map(origem)).read_all()
+    documentos = tabela.column('documento').to_numpy(zero_copy_only=False)
+    assinaturas = np.column_stack([tabela.column(traco).to_numpy() for traco in cohpiah.TRACOS])
+    return documentos, assinaturas
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Calcular as assinaturas de um corpus e gravá-las em formato colunar")
+    parser.add_argument('origem', help="diretório, .zip/.tar com os textos, ou arquivo único com --delimitador")
+    parser.add_argument('destino', help="arquivo .parquet ou .arrow (requerem pyarrow), ou diretório para NPY")
+    parser.add_argument('--delimitador', help="origem é um arquivo com vários documentos separados por este "
+                                              "delimitador (aceita escapes como \\n); o identificador é o número do documento")
+    parser.add_argument('--extensao', default=avaliacao_corpus.EXTENSAO_PADRAO)
+    parser.add_argument('--processos', type=int, help="número de processos (padrão: todos os núcleos)")
+    parser.add_argument('--encoding', default='utf-8')
+    parser.add_argument('--cache', help="banco SQLite do cache de assinaturas")
+    parser.add_argument('--normalizar', action='store_true',
+                        help="normalizar quebras de linha e Unicode (NFC) dos textos de um diretório ou .zip/.tar")
+    args = parser.parse_args()
+
+    ignorados = []
+    if args.delimitador is not None:
+        delimitador = codecs.decode(args.delimitador, 'unicode_escape')
+        assinaturas = corpus_mapeado.assinaturas_arquivo(args.origem, delimitador, args.encoding, args.processos,
+                                                         ignorados=ignorados)
+        linhas = enumerate(assinaturas, 1)
+    else:
+        cache = cache_assinaturas.CacheAssinaturas(args.cache) if args.cache else None
+        linhas = avaliacao_corpus.calcular_assinaturas(args.origem, args.extensao, args.processos,
+                                                       encoding=args.encoding, cache=cache, ignorados=ignorados,
+                                                       normalizar=args.normalizar)
+    total = exportar(args.destino, linhas)
+    print(f"✅ {total} assinaturas gravadas em {args.destino}")
+    if ignorados:
+        print(f"⚠️  {len(ignorados)} textos ignorados por não poderem ser lidos:")
+        for nome, motivo in ignorados:
+            print(f"   {nome}: {motivo}")
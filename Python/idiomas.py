@@ -0,0 +1,82 @@
+import functools
+import json
+import os
+from typing import Dict, List, Tuple
+
+# Pacotes de idioma dos instrumentos.
+#
+# A definição de um instrumento (subescalas, padrão de pontuação, pesos) existe
+# uma única vez em instrumentos.py, com chaves canônicas. Tudo o que muda de um
+# idioma para outro fica em idiomas/<instrumento>.<idioma>.json:
+#   chaves      -> chave canônica -> chave localizada (ex.: Overall_Risk -> Risco_Geral)
+#   subescalas  -> por chave canônica: descrição e texto das perguntas, na
+#                  mesma ordem do padrão de pontuação
+#   interface   -> textos da ferramenta interativa (menus, avisos, rótulos dos
+#                  gráficos, recomendações, recursos de crise e campos do JSON
+#                  gravado), usados por triagem_bipolar.py
+#
+# Cada pacote é lido somente quando um idioma é pedido e fica em cache no
+# processo; um serviço que pontua em vários idiomas mantém uma única definição
+# do instrumento e só os textos de cada idioma usado.
+
+DIRETORIO_IDIOMAS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'idiomas')
+
+
+@functools.lru_cache(maxsize=None)
+def carregar_pacote(instrumento: str, idioma: str) -> Dict:
+    """Ler o pacote de idioma de um instrumento (uma vez por processo)"""
+    caminho = os.path.join(DIRETORIO_IDIOMAS, f'{instrumento}.{idioma}.json')
+    if not os.path.exists(caminho):
+        raise KeyError(f"Idioma '{idioma}' não disponível para o instrumento {instrumento}")
+    with open(caminho, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def chaves(instrumento: str, idioma: str) -> Dict[str, str]:
+    """Mapeamento chave canônica -> chave localizada"""
+    return carregar_pacote(instrumento, idioma)['chaves']
+
+
+def localizar(pontuacoes: Dict[str, float], instrumento: str, idioma: str) -> Dict[str, float]:
+    """Renomear as chaves canônicas de um dicionário de pontuações para o idioma"""
+    mapa = chaves(instrumento, idioma)
+    return {mapa.get(k, k): v for k, v in pontuacoes.items()}
+
+
+def canonizar(pontuacoes: Dict[str, float], instrumento: str, idioma: str) -> Dict[str, float]:
+    """Renomear chaves localizadas de volta para as chaves canônicas"""
+    inverso = {v: k for k, v in chaves(instrumento, idioma).items()}
+    return {inverso.get(k, k): v for k, v in pontuacoes.items()}
+
+
+def descricoes(instrumento: str, idioma: str) -> Dict[str, str]:
+    """Descrição de cada subescala, indexada pela chave localizada"""
+    pacote = carregar_pacote(instrumento, idioma)
+    return {pacote['chaves'][s]: dados['descricao'] for s, dados in pacote['subescalas'].items()}
+
+
+def interface(instrumento: str, idioma: str) -> Dict:
+    """Textos da ferramenta interativa do instrumento no idioma"""
+    pacote = carregar_pacote(instrumento, idioma)
+    if 'interface' not in pacote:
+        raise KeyError(f"O pacote '{idioma}' do instrumento {instrumento} não tem textos de interface")
+    return pacote['interface']
+
+
+def perguntas(instrumento: str, idioma: str, versao: str = None) -> Dict[str, List[Tuple[str, str]]]:
+    """
+    Perguntas de cada subescala (chave localizada) como pares (texto, tipo),
+    com tipo 'D' (direta) ou 'R' (reversa) vindo da definição da versão.
+    """
+    import instrumentos
+
+    pacote = carregar_pacote(instrumento, idioma)
+    definicao = instrumentos.obter_versao(instrumento, versao)
+    resultado = {}
+    for subescala, padrao in definicao['subescalas'].items():
+        textos = pacote['subescalas'][subescala]['perguntas']
+        if len(textos) != len(padrao):
+            raise ValueError(f"O pacote '{idioma}' tem {len(textos)} perguntas para {subescala}; "
+                             f"a versão espera {len(padrao)}")
+        resultado[pacote['chaves'][subescala]] = list(zip(textos, padrao))
+    return resultado
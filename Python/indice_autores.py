@@ -0,0 +1,220 @@
+import argparse
+import json
+import os
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+import cohpiah
+
+# Índice persistente de assinaturas de autores conhecidos.
+#
+# A consulta devolve os k autores cuja assinatura tem o menor grau de
+# similaridade com a de um texto (o mesmo grau de compara_assinatura: média
+# das diferenças absolutas, ou seja, distância L1 / 6), usando árvores KD
+# (scipy.spatial.cKDTree com p=1).
+#
+# Árvores KD são estáticas; para aceitar autores novos sem reconstruir tudo,
+# o índice usa o método logarítmico (Bentley-Saxe):
+#   - autores novos entram num buffer pequeno, consultado por força bruta;
+#   - quando o buffer enche, os autores indexados são cobertos por blocos de
+#     tamanho TAMANHO_BUFFER * 2^i (a decomposição binária do total), cada
+#     um com a sua árvore; só os blocos que mudaram são reconstruídos.
+# Uma consulta visita O(log n) árvores, cada uma em tempo sublinear.
+#
+# Trocar a assinatura de um autor já indexado (substituir) marca o bloco que
+# a contém; a árvore desse bloco é reconstruída uma vez, na próxima consulta.
+#
+# No disco o índice é um diretório com as assinaturas (assinaturas.npy) e os
+# autores e metadados (autores.json); as árvores são reconstruídas ao carregar.
+# autores.json também guarda sem_assinatura: arquivos já lidos de autores que
+# ainda não têm assinatura (nenhum texto com palavras), para que não sejam
+# lidos de novo.
+
+ARQUIVO_ASSINATURAS = 'assinaturas.npy'
+ARQUIVO_AUTORES = 'autores.json'
+TAMANHO_BUFFER = 256
+
+
+def _blocos(n_indexados: int) -> List[Tuple[int, int]]:
+    """Intervalos [inicio, fim) dos blocos para n_indexados autores, do maior para o menor"""
+    blocos = []
+    inicio = 0
+    unidades = n_indexados // TAMANHO_BUFFER
+    for bit in reversed(range(unidades.bit_length())):
+        if unidades & (1 << bit):
+            fim = inicio + TAMANHO_BUFFER * (1 << bit)
+            blocos.append((inicio, fim))
+            inicio = fim
+    return blocos
+
+
+class IndiceAutores:
+    """Índice de vizinhos mais próximos sobre assinaturas de autores"""
+
+    def __init__(self):
+        self.autores = []
+        self.metadados = []
+        self.sem_assinatura = {}  # autor -> arquivos lidos, de autores ainda sem assinatura
+        self._posicoes = {}
+        self._assinaturas = np.empty((TAMANHO_BUFFER, len(cohpiah.TRACOS)))
+        self._arvores = {}
+        self._blocos_alterados = set()
+
+    def __len__(self) -> int:
+        return len(self.autores)
+
+    def __contains__(self, autor: str) -> bool:
+        return autor in self._posicoes
+
+    @property
+    def assinaturas(self) -> np.ndarray:
+        """Matriz (n_autores x 6) das assinaturas, na ordem de inserção"""
+        return self._assinaturas[:len(self.autores)]
+
+    @staticmethod
+    def _vetor(assinatura) -> np.ndarray:
+        vetor = np.asarray(assinatura, dtype=np.float64)
+        if vetor.shape != (len(cohpiah.TRACOS),):
+            raise ValueError(f"Assinatura deve ter {len(cohpiah.TRACOS)} traços, recebida {vetor.shape}")
+        return vetor
+
+    def adicionar(self, autor: str, assinatura, metadados: Dict = None):
+        """Adicionar um autor com a sua assinatura e metadados opcionais"""
+        if autor in self._posicoes:
+            raise ValueError(f"Autor já indexado: {autor}")
+        vetor = self._vetor(assinatura)
+
+        n = len(self.autores)
+        if n == self._assinaturas.shape[0]:
+            # Capacidade dobra: inserções em tempo amortizado constante
+            maior = np.empty((2 * n, len(cohpiah.TRACOS)))
+            maior[:n] = self._assinaturas
+            self._assinaturas = maior
+        self._assinaturas[n] = vetor
+        self._posicoes[autor] = n
+        self.autores.append(autor)
+        self.metadados.append(metadados or {})
+
+        if (n + 1) % TAMANHO_BUFFER == 0:
+            self._reorganizar()
+
+    def substituir(self, autor: str, assinatura, metadados: Dict = None):
+        """Trocar a assinatura de um autor já indexado (e os metadados, se dados)"""
+        if autor not in self._posicoes:
+            raise KeyError(f"Autor não indexado: {autor}")
+        posicao = self._posicoes[autor]
+        self._assinaturas[posicao] = self._vetor(assinatura)
+        if metadados is not None:
+            self.metadados[posicao] = metadados
+        for inicio, fim in self._arvores:
+            if inicio <= posicao < fim:
+                self._blocos_alterados.add((inicio, fim))
+
+    def metadados_autor(self, autor: str) -> Dict:
+        """Metadados de um autor indexado"""
+        return self.metadados[self._posicoes[autor]]
+
+    def assinatura_autor(self, autor: str) -> np.ndarray:
+        """Assinatura de um autor indexado"""
+        return self._assinaturas[self._posicoes[autor]].copy()
+
+    def _reorganizar(self):
+        """Construir as árvores dos blocos novos e descartar as dos blocos fundidos"""
+        from scipy.spatial import cKDTree
+
+        arvores = {}
+        for inicio, fim in _blocos(len(self.autores)):
+            arvore = None if (inicio, fim) in self._blocos_alterados else self._arvores.get((inicio, fim))
+            # copy_data: as linhas do bloco podem ser trocadas depois por substituir()
+            arvores[(inicio, fim)] = arvore if arvore is not None else cKDTree(self._assinaturas[inicio:fim], copy_data=True)
+        self._arvores = arvores
+        self._blocos_alterados = set()
+
+    def vizinhos(self, assinatura, k: int = 5) -> List[Tuple[str, float, Dict]]:
+        """Os k autores mais próximos: (autor, grau de similaridade, metadados), do mais próximo ao menos"""
+        x = self._vetor(assinatura)
+        if not self.autores or k < 1:
+            return []
+        if self._blocos_alterados:
+            self._reorganizar()
+
+        distancias = []
+        posicoes = []
+        for (inicio, fim), arvore in self._arvores.items():
+            d, i = arvore.query(x, k=min(k, fim - inicio), p=1)
+            distancias.append(np.atleast_1d(d))
+            posicoes.append(np.atleast_1d(i) + inicio)
+
+        # Buffer: autores ainda fora das árvores, comparados por força bruta
+        indexados = max((fim for _, fim in self._arvores), default=0)
+        buffer = self.assinaturas[indexados:]
+        if len(buffer):
+            distancias.append(np.abs(buffer - x).sum(axis=1))
+            posicoes.append(np.arange(indexados, len(self.autores)))
+
+        distancias = np.concatenate(distancias)
+        posicoes = np.concatenate(posicoes)
+        ordem = np.lexsort((posicoes, distancias))[:k]
+        return [(self.autores[p], d / len(cohpiah.TRACOS), self.metadados[p])
+                for p, d in zip(posicoes[ordem], distancias[ordem])]
+
+    def salvar(self, diretorio: str):
+        """Gravar o índice num diretório (arquivos temporários + rename)"""
+        os.makedirs(diretorio, exist_ok=True)
+        caminho = os.path.join(diretorio, ARQUIVO_ASSINATURAS)
+        with open(caminho + '.tmp', 'wb') as f:
+            np.save(f, self.assinaturas)
+        os.replace(caminho + '.tmp', caminho)
+
+        caminho = os.path.join(diretorio, ARQUIVO_AUTORES)
+        with open(caminho + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump({'autores': self.autores, 'metadados': self.metadados,
+                       'sem_assinatura': self.sem_assinatura}, f, ensure_ascii=False)
+        os.replace(caminho + '.tmp', caminho)
+
+    @classmethod
+    def carregar(cls, diretorio: str) -> 'IndiceAutores':
+        """Abrir um índice gravado por salvar(); um diretório inexistente dá um índice vazio"""
+        indice = cls()
+        caminho = os.path.join(diretorio, ARQUIVO_AUTORES)
+        if not os.path.exists(caminho):
+            return indice
+        with open(caminho, encoding='utf-8') as f:
+            dados = json.load(f)
+        assinaturas = np.load(os.path.join(diretorio, ARQUIVO_ASSINATURAS))
+        if len(assinaturas) != len(dados['autores']):
+            raise ValueError(f"{diretorio}: {len(assinaturas)} assinaturas para {len(dados['autores'])} autores")
+
+        indice._assinaturas = np.empty((max(TAMANHO_BUFFER, 2 * len(assinaturas)), len(cohpiah.TRACOS)))
+        indice._assinaturas[:len(assinaturas)] = assinaturas
+        indice.autores = dados['autores']
+        indice.metadados = dados['metadados']
+        indice.sem_assinatura = dados.get('sem_assinatura', {})
+        indice._posicoes = {autor: i for i, autor in enumerate(indice.autores)}
+        if len(indice.autores) >= TAMANHO_BUFFER:
+            indice._reorganizar()
+        return indice
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Índice de assinaturas de autores conhecidos")
+    parser.add_argument('indice', help="diretório do índice")
+    subcomandos = parser.add_subparsers(dest='comando', required=True)
+    adicionar = subcomandos.add_parser('adicionar', help="indexar um autor a partir de um texto")
+    adicionar.add_argument('autor')
+    adicionar.add_argument('arquivo', help="texto do autor (UTF-8)")
+    consultar = subcomandos.add_parser('consultar', help="autores mais próximos de um texto")
+    consultar.add_argument('arquivo', help="texto a atribuir (UTF-8)")
+    consultar.add_argument('-k', type=int, default=5)
+    args = parser.parse_args()
+
+    indice = IndiceAutores.carregar(args.indice)
+    assinatura = cohpiah.assinatura_arquivo(args.arquivo)
+    if args.comando == 'adicionar':
+        indice.adicionar(args.autor, assinatura, {'arquivo': os.path.basename(args.arquivo)})
+        indice.salvar(args.indice)
+        print(f"✅ {args.autor} indexado ({len(indice)} autores no índice)")
+    else:
+        for posicao, (autor, grau, _) in enumerate(indice.vizinhos(assinatura, args.k), 1):
+            print(f"{posicao:3d}. {autor}  (similaridade {grau:.4f})")
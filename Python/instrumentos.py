@@ -0,0 +1,204 @@
+import functools
+from typing import Dict, List, Tuple
+
+# Definições versionadas dos instrumentos de triagem.
+#
+# Cada versão guarda apenas o que é necessário para pontuar respostas brutas:
+# a ordem das subescalas, o padrão de pontuação de cada pergunta
+# ('D' = direta, 'R' = reversa), os pesos da pontuação geral e a chave em que
+# ela é gravada. Alterar pesos ou perguntas significa criar uma nova versão
+# aqui; as versões antigas continuam disponíveis para auditoria e repontuação.
+#
+# Cada instrumento é definido uma única vez, com chaves canônicas. Variantes
+# localizadas (ex.: 'bipolar_pt') apenas renomeiam as chaves usando o pacote de
+# idioma correspondente (veja idiomas.py), carregado só quando são pedidas.
+
+INSTRUMENTOS = {
+    'bipolar': {
+        '1.0': {
+            'chave_geral': 'Overall_Risk',
+            'subescalas': {
+                'Manic_Episodes': 'DDDDDDR',
+                'Depressive_Episodes': 'DDDDDDR',
+                'Mixed_Episodes': 'DDDDDR',
+                'Functional_Impairment': 'DDDDDR',
+                'Family_History': 'DDDDR',
+                'Substance_Use': 'DDDDR',
+                'Sleep_Patterns': 'DDDDR',
+                'Psychotic_Features': 'DDDDR'
+            },
+            'pesos': {
+                'Manic_Episodes': 0.25,
+                'Depressive_Episodes': 0.25,
+                'Mixed_Episodes': 0.15,
+                'Functional_Impairment': 0.20,
+                'Family_History': 0.05,
+                'Substance_Use': 0.05,
+                'Sleep_Patterns': 0.03,
+                'Psychotic_Features': 0.02
+            }
+        }
+    },
+    'mitomania': {
+        '1.0': {
+            'chave_geral': 'Pontuacao_Geral_Mitomania',
+            'subescalas': {
+                'Mentiras_Compulsivas': 'DDDDRDR',
+                'Fantasias_Elaboradas': 'DDDDRDR',
+                'Busca_Atencao': 'DDDDRDR',
+                'Manipulacao_Interpessoal': 'DDDDRDR',
+                'Confusao_Realidade': 'DDDDRDR',
+                'Necessidade_Admiracao': 'DDDDRDR',
+                'Impacto_Relacionamentos': 'DDDDRDR',
+                'Comportamento_Teatral': 'DDDDRDR'
+            },
+            'pesos': {
+                'Mentiras_Compulsivas': 0.30,
+                'Fantasias_Elaboradas': 0.20,
+                'Busca_Atencao': 0.15,
+                'Manipulacao_Interpessoal': 0.15,
+                'Confusao_Realidade': 0.10,
+                'Necessidade_Admiracao': 0.05,
+                'Impacto_Relacionamentos': 0.03,
+                'Comportamento_Teatral': 0.02
+            }
+        }
+    }
+}
+
+# Variantes localizadas: nome -> (instrumento canônico, idioma)
+LOCALIZADOS = {
+    'bipolar_pt': ('bipolar', 'pt')
+}
+
+# Versão usada pelas ferramentas interativas ao gravar novos resultados
+VERSAO_ATUAL = {
+    'bipolar': '1.0',
+    'mitomania': '1.0'
+}
+# Variantes localizadas seguem a versão do instrumento canônico
+VERSAO_ATUAL.update({nome: VERSAO_ATUAL[base] for nome, (base, _) in LOCALIZADOS.items()})
+
+
+def nomes_instrumentos() -> List[str]:
+    """Todos os nomes aceitos por obter_versao(), incluindo as variantes localizadas"""
+    return sorted(list(INSTRUMENTOS) + list(LOCALIZADOS))
+
+
+def obter_versao(instrumento: str, versao: str = None) -> Dict:
+    """Devolver a definição de uma versão do instrumento (a atual, por padrão)"""
+    if instrumento in LOCALIZADOS:
+        base, idioma = LOCALIZADOS[instrumento]
+        return _versao_localizada(base, idioma, versao or VERSAO_ATUAL[base])
+    if instrumento not in INSTRUMENTOS:
+        raise KeyError(f"Instrumento desconhecido: {instrumento}")
+    versao = versao or VERSAO_ATUAL[instrumento]
+    if versao not in INSTRUMENTOS[instrumento]:
+        raise KeyError(f"Versão {versao} não existe para o instrumento {instrumento}")
+    return INSTRUMENTOS[instrumento][versao]
+
+
+@functools.lru_cache(maxsize=None)
+def _versao_localizada(instrumento: str, idioma: str, versao: str) -> Dict:
+    """Definição canônica com as chaves renomeadas para o idioma"""
+    import idiomas
+
+    definicao = obter_versao(instrumento, versao)
+    mapa = idiomas.chaves(instrumento, idioma)
+    return {
+        'chave_geral': mapa[definicao['chave_geral']],
+        'subescalas': {mapa[s]: padrao for s, padrao in definicao['subescalas'].items()},
+        'pesos': {mapa[s]: peso for s, peso in definicao['pesos'].items()}
+    }
+
+
+def numero_perguntas(definicao: Dict) -> int:
+    """Número total de respostas brutas esperadas pela versão"""
+    return sum(len(padrao) for padrao in definicao['subescalas'].values())
+
+
+def mascara_reversa(definicao: Dict) -> List[bool]:
+    """Lista plana indicando quais perguntas têm pontuação reversa"""
+    return [c == 'R' for padrao in definicao['subescalas'].values() for c in padrao]
+
+
+def limites_subescalas(definicao: Dict) -> List[Tuple[str, int, int]]:
+    """Devolver (subescala, início, fim) de cada subescala na lista plana de respostas"""
+    limites = []
+    inicio = 0
+    for subescala, padrao in definicao['subescalas'].items():
+        limites.append((subescala, inicio, inicio + len(padrao)))
+        inicio += len(padrao)
+    return limites
+
+
+def pontuar(respostas: List[int], instrumento: str, versao: str = None) -> Dict[str, float]:
+    """
+    Pontuar uma lista plana de respostas brutas (1-5, na ordem das perguntas).
+    Retorna a pontuação normalizada (0-100) de cada subescala e a geral ponderada.
+    """
+    definicao = obter_versao(instrumento, versao)
+    if len(respostas) != numero_perguntas(definicao):
+        raise ValueError(f"Esperadas {numero_perguntas(definicao)} respostas, recebidas {len(respostas)}")
+
+    pontuacoes = {}
+    for subescala, inicio, fim in limites_subescalas(definicao):
+        pontuacoes[subescala] = pontuar_subescala(respostas[inicio:fim], instrumento, subescala, versao)
+
+    pontuacoes[definicao['chave_geral']] = pontuacao_geral(pontuacoes, instrumento, versao)
+    return pontuacoes
+
+
+def pontuar_subescala(respostas: List[int], instrumento: str, subescala: str, versao: str = None) -> float:
+    """
+    Pontuar (0-100) as respostas brutas de uma única subescala. Permite pontuar
+    cada subescala assim que ela é concluída, sem esperar o questionário inteiro.
+    """
+    padrao = obter_versao(instrumento, versao)['subescalas'][subescala]
+    if len(respostas) != len(padrao):
+        raise ValueError(f"Esperadas {len(padrao)} respostas para {subescala}, recebidas {len(respostas)}")
+
+    bruta = 0
+    for resposta, tipo in zip(respostas, padrao):
+        if not 1 <= resposta <= 5:
+            raise ValueError(f"Resposta fora do intervalo 1-5: {resposta}")
+        bruta += 6 - resposta if tipo == 'R' else resposta
+    return (bruta / (len(padrao) * 5)) * 100
+
+
+def pontuacao_geral(pontuacoes: Dict[str, float], instrumento: str, versao: str = None) -> float:
+    """Pontuação geral ponderada a partir das pontuações já calculadas das subescalas"""
+    pesos = obter_versao(instrumento, versao)['pesos']
+    return sum(pontuacoes[subescala] * peso for subescala, peso in pesos.items())
+
+
+def pontuar_matriz(matriz, instrumento: str, versao: str = None):
+    """
+    Pontuar uma matriz (n_respondentes x n_perguntas) de respostas brutas com NumPy.
+    Retorna uma matriz float64 (n_respondentes x n_subescalas + 1); a última
+    coluna é a pontuação geral. Veja colunas_pontuacao() para os nomes.
+    """
+    import numpy as np
+
+    definicao = obter_versao(instrumento, versao)
+    respostas = np.asarray(matriz, dtype=np.int16)
+    if respostas.ndim != 2 or respostas.shape[1] != numero_perguntas(definicao):
+        raise ValueError(f"Esperada matriz com {numero_perguntas(definicao)} colunas, recebida {respostas.shape}")
+
+    reversa = np.array(mascara_reversa(definicao))
+    ajustadas = np.where(reversa, 6 - respostas, respostas)
+
+    limites = limites_subescalas(definicao)
+    saida = np.empty((respostas.shape[0], len(limites) + 1), dtype=np.float64)
+    for j, (subescala, inicio, fim) in enumerate(limites):
+        saida[:, j] = ajustadas[:, inicio:fim].sum(axis=1) / ((fim - inicio) * 5) * 100
+
+    pesos = np.array([definicao['pesos'].get(subescala, 0.0) for subescala, _, _ in limites])
+    saida[:, -1] = saida[:, :-1] @ pesos
+    return saida
+
+
+def colunas_pontuacao(instrumento: str, versao: str = None) -> List[str]:
+    """Nomes das colunas devolvidas por pontuar_matriz()"""
+    definicao = obter_versao(instrumento, versao)
+    return list(definicao['subescalas']) + [definicao['chave_geral']]
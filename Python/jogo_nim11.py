@@ -1,94 +1,42 @@
-def main(r,h,c):
-    n = int(input("Quantas peças? "))
-    m = int(input("Limite de peças por jogada? "))
-    if (n >= m):
-        if (n % (m+1) == 0) and (n != m):
-            print("\nVocê começa!\n")
-            usuario(n,m,r,h,c)
-        else:                
-            print("\nComputador começa!\n")
-            computador(n,m,r,h,c)
-    else:
-        print("\nOps! Houve um erro de digitação!\n")
-        main(r,h,c)
-        
-def computador(n,m,r,h,c):
-        if ((n - m) > 0):
-            n1 = n - computador_escolhe_jogada(n,m)
-            n = n1
-            return usuario(n,m,r,h,c)
-        else:
-            print("\nFim do jogo! O Computador Venceu!\n")
-            r = r + 1
-            c = c + 1 
-            if (r <= 4 ):
-                return campeonato(r,h,c)
-            
-def computador_escolhe_jogada(n,m):
-    if ((n % (m+1)) == 0):
-        n1 = n - m
-        print("O computador tirou", m ,"peça(s).\nAgora restam",n1,"peças no tabuleiro\n")
-        n = n1
-    else:
-        r = ((n % (m+1)))
-        m = r
-        n1 = n - m
-        print("O computador tirou", m ,"peças(s).\nAgora restam",n1,"peças no tabuleiro\n")
-        n = n1
-    return m
+import nim_motor
+
+# O jogo roda em nim_motor.MotorNim: um laço sobre um estado explícito, em vez
+# de funções que chamam umas às outras a cada jogada, então partidas de
+# qualquer tamanho usam pilha constante.
 
-def usuario(n,m,r,h,c):
-    n1 = usuario_escolhe_jogada(n,m)
-    if (( n - m ) > 0) or (m != 0):
-        n = n - n1
-        print("\nVocê tirou", n1,"peça(s).\nAgora restam", n ,"peças no tabuleiro\n")
-        return computador(n,m,r,h,c)
-    else:
-        print("\nFim do jogo! O Usuário Venceu!\n")
-        r = r + 1
-        h = h + 1
-        if (r <= 4 ):
-            return campeonato(r,h,c)
+def computador_escolhe_jogada(n,m):
+    return nim_motor.computador_escolhe_jogada(n,m)
 
 def usuario_escolhe_jogada(n,m):
-    j = int(input("Quantas peças você vai tirar? "))
-    if (j > n) or (j <= 0) or (j > m):
+    while True:
+        try:
+            j = int(input("Quantas peças você vai tirar? "))
+        except ValueError:
+            j = 0
+        if nim_motor.jogada_valida(j,n,m):
+            return j
         print("\njogada inválida!\n")
-        return usuario_escolhe_jogada(n,m)
-    else:
-        if j <= n:
-            n = j
-            return(n)
-   
+
+JOGADORES = {nim_motor.USUARIO: usuario_escolhe_jogada, nim_motor.COMPUTADOR: computador_escolhe_jogada}
+
 def partida():
     print("\n**** Partida Única ****\n")
-    r = 3
-    h = 0
-    c = 0
-    main(r,h,c)
+    return nim_motor.MotorNim(rodadas=1, jogadores=JOGADORES).executar()
 
-def campeonato(r,h,c):
-    if (r <= 3):
-        print("**** Rodada",r,"****\n")
-        main(r,h,c)
-    else:
-        print("**** Final do campeonato! ****\n\nPlacar: Você",h,"X",c,"Computador\n\n")       
+def campeonato():
+    return nim_motor.MotorNim(rodadas=3, jogadores=JOGADORES).executar()
 
 def inicio():
-    modo = int(input(" 1 - para jogar uma partida isolada \n 2 - para jogar um campeonato: "))
-    if(modo == 1):
-        print("\nVoce escolheu uma partida!\n")
-        partida()
-    else:
-        if (modo == 2):
+    while True:
+        modo = input(" 1 - para jogar uma partida isolada \n 2 - para jogar um campeonato: ")
+        if (modo.strip() == "1"):
+            print("\nVoce escolheu uma partida!\n")
+            return partida()
+        if (modo.strip() == "2"):
             print("Voce escolheu um campeonato!\n")
-            r = 1
-            h = 0
-            c = 0
-            campeonato(r,h,c)
-        else:
-            print("\n\nEscolha uma opção válida!\n")
-            inicio()
+            return campeonato()
+        print("\n\nEscolha uma opção válida!\n")
 
-print("Bem-vindo ao jogo do NIM! Escolha:\n")
-inicio()
+if __name__ == "__main__":
+    print("Bem-vindo ao jogo do NIM! Escolha:\n")
+    inicio()
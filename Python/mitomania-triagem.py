@@ -1,21 +1,53 @@
 import numpy as np
-import matplotlib.pyplot as plt
-import pandas as pd
-import seaborn as sns
+import functools
 import math
 from typing import Dict, List, Tuple
 import json
 from datetime import datetime, timedelta
 
-# Configuração do seaborn para melhores visualizações
-sns.set_style("whitegrid")
-sns.set_palette("Set1")
-plt.style.use('seaborn-v0_8')
+import instrumentos
+from aquecimento import Aquecimento, uma_vez
+from escores_preparados import EscoresPreparados
 
-# Configurações do seaborn para melhores gráficos
-sns.set_context("notebook", font_scale=1.1)
-plt.rcParams['figure.facecolor'] = 'white'
-plt.rcParams['axes.facecolor'] = '#FAFAFA'
+# matplotlib, pandas e seaborn levam segundos para importar; eles são carregados
+# por _configurar_graficos(), que a triagem interativa executa numa thread em
+# segundo plano enquanto as perguntas são respondidas
+plt = None
+pd = None
+sns = None
+
+
+@uma_vez
+def _configurar_graficos():
+    """Importar as bibliotecas de gráficos e aplicar o estilo do relatório (uma única vez)"""
+    global plt, pd, sns
+    import matplotlib.pyplot as plt
+    import pandas as pd
+    import seaborn as sns
+
+    # Configuração do seaborn para melhores visualizações
+    sns.set_style("whitegrid")
+    sns.set_palette("Set1")
+    plt.style.use('seaborn-v0_8')
+
+    # Configurações do seaborn para melhores gráficos
+    sns.set_context("notebook", font_scale=1.1)
+    plt.rcParams['figure.facecolor'] = 'white'
+    plt.rcParams['axes.facecolor'] = '#FAFAFA'
+
+
+@functools.lru_cache(maxsize=None)
+def _normas_populacao():
+    """
+    Pontuações simuladas da população (mesmo sorteio da semente 42) e a curva
+    beta de referência usadas no painel de comparação
+    """
+    from scipy.stats import beta
+
+    populacao = np.random.RandomState(42).beta(1.5, 8, 10000) * 100  # Distribuição beta assimétrica
+    x = np.linspace(0, 100, 100)
+    y = beta.pdf(x/100, 1.5, 8) / 100
+    return np.clip(populacao, 0, 100), x, y
 
 class AvaliacaoMitomaniaBR:
     """
@@ -171,79 +203,79 @@ class AvaliacaoMitomaniaBR:
         }
         
     def _carregar_perguntas(self) -> Dict[str, List[Dict]]:
-        """Carregar perguntas de triagem para mitomania baseadas em literatura clínica"""
+        """Carregar perguntas de triagem para mitomania baseadas em literatura clínica (a inversão de cada uma fica em instrumentos.py)"""
         return {
             'Mentiras_Compulsivas': [
-                {'texto': 'Frequentemente minto mesmo quando a verdade seria mais fácil ou melhor', 'pontuacao': 'direta'},
-                {'texto': 'Sinto um impulso forte para mentir, mesmo em situações sem importância', 'pontuacao': 'direta'},
-                {'texto': 'Tenho dificuldade para parar de mentir uma vez que comecei', 'pontuacao': 'direta'},
-                {'texto': 'Minto automaticamente, sem pensar conscientemente nisso', 'pontuacao': 'direta'},
-                {'texto': 'Raramente sinto necessidade de inventar ou exagerar histórias', 'pontuacao': 'reversa'},
-                {'texto': 'Minto várias vezes ao dia, mesmo sobre coisas pequenas', 'pontuacao': 'direta'},
-                {'texto': 'Sempre falo a verdade, independentemente das consequências', 'pontuacao': 'reversa'}
+                {'texto': 'Frequentemente minto mesmo quando a verdade seria mais fácil ou melhor'},
+                {'texto': 'Sinto um impulso forte para mentir, mesmo em situações sem importância'},
+                {'texto': 'Tenho dificuldade para parar de mentir uma vez que comecei'},
+                {'texto': 'Minto automaticamente, sem pensar conscientemente nisso'},
+                {'texto': 'Raramente sinto necessidade de inventar ou exagerar histórias'},
+                {'texto': 'Minto várias vezes ao dia, mesmo sobre coisas pequenas'},
+                {'texto': 'Sempre falo a verdade, independentemente das consequências'}
             ],
             'Fantasias_Elaboradas': [
-                {'texto': 'Crio histórias detalhadas e complexas sobre minha vida que não são verdadeiras', 'pontuacao': 'direta'},
-                {'texto': 'Invento experiências dramáticas ou extraordinárias que nunca aconteceram', 'pontuacao': 'direta'},
-                {'texto': 'Fabrico detalhes elaborados para tornar minhas histórias mais interessantes', 'pontuacao': 'direta'},
-                {'texto': 'Conto a mesma história de formas diferentes para pessoas diferentes', 'pontuacao': 'direta'},
-                {'texto': 'Mantenho minhas histórias simples e baseadas na realidade', 'pontuacao': 'reversa'},
-                {'texto': 'Crio personagens ou situações fictícias e as apresento como reais', 'pontuacao': 'direta'},
-                {'texto': 'Prefiro contar apenas fatos que realmente aconteceram', 'pontuacao': 'reversa'}
+                {'texto': 'Crio histórias detalhadas e complexas sobre minha vida que não são verdadeiras'},
+                {'texto': 'Invento experiências dramáticas ou extraordinárias que nunca aconteceram'},
+                {'texto': 'Fabrico detalhes elaborados para tornar minhas histórias mais interessantes'},
+                {'texto': 'Conto a mesma história de formas diferentes para pessoas diferentes'},
+                {'texto': 'Mantenho minhas histórias simples e baseadas na realidade'},
+                {'texto': 'Crio personagens ou situações fictícias e as apresento como reais'},
+                {'texto': 'Prefiro contar apenas fatos que realmente aconteceram'}
             ],
             'Busca_Atencao': [
-                {'texto': 'Frequentemente invento ou exagero histórias para impressionar outros', 'pontuacao': 'direta'},
-                {'texto': 'Sinto necessidade de ser o centro das atenções em conversas', 'pontuacao': 'direta'},
-                {'texto': 'Conto histórias dramáticas sobre mim mesmo para obter simpatia ou admiração', 'pontuacao': 'direta'},
-                {'texto': 'Fico desconfortável quando não sou o foco da atenção', 'pontuacao': 'direta'},
-                {'texto': 'Estou satisfeito em ouvir outros falarem sobre suas experiências', 'pontuacao': 'reversa'},
-                {'texto': 'Exagero meus problemas ou sucessos para obter mais atenção', 'pontuacao': 'direta'},
-                {'texto': 'Raramente sinto necessidade de ser o centro das atenções', 'pontuacao': 'reversa'}
+                {'texto': 'Frequentemente invento ou exagero histórias para impressionar outros'},
+                {'texto': 'Sinto necessidade de ser o centro das atenções em conversas'},
+                {'texto': 'Conto histórias dramáticas sobre mim mesmo para obter simpatia ou admiração'},
+                {'texto': 'Fico desconfortável quando não sou o foco da atenção'},
+                {'texto': 'Estou satisfeito em ouvir outros falarem sobre suas experiências'},
+                {'texto': 'Exagero meus problemas ou sucessos para obter mais atenção'},
+                {'texto': 'Raramente sinto necessidade de ser o centro das atenções'}
             ],
             'Manipulacao_Interpessoal': [
-                {'texto': 'Uso mentiras para conseguir o que quero de outras pessoas', 'pontuacao': 'direta'},
-                {'texto': 'Minto para evitar responsabilidades ou consequências', 'pontuacao': 'direta'},
-                {'texto': 'Crio histórias para fazer outros sentirem pena de mim', 'pontuacao': 'direta'},
-                {'texto': 'Uso informações falsas para influenciar decisões de outros', 'pontuacao': 'direta'},
-                {'texto': 'Sempre sou direto e honesto em minhas comunicações', 'pontuacao': 'reversa'},
-                {'texto': 'Minto para criar conflitos entre outras pessoas', 'pontuacao': 'direta'},
-                {'texto': 'Nunca uso mentiras para obter vantagens pessoais', 'pontuacao': 'reversa'}
+                {'texto': 'Uso mentiras para conseguir o que quero de outras pessoas'},
+                {'texto': 'Minto para evitar responsabilidades ou consequências'},
+                {'texto': 'Crio histórias para fazer outros sentirem pena de mim'},
+                {'texto': 'Uso informações falsas para influenciar decisões de outros'},
+                {'texto': 'Sempre sou direto e honesto em minhas comunicações'},
+                {'texto': 'Minto para criar conflitos entre outras pessoas'},
+                {'texto': 'Nunca uso mentiras para obter vantagens pessoais'}
             ],
             'Confusao_Realidade': [
-                {'texto': 'Às vezes tenho dificuldade para lembrar se algo realmente aconteceu ou se inventei', 'pontuacao': 'direta'},
-                {'texto': 'Minhas fantasias às vezes parecem tão reais quanto memórias verdadeiras', 'pontuacao': 'direta'},
-                {'texto': 'Começo a acreditar em minhas próprias mentiras depois de contá-las várias vezes', 'pontuacao': 'direta'},
-                {'texto': 'Tenho momentos em que não tenho certeza do que é real', 'pontuacao': 'direta'},
-                {'texto': 'Sempre tenho clareza sobre o que é verdade e o que é fantasia', 'pontuacao': 'reversa'},
-                {'texto': 'Fico confuso sobre quais versões de uma história são verdadeiras', 'pontuacao': 'direta'},
-                {'texto': 'Minha memória dos eventos é sempre precisa e confiável', 'pontuacao': 'reversa'}
+                {'texto': 'Às vezes tenho dificuldade para lembrar se algo realmente aconteceu ou se inventei'},
+                {'texto': 'Minhas fantasias às vezes parecem tão reais quanto memórias verdadeiras'},
+                {'texto': 'Começo a acreditar em minhas próprias mentiras depois de contá-las várias vezes'},
+                {'texto': 'Tenho momentos em que não tenho certeza do que é real'},
+                {'texto': 'Sempre tenho clareza sobre o que é verdade e o que é fantasia'},
+                {'texto': 'Fico confuso sobre quais versões de uma história são verdadeiras'},
+                {'texto': 'Minha memória dos eventos é sempre precisa e confiável'}
             ],
             'Necessidade_Admiracao': [
-                {'texto': 'Invento conquistas ou habilidades para impressionar outros', 'pontuacao': 'direta'},
-                {'texto': 'Exagero meu status social, profissional ou financeiro', 'pontuacao': 'direta'},
-                {'texto': 'Crio histórias sobre pessoas famosas ou importantes que "conheço"', 'pontuacao': 'direta'},
-                {'texto': 'Minto sobre minha educação, formação ou experiência profissional', 'pontuacao': 'direta'},
-                {'texto': 'Estou confortável sendo uma pessoa comum sem histórias especiais', 'pontuacao': 'reversa'},
-                {'texto': 'Fabrico histórias sobre viagens ou experiências únicas que nunca tive', 'pontuacao': 'direta'},
-                {'texto': 'Não sinto necessidade de impressionar outros com histórias elaboradas', 'pontuacao': 'reversa'}
+                {'texto': 'Invento conquistas ou habilidades para impressionar outros'},
+                {'texto': 'Exagero meu status social, profissional ou financeiro'},
+                {'texto': 'Crio histórias sobre pessoas famosas ou importantes que "conheço"'},
+                {'texto': 'Minto sobre minha educação, formação ou experiência profissional'},
+                {'texto': 'Estou confortável sendo uma pessoa comum sem histórias especiais'},
+                {'texto': 'Fabrico histórias sobre viagens ou experiências únicas que nunca tive'},
+                {'texto': 'Não sinto necessidade de impressionar outros com histórias elaboradas'}
             ],
             'Impacto_Relacionamentos': [
-                {'texto': 'Minhas mentiras já causaram problemas sérios em relacionamentos', 'pontuacao': 'direta'},
-                {'texto': 'Perdi amigos ou parceiros por causa de minhas mentiras', 'pontuacao': 'direta'},
-                {'texto': 'Pessoas próximas me confrontaram sobre inconsistências em minhas histórias', 'pontuacao': 'direta'},
-                {'texto': 'Sinto que preciso lembrar de várias versões diferentes da "verdade"', 'pontuacao': 'direta'},
-                {'texto': 'Meus relacionamentos são baseados em honestidade e confiança mútua', 'pontuacao': 'reversa'},
-                {'texto': 'Tenho dificuldade para manter relacionamentos próximos e duradouros', 'pontuacao': 'direta'},
-                {'texto': 'As pessoas me veem como alguém confiável e honesto', 'pontuacao': 'reversa'}
+                {'texto': 'Minhas mentiras já causaram problemas sérios em relacionamentos'},
+                {'texto': 'Perdi amigos ou parceiros por causa de minhas mentiras'},
+                {'texto': 'Pessoas próximas me confrontaram sobre inconsistências em minhas histórias'},
+                {'texto': 'Sinto que preciso lembrar de várias versões diferentes da "verdade"'},
+                {'texto': 'Meus relacionamentos são baseados em honestidade e confiança mútua'},
+                {'texto': 'Tenho dificuldade para manter relacionamentos próximos e duradouros'},
+                {'texto': 'As pessoas me veem como alguém confiável e honesto'}
             ],
             'Comportamento_Teatral': [
-                {'texto': 'Tendo a dramatizar situações e exagerar emoções ao contar histórias', 'pontuacao': 'direta'},
-                {'texto': 'Uso gestos e expressões dramáticas para tornar minhas histórias mais convincentes', 'pontuacao': 'direta'},
-                {'texto': 'Adapto meu comportamento e personalidade dependendo da audiência', 'pontuacao': 'direta'},
-                {'texto': 'Sinto que estou "interpretando" um papel em muitas situações sociais', 'pontuacao': 'direta'},
-                {'texto': 'Mantenho a mesma personalidade em todas as situações', 'pontuacao': 'reversa'},
-                {'texto': 'Exagero expressões faciais e tom de voz para efeito dramático', 'pontuacao': 'direta'},
-                {'texto': 'Prefiro uma comunicação direta e sem dramatização', 'pontuacao': 'reversa'}
+                {'texto': 'Tendo a dramatizar situações e exagerar emoções ao contar histórias'},
+                {'texto': 'Uso gestos e expressões dramáticas para tornar minhas histórias mais convincentes'},
+                {'texto': 'Adapto meu comportamento e personalidade dependendo da audiência'},
+                {'texto': 'Sinto que estou "interpretando" um papel em muitas situações sociais'},
+                {'texto': 'Mantenho a mesma personalidade em todas as situações'},
+                {'texto': 'Exagero expressões faciais e tom de voz para efeito dramático'},
+                {'texto': 'Prefiro uma comunicação direta e sem dramatização'}
             ]
         }
     
@@ -283,54 +315,38 @@ class AvaliacaoMitomaniaBR:
         print("\n⚠️  IMPORTANTE: Esta triagem requer honestidade para ser útil.")
         print("Lembre-se: reconhecer padrões é o primeiro passo para mudança positiva.")
         
+        # Carregar as bibliotecas de gráficos e as normas populacionais enquanto o usuário responde
+        Aquecimento(_configurar_graficos, _normas_populacao).iniciar()
+        
+        respostas_brutas = []
         pontuacoes = {}
-        todas_respostas = []
         
         for subescala, perguntas in self.perguntas.items():
             print(f"\n{subescala.replace('_', ' ').upper()}: {self.descricoes_subescalas[subescala]}")
             print("-" * 70)
             
-            pontuacoes_subescala = []
+            respostas_subescala = []
             for i, p in enumerate(perguntas, 1):
                 while True:
                     try:
                         resposta = input(f"{i}. {p['texto']}: ")
                         pontuacao = int(resposta)
                         if 1 <= pontuacao <= 5:
-                            # Aplicar pontuação (reverter se necessário)
-                            if p['pontuacao'] == 'reversa':
-                                pontuacao_final = 6 - pontuacao
-                            else:
-                                pontuacao_final = pontuacao
-                            
-                            pontuacoes_subescala.append(pontuacao_final)
-                            todas_respostas.append(pontuacao_final)
+                            # Guardar a resposta bruta; a inversão é aplicada pela definição do instrumento
+                            respostas_subescala.append(pontuacao)
                             break
                         else:
                             print("Por favor, digite um número entre 1 e 5")
                     except ValueError:
                         print("Por favor, digite um número válido")
             
-            # Calcular pontuação normalizada da subescala (0-100)
-            pontuacao_bruta = sum(pontuacoes_subescala)
-            maximo_possivel = len(perguntas) * 5
-            pontuacao_normalizada = (pontuacao_bruta / maximo_possivel) * 100
-            pontuacoes[subescala] = pontuacao_normalizada
-        
-        # Calcular pontuação geral com componentes ponderados
-        pesos = {
-            'Mentiras_Compulsivas': 0.30,
-            'Fantasias_Elaboradas': 0.20,
-            'Busca_Atencao': 0.15,
-            'Manipulacao_Interpessoal': 0.15,
-            'Confusao_Realidade': 0.10,
-            'Necessidade_Admiracao': 0.05,
-            'Impacto_Relacionamentos': 0.03,
-            'Comportamento_Teatral': 0.02
-        }
+            # Pontuação normalizada (0-100), calculada assim que a subescala é concluída
+            respostas_brutas.extend(respostas_subescala)
+            pontuacoes[subescala] = instrumentos.pontuar_subescala(respostas_subescala, 'mitomania', subescala)
         
-        pontuacao_geral = sum(pontuacoes[subescala] * peso for subescala, peso in pesos.items())
-        pontuacoes['Pontuacao_Geral_Mitomania'] = pontuacao_geral
+        # Pontuação geral ponderada da versão atual do instrumento (os pesos ficam em instrumentos.py)
+        self.respostas_brutas = respostas_brutas
+        pontuacoes['Pontuacao_Geral_Mitomania'] = instrumentos.pontuacao_geral(pontuacoes, 'mitomania')
         
         # Adicionar feedback imediato
         self._feedback_imediato(pontuacoes)
@@ -377,31 +393,35 @@ class AvaliacaoMitomaniaBR:
     
     def criar_relatorio_abrangente(self, pontuacoes: Dict[str, float], titulo: str = "Resultados da Triagem de Mitomania"):
         """Criar visualização e análise abrangentes"""
+        _configurar_graficos()
         
         # Criar figura com estilo seaborn aprimorado
         plt.style.use('seaborn-v0_8-darkgrid')
         fig = plt.figure(figsize=(24, 18))
         fig.patch.set_facecolor('white')
         
+        # Preparar ordem, faixas e cores das subescalas uma única vez para todos os painéis
+        preparados = self._preparar_pontuacoes(pontuacoes)
+        
         # 1. Medidor de Risco Geral
         ax1 = plt.subplot(3, 4, 1)
-        self._criar_medidor_mitomania(ax1, pontuacoes['Pontuacao_Geral_Mitomania'])
+        self._criar_medidor_mitomania(ax1, preparados.geral)
         
         # 2. Perfil de Comportamentos
         ax2 = plt.subplot(3, 4, (2, 3), projection='polar')
-        self._criar_radar_comportamentos(ax2, pontuacoes)
+        self._criar_radar_comportamentos(ax2, preparados)
         
         # 3. Classificação de Severidade
         ax3 = plt.subplot(3, 4, 4)
-        self._criar_classificacao_severidade(ax3, pontuacoes['Pontuacao_Geral_Mitomania'])
+        self._criar_classificacao_severidade(ax3, preparados)
         
         # 4. Análise Detalhada por Categoria
         ax4 = plt.subplot(3, 4, (5, 7))
-        self._criar_analise_categorias(ax4, pontuacoes)
+        self._criar_analise_categorias(ax4, preparados)
         
         # 5. Mapa de Calor de Intensidade
         ax5 = plt.subplot(3, 4, 8)
-        self._criar_mapa_calor_intensidade(ax5, pontuacoes)
+        self._criar_mapa_calor_intensidade(ax5, preparados)
         
         # 6. Padrão de Comportamento Temporal
         ax6 = plt.subplot(3, 4, (9, 10))
@@ -409,17 +429,37 @@ class AvaliacaoMitomaniaBR:
         
         # 7. Comparação com População
         ax7 = plt.subplot(3, 4, 11)
-        self._criar_comparacao_populacional(ax7, pontuacoes['Pontuacao_Geral_Mitomania'])
+        self._criar_comparacao_populacional(ax7, preparados.geral)
         
         # 8. Recomendações de Tratamento
         ax8 = plt.subplot(3, 4, 12)
-        self._criar_painel_tratamento(ax8, pontuacoes)
+        self._criar_painel_tratamento(ax8, preparados)
         
         plt.suptitle(titulo, fontsize=22, fontweight='bold', y=0.98)
         plt.tight_layout()
         plt.subplots_adjust(top=0.94)
         plt.show()
     
+    def _preparar_pontuacoes(self, pontuacoes):
+        """Preparar as pontuações compartilhadas pelos painéis do relatório"""
+        def categoria(s):
+            if s in ['Mentiras_Compulsivas', 'Fantasias_Elaboradas']:
+                return 'Comportamento Central'
+            if s in ['Busca_Atencao', 'Necessidade_Admiracao']:
+                return 'Motivação Social'
+            if s in ['Manipulacao_Interpessoal']:
+                return 'Manipulação'
+            return 'Impacto Psicológico'
+        
+        cores_categorias = {
+            'Comportamento Central': '#E74C3C',
+            'Motivação Social': '#3498DB',
+            'Manipulação': '#8E44AD',
+            'Impacto Psicológico': '#F39C12'
+        }
+        return EscoresPreparados(pontuacoes, 'Pontuacao_Geral_Mitomania', (25, 45, 65),
+                                 (25, 45, 65, 80), categoria, cores_categorias)
+    
     def _criar_medidor_mitomania(self, ax, pontuacao_geral):
         """Criar medidor estilo velocímetro para mitomania"""
         theta = np.linspace(0, np.pi, 100)
@@ -464,17 +504,12 @@ class AvaliacaoMitomaniaBR:
         ax.set_yticks([])
         ax.set_title('Nível Geral de Mitomania', fontweight='bold', pad=30, fontsize=16)
     
-    def _criar_radar_comportamentos(self, ax, pontuacoes):
+    def _criar_radar_comportamentos(self, ax, preparados):
         """Criar gráfico radar para comportamentos de mitomania"""
-        comportamentos = [k for k in pontuacoes.keys() if k != 'Pontuacao_Geral_Mitomania']
-        valores = [pontuacoes[k] for k in comportamentos]
-        
-        # Fechar o polígono
-        valores += valores[:1]
+        comportamentos = preparados.subescalas
         
-        # Calcular ângulos
-        angulos = np.linspace(0, 2 * np.pi, len(comportamentos), endpoint=False).tolist()
-        angulos += angulos[:1]
+        # Valores com o polígono fechado, ângulos e rótulos já preparados
+        valores, angulos, rotulos = preparados.radar()
         
         # Estilo de gráfico radar aprimorado
         cores = sns.color_palette("plasma", 3)
@@ -486,7 +521,6 @@ class AvaliacaoMitomaniaBR:
         ax.fill(angulos, valores, alpha=0.4, color=cores[0])
         
         # Personalizar
-        rotulos = [s.replace('_', '\n') for s in comportamentos]
         ax.set_xticks(angulos[:-1])
         ax.set_xticklabels(rotulos, fontsize=10, fontweight='bold')
         ax.set_ylim(0, 100)
@@ -503,8 +537,9 @@ class AvaliacaoMitomaniaBR:
                    bbox=dict(boxstyle="round,pad=0.3", facecolor='white', 
                            alpha=0.9, edgecolor=cores[0], linewidth=2))
     
-    def _criar_classificacao_severidade(self, ax, pontuacao_geral):
+    def _criar_classificacao_severidade(self, ax, preparados):
         """Criar classificação de severidade"""
+        pontuacao_geral = preparados.geral
         niveis = ['Baixo\n(0-25)', 'Moderado\n(25-45)', 'Alto\n(45-65)', 
                  'Muito Alto\n(65-80)', 'Crítico\n(80-100)']
         valores = [25, 20, 20, 15, 20]
@@ -512,17 +547,8 @@ class AvaliacaoMitomaniaBR:
         # Cores baseadas na severidade
         cores = ['#2ECC71', '#F39C12', '#E67E22', '#E74C3C', '#8E44AD']
         
-        # Determinar nível atual
-        if pontuacao_geral < 25:
-            nivel_atual = 0
-        elif pontuacao_geral < 45:
-            nivel_atual = 1
-        elif pontuacao_geral < 65:
-            nivel_atual = 2
-        elif pontuacao_geral < 80:
-            nivel_atual = 3
-        else:
-            nivel_atual = 4
+        # Nível atual (faixa da pontuação geral)
+        nivel_atual = preparados.faixa_geral
         
         # Criar barras
         barras = ax.bar(niveis, valores, color=cores, alpha=0.8, 
@@ -549,34 +575,13 @@ class AvaliacaoMitomaniaBR:
         ax.set_facecolor('#FAFAFA')
         plt.setp(ax.get_xticklabels(), fontsize=10, fontweight='bold')
     
-    def _criar_analise_categorias(self, ax, pontuacoes):
+    def _criar_analise_categorias(self, ax, preparados):
         """Criar análise detalhada por categorias"""
-        comportamentos = [k for k in pontuacoes.keys() if k != 'Pontuacao_Geral_Mitomania']
-        valores = [pontuacoes[k] for k in comportamentos]
-        
-        # Categorizar comportamentos
-        df = pd.DataFrame({
-            'Comportamento': [s.replace('_', ' ') for s in comportamentos],
-            'Pontuacao': valores,
-            'Categoria': ['Comportamento Central' if s in ['Mentiras_Compulsivas', 'Fantasias_Elaboradas'] else
-                         'Motivação Social' if s in ['Busca_Atencao', 'Necessidade_Admiracao'] else
-                         'Manipulação' if s in ['Manipulacao_Interpessoal'] else
-                         'Impacto Psicológico' for s in comportamentos]
-        })
-        
-        # Cores por categoria
-        cores_categorias = {
-            'Comportamento Central': '#E74C3C',
-            'Motivação Social': '#3498DB',
-            'Manipulação': '#8E44AD',
-            'Impacto Psicológico': '#F39C12'
-        }
+        valores = preparados.valores
         
-        cores = [cores_categorias[cat] for cat in df['Categoria']]
-        
-        # Criar gráfico de barras horizontais
-        y_pos = np.arange(len(comportamentos))
-        barras = ax.barh(y_pos, valores, color=cores, alpha=0.85, 
+        # Criar gráfico de barras horizontais (cores por categoria já preparadas)
+        y_pos = np.arange(len(valores))
+        barras = ax.barh(y_pos, valores, color=preparados.cores, alpha=0.85, 
                         edgecolor='white', linewidth=2)
         
         # Adicionar rótulos de valores
@@ -588,7 +593,7 @@ class AvaliacaoMitomaniaBR:
         
         # Estilo
         ax.set_yticks(y_pos)
-        ax.set_yticklabels(df['Comportamento'], fontsize=11, fontweight='bold')
+        ax.set_yticklabels(preparados.rotulos, fontsize=11, fontweight='bold')
         ax.set_xlabel('Pontuação (0-100)', fontweight='bold', fontsize=14)
         ax.set_title('Análise Detalhada por Categoria', fontweight='bold', fontsize=16, pad=25)
         ax.set_xlim(0, 110)
@@ -600,40 +605,18 @@ class AvaliacaoMitomaniaBR:
         # Legenda
         from matplotlib.patches import Patch
         elementos_legenda = [Patch(facecolor=cor, label=categoria) 
-                            for categoria, cor in cores_categorias.items()]
+                            for categoria, cor in preparados.cores_categorias.items()]
         ax.legend(handles=elementos_legenda, loc='lower right', frameon=True, 
                  fancybox=True, shadow=True, fontsize=10)
         
         ax.grid(True, alpha=0.4, axis='x')
         ax.set_facecolor('#FAFAFA')
     
-    def _criar_mapa_calor_intensidade(self, ax, pontuacoes):
+    def _criar_mapa_calor_intensidade(self, ax, preparados):
         """Criar mapa de calor de intensidade dos comportamentos"""
-        comportamentos = [k for k in pontuacoes.keys() if k != 'Pontuacao_Geral_Mitomania']
-        
-        # Criar matriz de intensidade
-        dados_intensidade = []
-        rotulos = []
-        
-        for comportamento in comportamentos:
-            pontuacao = pontuacoes[comportamento]
-            # Converter para níveis de intensidade
-            if pontuacao < 25:
-                intensidade = [1, 0, 0, 0]  # Baixo
-            elif pontuacao < 45:
-                intensidade = [1, 1, 0, 0]  # Moderado
-            elif pontuacao < 65:
-                intensidade = [1, 1, 1, 0]  # Alto
-            else:
-                intensidade = [1, 1, 1, 1]  # Muito Alto
-            
-            dados_intensidade.append(intensidade)
-            rotulos.append(comportamento.replace('_', '\n'))
-        
-        # Criar mapa de calor
-        matriz_intensidade = np.array(dados_intensidade)
-        sns.heatmap(matriz_intensidade, 
-                   yticklabels=rotulos,
+        # Matriz de intensidade: cada linha tem 1 até a faixa da subescala (Baixo..Muito Alto)
+        sns.heatmap(preparados.matriz_faixas, 
+                   yticklabels=preparados.rotulos_quebrados,
                    xticklabels=['Baixo', 'Moderado', 'Alto', 'Crítico'],
                    cmap='OrRd', cbar=False, ax=ax,
                    linewidths=1, linecolor='white')
@@ -689,10 +672,8 @@ class AvaliacaoMitomaniaBR:
     
     def _criar_comparacao_populacional(self, ax, pontuacao_geral):
         """Criar comparação com população geral"""
-        # Simular distribuição populacional (mitomania é relativamente rara)
-        np.random.seed(42)
-        populacao = np.random.beta(1.5, 8, 10000) * 100  # Distribuição beta assimétrica
-        populacao = np.clip(populacao, 0, 100)
+        # Distribuição populacional simulada e curva de referência (em cache; mitomania é relativamente rara)
+        populacao, x, y = _normas_populacao()
         
         # Calcular percentil
         percentil = (np.sum(populacao < pontuacao_geral) / len(populacao)) * 100
@@ -703,10 +684,6 @@ class AvaliacaoMitomaniaBR:
                                   edgecolor='white', linewidth=1, density=True)
         
         # Adicionar curva suave
-        x = np.linspace(0, 100, 100)
-        from scipy.stats import beta
-        a, b = 1.5, 8
-        y = beta.pdf(x/100, a, b) / 100
         ax.plot(x, y, color=cores[1], linewidth=4, alpha=0.9, label='Curva Populacional')
         
         # Linha da pontuação
@@ -728,14 +705,13 @@ class AvaliacaoMitomaniaBR:
         ax.text(0.05, 0.95, texto_info, transform=ax.transAxes, fontsize=11,
                 verticalalignment='top', bbox=props, fontweight='bold')
     
-    def _criar_painel_tratamento(self, ax, pontuacoes):
+    def _criar_painel_tratamento(self, ax, preparados):
         """Criar painel de recomendações de tratamento"""
         ax.axis('off')
-        pontuacao_geral = pontuacoes['Pontuacao_Geral_Mitomania']
+        pontuacao_geral = preparados.geral
         
         # Obter principais áreas problemáticas
-        comportamentos = {k: v for k, v in pontuacoes.items() if k != 'Pontuacao_Geral_Mitomania'}
-        principais_problemas = sorted(comportamentos.items(), key=lambda x: x[1], reverse=True)[:3]
+        principais_problemas = preparados.maiores(3)
         
         # Gerar recomendações baseadas na severidade
         if pontuacao_geral < 25:
@@ -853,6 +829,7 @@ Top 3 Áreas Problemáticas:
     
     def criar_guia_tratamento(self, pontuacoes: Dict[str, float]):
         """Criar guia detalhado de tratamento baseado nas pontuações"""
+        _configurar_graficos()
         
         fig, axes = plt.subplots(2, 2, figsize=(20, 14))
         fig.suptitle('Guia Completo de Tratamento para Mitomania', 
@@ -1108,13 +1085,16 @@ Top 3 Áreas Problemáticas:
         print("   • Apoio social é fundamental para recuperação")
 
 
-def salvar_resultados(pontuacoes: Dict[str, float], nome_arquivo: str = "resultados_triagem_mitomania.json"):
-    """Salvar resultados da triagem em arquivo JSON"""
+def salvar_resultados(pontuacoes: Dict[str, float], nome_arquivo: str = "resultados_triagem_mitomania.json",
+                      respostas: List[int] = None):
+    """Salvar resultados da triagem em arquivo JSON (as respostas brutas permitem repontuar depois)"""
     resultados = {
         'timestamp': datetime.now().isoformat(),
         'pontuacoes': pontuacoes,
         'tipo_avaliacao': 'Ferramenta de Triagem para Mitomania - Brasil',
-        'versao': '1.0',
+        'instrumento': 'mitomania',
+        'versao': instrumentos.VERSAO_ATUAL['mitomania'],
+        'respostas': respostas,
         'disclaimer': 'Esta é uma ferramenta de triagem, não um instrumento diagnóstico. Procure ajuda profissional para avaliação completa.',
         'recursos_apoio_brasil': {
             'conselho_federal_psicologia': 'https://site.cfp.org.br',
@@ -1159,6 +1139,7 @@ if __name__ == "__main__":
             confirmar = input("\nPronto para começar com honestidade? (s/n): ").lower()
             if confirmar == 's':
                 pontuacoes = ferramenta.administrar_triagem()
+                respostas = ferramenta.respostas_brutas
                 titulo = "Seus Resultados da Triagem de Mitomania"
                 nome_arquivo = "minha_triagem_mitomania.json"
                 mostrar_tratamento = True
@@ -1168,6 +1149,7 @@ if __name__ == "__main__":
             break
         elif escolha == "2":
             pontuacoes = ferramenta.pontuacoes_demo()
+            respostas = None
             titulo = "Resultados Demo da Triagem de Mitomania"
             nome_arquivo = "demo_triagem_mitomania.json"
             mostrar_tratamento = False
@@ -1194,7 +1176,7 @@ if __name__ == "__main__":
     ferramenta._imprimir_analise_detalhada(pontuacoes)
     
     # Salvar resultados
-    salvar_resultados(pontuacoes, nome_arquivo)
+    salvar_resultados(pontuacoes, nome_arquivo, respostas)
     
     print("\n" + "="*85)
     print("🎯 TRIAGEM CONCLUÍDA")
@@ -0,0 +1,186 @@
+import argparse
+import json
+import os
+from functools import lru_cache
+from typing import Iterable, Optional, Tuple
+
+# Valores de Sprague-Grundy de jogos de subtração com qualquer conjunto de jogadas.
+#
+# computador_escolhe_jogada só conhece a regra fechada do conjunto {1..m}
+# (valor de Grundy n % (m + 1)). Para um conjunto arbitrário, como {1, 3, 4},
+# o valor de n é o mex (menor inteiro não negativo ausente) dos valores de
+# n - s para cada jogada s <= n, e TabelaGrundy o calcula de baixo para cima.
+#
+# Com k = max(jogadas), o valor de n depende só dos k valores anteriores, então
+# a sequência é periódica a partir da primeira janela de k valores que se
+# repete: se a janela que começa em i é igual à que começa em j > i, vale
+# g(x) = g(x + (j - i)) para todo x >= i. A tabela para de crescer quando isso
+# acontece, e qualquer n, mesmo na casa dos bilhões, é respondido em O(1).
+# As janelas já vistas são guardadas só pelo hash polinomial (atualizado a cada
+# posição em O(1)) e a posição onde começaram; quando um hash se repete, as
+# duas janelas são comparadas em valores para descartar colisões.
+#
+# Tabelas completas (com o período encontrado) são gravadas em JSON, uma por
+# conjunto de jogadas, no diretório de cache, e reaproveitadas nas próximas
+# execuções. Um arquivo de cache corrompido ou incompleto é recalculado e
+# regravado.
+
+VERSAO = 1
+DIRETORIO_CACHE = os.path.join(os.path.expanduser('~'), '.cache', 'nim_grundy')
+LIMITE_TABELA = 1 << 22  # posições calculadas à procura do período antes de desistir
+_BASE_HASH = 1_000_003
+_MODULO_HASH = (1 << 61) - 1
+
+
+def _mex(valores) -> int:
+    """Menor inteiro não negativo que não está em valores"""
+    n = 0
+    while n in valores:
+        n += 1
+    return n
+
+
+class TabelaGrundy:
+    """Valores de Grundy do jogo de subtração com o conjunto de jogadas dado"""
+
+    def __init__(self, jogadas: Iterable[int]):
+        self.jogadas = tuple(sorted(set(jogadas)))
+        if not self.jogadas or self.jogadas[0] < 1:
+            raise ValueError("As jogadas devem ser inteiros positivos")
+        self.valores = []
+        self.preperiodo = None
+        self.periodo = None
+        self._janelas = {}  # hash da janela de k valores -> posição onde começou
+        self._colisoes = {}  # hash -> outras posições com o mesmo hash e janela diferente
+        self._hash = 0  # hash das últimas k posições calculadas
+
+    def _calcular_ate(self, n: int):
+        """Estender a tabela até a posição n ou até achar o período"""
+        k = self.jogadas[-1]
+        peso_saida = pow(_BASE_HASH, k, _MODULO_HASH)  # peso do valor que sai da janela
+        valores = self.valores
+        while len(valores) <= n and self.periodo is None:
+            posicao = len(valores)
+            g = _mex({valores[posicao - s] for s in self.jogadas if s <= posicao})
+            valores.append(g)
+            # +1 para que valores zero também mudem o hash
+            self._hash = (self._hash * _BASE_HASH + g + 1) % _MODULO_HASH
+            inicio = posicao - k + 1
+            if inicio > 0:
+                self._hash = (self._hash - (valores[inicio - 1] + 1) * peso_saida) % _MODULO_HASH
+            if inicio >= 0:
+                anterior = self._repetida(inicio, k)
+                if anterior is not None:
+                    self.preperiodo, self.periodo = anterior, inicio - anterior
+                    # Só o preperíodo e um período são necessários para responder qualquer n
+                    del valores[anterior + self.periodo:]
+                    self._janelas, self._colisoes = {}, {}
+
+    def _repetida(self, inicio: int, k: int) -> Optional[int]:
+        """Posição anterior com a mesma janela que começa em inicio; None se é nova (e fica registrada)"""
+        valores = self.valores
+        anterior = self._janelas.setdefault(self._hash, inicio)
+        if anterior == inicio or valores[anterior:anterior + k] == valores[inicio:]:
+            return None if anterior == inicio else anterior
+        outras = self._colisoes.setdefault(self._hash, [])
+        for anterior in outras:
+            if valores[anterior:anterior + k] == valores[inicio:]:
+                return anterior
+        outras.append(inicio)
+        return None
+
+    def encontrar_periodo(self, limite: int = LIMITE_TABELA) -> Optional[Tuple[int, int]]:
+        """(preperíodo, período), calculando até `limite` posições; None se não aparecer"""
+        self._calcular_ate(limite)
+        return (self.preperiodo, self.periodo) if self.periodo is not None else None
+
+    def valor(self, n: int) -> int:
+        """Valor de Grundy da posição com n peças"""
+        if n < 0:
+            raise ValueError("n deve ser não negativo")
+        if n >= len(self.valores) and self.periodo is None:
+            self._calcular_ate(n)
+        if self.periodo is not None and n >= self.preperiodo:
+            return self.valores[self.preperiodo + (n - self.preperiodo) % self.periodo]
+        return self.valores[n]
+
+    def jogada(self, n: int) -> Optional[int]:
+        """Peças a tirar: uma jogada para posição de valor zero se houver, senão a menor possível; None sem jogadas"""
+        possiveis = [s for s in self.jogadas if s <= n]
+        for s in possiveis:
+            if self.valor(n - s) == 0:
+                return s
+        return possiveis[0] if possiveis else None
+
+    def para_json(self) -> dict:
+        return {'versao': VERSAO, 'jogadas': list(self.jogadas), 'valores': self.valores,
+                'preperiodo': self.preperiodo, 'periodo': self.periodo}
+
+    @classmethod
+    def de_json(cls, dados: dict) -> 'TabelaGrundy':
+        tabela = cls(dados['jogadas'])
+        tabela.valores = dados['valores']
+        tabela.preperiodo = dados['preperiodo']
+        tabela.periodo = dados['periodo']
+        return tabela
+
+
+def _caminho_cache(jogadas: Tuple[int, ...], diretorio: str) -> str:
+    return os.path.join(diretorio, 'subtracao_' + '-'.join(map(str, jogadas)) + '.json')
+
+
+def carregar(jogadas: Iterable[int], diretorio: Optional[str] = DIRETORIO_CACHE) -> TabelaGrundy:
+    """
+    Tabela do conjunto de jogadas: lida do cache em disco se já foi gravada,
+    senão calculada até achar o período e gravada (diretorio=None desliga o
+    cache em disco)
+    """
+    jogadas = tuple(sorted(set(jogadas)))
+    caminho = _caminho_cache(jogadas, diretorio) if diretorio else None
+    if caminho and os.path.exists(caminho):
+        try:
+            with open(caminho, encoding='utf-8') as f:
+                dados = json.load(f)
+            if (dados.get('versao') == VERSAO and tuple(dados['jogadas']) == jogadas
+                    and len(dados['valores']) == dados['preperiodo'] + dados['periodo']):
+                return TabelaGrundy.de_json(dados)
+        except (ValueError, KeyError, TypeError, AttributeError):
+            pass  # cache corrompido ou incompleto: recalcular e regravar abaixo
+
+    tabela = TabelaGrundy(jogadas)
+    if tabela.encontrar_periodo() is not None and caminho:
+        os.makedirs(diretorio, exist_ok=True)
+        with open(caminho + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(tabela.para_json(), f)
+        os.replace(caminho + '.tmp', caminho)
+    return tabela
+
+
+@lru_cache(maxsize=64)
+def tabela(jogadas: Tuple[int, ...]) -> TabelaGrundy:
+    """carregar() memorizado no processo, para consultas repetidas do mesmo conjunto"""
+    return carregar(jogadas)
+
+
+def computador_escolhe_jogada(n: int, jogadas: Iterable[int]) -> Optional[int]:
+    """Como computador_escolhe_jogada dos jogos do NIM, para qualquer conjunto de jogadas"""
+    return tabela(tuple(sorted(set(jogadas)))).jogada(n)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Valores de Sprague-Grundy de um jogo de subtração")
+    parser.add_argument('jogadas', type=int, nargs='+', help="quantidades de peças que podem ser tiradas, ex.: 1 3 4")
+    parser.add_argument('--posicao', type=int, nargs='*', default=(), help="posições (número de peças) a consultar")
+    parser.add_argument('--diretorio', default=DIRETORIO_CACHE, help="diretório do cache das tabelas")
+    args = parser.parse_args()
+
+    resultado = carregar(args.jogadas, args.diretorio)
+    if resultado.periodo is None:
+        print(f"Nenhum período nas primeiras {LIMITE_TABELA} posições")
+    else:
+        periodo = resultado.valores[resultado.preperiodo:resultado.preperiodo + resultado.periodo]
+        print(f"Preperíodo {resultado.preperiodo}, período {resultado.periodo}: {periodo}")
+    for n in args.posicao:
+        g = resultado.valor(n)
+        situacao = f"vence tirando {resultado.jogada(n)}" if g else "perde"
+        print(f"n = {n}: Grundy {g}, quem joga {situacao}")
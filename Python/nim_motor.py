@@ -0,0 +1,143 @@
+from typing import Callable, Dict
+
+# Motor iterativo do jogo do NIM.
+#
+# Em jogo_nim*.py cada jogada é uma chamada de função: usuario() chama
+# computador(), que chama usuario(), ..., e o fim da partida chama
+# campeonato(), que chama main() de novo; uma entrada inválida também chama a
+# mesma função outra vez. A pilha cresce com o tamanho do jogo, e uma partida
+# com muitas peças e limite pequeno estoura o limite de recursão.
+#
+# Aqui o jogo é uma máquina de estados. EstadoNim guarda tudo o que a pilha
+# guardava (peças, limite, rodada, placar, de quem é a vez e a fase) e
+# MotorNim.executar() repete passo() num laço até a fase FIM, com pilha
+# constante para partidas de qualquer tamanho. Entradas inválidas apenas
+# mantêm a fase.
+#
+# Quem tira a última peça vence. Os jogadores são funções
+# (pecas, limite) -> peças a tirar; ler e escrever substituem input e print.
+
+USUARIO = 'usuario'
+COMPUTADOR = 'computador'
+
+# Fases do motor
+CONFIGURAR = 'configurar'
+JOGADA = 'jogada'
+FIM_PARTIDA = 'fim_partida'
+FIM = 'fim'
+
+Jogador = Callable[[int, int], int]
+
+
+def computador_escolhe_jogada(n: int, m: int) -> int:
+    """Peças que o computador tira: deixa um múltiplo de m + 1 sempre que possível"""
+    return n % (m + 1) or m
+
+
+def quem_comeca(n: int, m: int) -> str:
+    """O computador começa, a não ser que n já seja múltiplo de m + 1 (posição perdedora para quem joga)"""
+    return USUARIO if n % (m + 1) == 0 else COMPUTADOR
+
+
+def jogada_valida(j: int, n: int, m: int) -> bool:
+    return 1 <= j <= min(n, m)
+
+
+class EstadoNim:
+    """Estado explícito de um campeonato; uma partida isolada é um campeonato de uma rodada"""
+
+    def __init__(self, rodadas: int = 1):
+        self.rodadas = rodadas
+        self.rodada = 1
+        self.pecas = 0
+        self.limite = 0
+        self.vez = None
+        self.vencedor = None
+        self.placar = {USUARIO: 0, COMPUTADOR: 0}
+        self.fase = CONFIGURAR
+
+
+class MotorNim:
+    """Laço do jogo do NIM: cada passo() avança o estado uma fase, sem recursão"""
+
+    def __init__(self, rodadas: int = 1, jogadores: Dict[str, Jogador] = None,
+                 ler: Callable[[str], str] = input, escrever: Callable[..., None] = print):
+        self.estado = EstadoNim(rodadas)
+        self.ler = ler
+        self.escrever = escrever
+        self.jogadores = jogadores or {USUARIO: self.usuario_escolhe_jogada, COMPUTADOR: computador_escolhe_jogada}
+
+    def ler_inteiro(self, pergunta: str):
+        """Inteiro digitado, ou None se a entrada não for um número"""
+        try:
+            return int(self.ler(pergunta))
+        except ValueError:
+            return None
+
+    def usuario_escolhe_jogada(self, n: int, m: int):
+        """Jogada digitada pelo usuário (validada pelo motor)"""
+        return self.ler_inteiro("Quantas peças você vai tirar? ")
+
+    def executar(self) -> EstadoNim:
+        """Jogar todas as rodadas; devolve o estado final"""
+        while self.estado.fase != FIM:
+            self.passo()
+        return self.estado
+
+    def passo(self):
+        """Avançar uma fase"""
+        fase = self.estado.fase
+        if fase == CONFIGURAR:
+            self._configurar()
+        elif fase == JOGADA:
+            self._jogada()
+        elif fase == FIM_PARTIDA:
+            self._fim_partida()
+
+    def _configurar(self):
+        estado = self.estado
+        if estado.rodadas > 1:
+            self.escrever("**** Rodada", estado.rodada, "****\n")
+        n = self.ler_inteiro("Quantas peças? ")
+        m = self.ler_inteiro("Limite de peças por jogada? ")
+        if n is None or m is None or m < 1 or n < m:
+            self.escrever("\nOps! Houve um erro de digitação!\n")
+            return
+        estado.pecas, estado.limite = n, m
+        estado.vez = quem_comeca(n, m)
+        self.escrever("\nVocê começa!\n" if estado.vez == USUARIO else "\nComputador começa!\n")
+        estado.fase = JOGADA
+
+    def _jogada(self):
+        estado = self.estado
+        j = self.jogadores[estado.vez](estado.pecas, estado.limite)
+        if j is None or not jogada_valida(j, estado.pecas, estado.limite):
+            if estado.vez != USUARIO:
+                raise ValueError(f"Jogada inválida do {estado.vez}: {j} com {estado.pecas} peças e limite {estado.limite}")
+            self.escrever("\njogada inválida!\n")
+            return
+        estado.pecas -= j
+        if estado.vez == USUARIO:
+            self.escrever("\nVocê tirou", j, "peça(s).\nAgora restam", estado.pecas, "peças no tabuleiro\n")
+        else:
+            self.escrever("O computador tirou", j, "peça(s).\nAgora restam", estado.pecas, "peças no tabuleiro\n")
+        if estado.pecas == 0:
+            estado.vencedor = estado.vez
+            estado.fase = FIM_PARTIDA
+        else:
+            estado.vez = COMPUTADOR if estado.vez == USUARIO else USUARIO
+
+    def _fim_partida(self):
+        estado = self.estado
+        estado.placar[estado.vencedor] += 1
+        self.escrever("\nFim do jogo! O Usuário Venceu!\n" if estado.vencedor == USUARIO
+                      else "\nFim do jogo! O Computador Venceu!\n")
+        if estado.rodada < estado.rodadas:
+            estado.rodada += 1
+            estado.vencedor = None
+            estado.fase = CONFIGURAR
+            return
+        if estado.rodadas > 1:
+            self.escrever("**** Final do campeonato! ****\n\nPlacar: Você", estado.placar[USUARIO],
+                          "X", estado.placar[COMPUTADOR], "Computador\n\n")
+        estado.fase = FIM
@@ -0,0 +1,137 @@
+import argparse
+import operator
+from functools import reduce
+from typing import List, Optional, Sequence, Tuple
+
+import nim_motor
+
+# NIM com várias pilhas, cada uma com seu limite de peças por jogada (opcional).
+#
+# Com uma pilha só, a regra do computador é deixar um múltiplo de m + 1
+# (n % (m + 1) == 0 é posição perdedora). Com várias pilhas vale o teorema de
+# Sprague-Grundy: o valor de Grundy de uma pilha de n peças e limite m é
+# n % (m + 1) (n sem limite), e a posição é perdedora para quem joga quando o
+# XOR dos valores de todas as pilhas (a nim-soma) é zero. A jogada vencedora
+# leva a nim-soma a zero: escolhe-se uma pilha cujo valor g tem o bit mais
+# alto da nim-soma s e tiram-se g - (g ^ s) peças dela. Cada jogada custa
+# O(pilhas), instantânea mesmo com milhares de pilhas.
+#
+# O jogo interativo usa nim_motor: MotorNimMultiplo troca só a configuração e
+# a jogada; o estado guarda a lista de pilhas em pecas e a de limites em limite.
+
+Jogada = Tuple[int, int]  # (índice da pilha, peças a tirar)
+
+
+def grundy(n: int, m: Optional[int] = None) -> int:
+    """Valor de Grundy de uma pilha de n peças com limite m por jogada (None = sem limite)"""
+    return n if m is None else n % (m + 1)
+
+
+def _limites(pilhas: Sequence[int], limites: Optional[Sequence[Optional[int]]]) -> Sequence[Optional[int]]:
+    if limites is None:
+        return [None] * len(pilhas)
+    if len(limites) != len(pilhas):
+        raise ValueError(f"{len(pilhas)} pilhas e {len(limites)} limites")
+    return limites
+
+
+def nim_soma(pilhas: Sequence[int], limites: Sequence[Optional[int]] = None) -> int:
+    """XOR dos valores de Grundy das pilhas; zero = posição perdedora para quem joga"""
+    return reduce(operator.xor, map(grundy, pilhas, _limites(pilhas, limites)), 0)
+
+
+def jogada_valida(jogada: Jogada, pilhas: Sequence[int], limites: Sequence[Optional[int]] = None) -> bool:
+    i, j = jogada
+    if not 0 <= i < len(pilhas):
+        return False
+    m = _limites(pilhas, limites)[i]
+    return 1 <= j <= (pilhas[i] if m is None else min(pilhas[i], m))
+
+
+def computador_escolhe_jogada(pilhas: Sequence[int], limites: Sequence[Optional[int]] = None) -> Jogada:
+    """Jogada que zera a nim-soma; numa posição perdedora, tira uma peça da maior pilha"""
+    limites = _limites(pilhas, limites)
+    valores = list(map(grundy, pilhas, limites))
+    soma = reduce(operator.xor, valores, 0)
+    if soma == 0:
+        i = max(range(len(pilhas)), key=pilhas.__getitem__)
+        if pilhas[i] == 0:
+            raise ValueError("Não há peças no tabuleiro")
+        return i, 1
+    bit = 1 << (soma.bit_length() - 1)
+    for i, g in enumerate(valores):
+        if g & bit:
+            # g ^ soma < g; com limite, tirar g - (g ^ soma) <= g <= m peças deixa resto g ^ soma
+            return i, g - (g ^ soma)
+
+
+def quem_comeca(pilhas: Sequence[int], limites: Sequence[Optional[int]] = None) -> str:
+    """O computador começa, a não ser que a nim-soma já seja zero"""
+    return nim_motor.USUARIO if nim_soma(pilhas, limites) == 0 else nim_motor.COMPUTADOR
+
+
+def _ler_inteiros(texto: str) -> Optional[List[int]]:
+    try:
+        return [int(x) for x in texto.replace(',', ' ').split()]
+    except ValueError:
+        return None
+
+
+class MotorNimMultiplo(nim_motor.MotorNim):
+    """nim_motor.MotorNim com várias pilhas; jogadores: (pilhas, limites) -> (pilha, peças)"""
+
+    def __init__(self, rodadas: int = 1, jogadores=None, ler=input, escrever=print):
+        super().__init__(rodadas, jogadores, ler, escrever)
+        if jogadores is None:
+            self.jogadores = {nim_motor.USUARIO: self.usuario_escolhe_jogada,
+                              nim_motor.COMPUTADOR: computador_escolhe_jogada}
+
+    def usuario_escolhe_jogada(self, pilhas, limites) -> Optional[Jogada]:
+        jogada = _ler_inteiros(self.ler("Pilha (a partir de 1) e quantas peças você vai tirar? "))
+        if not jogada or len(jogada) != 2:
+            return None
+        return jogada[0] - 1, jogada[1]
+
+    def _configurar(self):
+        estado = self.estado
+        if estado.rodadas > 1:
+            self.escrever("**** Rodada", estado.rodada, "****\n")
+        pilhas = _ler_inteiros(self.ler("Quantas peças em cada pilha? "))
+        limites = _ler_inteiros(self.ler("Limite de peças por jogada em cada pilha (vazio = sem limite)? "))
+        if limites == []:
+            limites = [None] * len(pilhas or ())
+        if (not pilhas or limites is None or len(limites) != len(pilhas)
+                or any(n < 1 for n in pilhas) or any(m < 1 for m in limites if m is not None)):
+            self.escrever("\nOps! Houve um erro de digitação!\n")
+            return
+        estado.pecas, estado.limite = pilhas, limites
+        estado.vez = quem_comeca(pilhas, limites)
+        self.escrever("\nVocê começa!\n" if estado.vez == nim_motor.USUARIO else "\nComputador começa!\n")
+        estado.fase = nim_motor.JOGADA
+
+    def _jogada(self):
+        estado = self.estado
+        jogada = self.jogadores[estado.vez](estado.pecas, estado.limite)
+        if jogada is None or not jogada_valida(jogada, estado.pecas, estado.limite):
+            if estado.vez != nim_motor.USUARIO:
+                raise ValueError(f"Jogada inválida do {estado.vez}: {jogada} com pilhas {estado.pecas}")
+            self.escrever("\njogada inválida!\n")
+            return
+        i, j = jogada
+        estado.pecas[i] -= j
+        quem = "\nVocê tirou" if estado.vez == nim_motor.USUARIO else "O computador tirou"
+        self.escrever(f"{quem} {j} peça(s) da pilha {i + 1}.\nAgora as pilhas têm {estado.pecas} peças\n")
+        if not any(estado.pecas):
+            estado.vencedor = estado.vez
+            estado.fase = nim_motor.FIM_PARTIDA
+        else:
+            estado.vez = nim_motor.COMPUTADOR if estado.vez == nim_motor.USUARIO else nim_motor.USUARIO
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Jogo do NIM com várias pilhas")
+    parser.add_argument('--rodadas', type=int, default=1, help="rodadas do campeonato (padrão: partida única)")
+    args = parser.parse_args()
+
+    print("Bem-vindo ao jogo do NIM com várias pilhas!\n")
+    MotorNimMultiplo(args.rodadas).executar()
@@ -0,0 +1,171 @@
+import argparse
+import random
+import time
+from typing import Callable, Optional
+
+import numpy as np
+
+import nim_motor
+
+# Simulação do jogo do NIM sem console, para avaliar estratégias em escala.
+#
+# jogar() disputa uma partida entre dois jogadores quaisquer, funções
+# (pecas, limite) -> peças a tirar, sem input nem print; simular() põe uma
+# estratégia contra o computador de nim_motor, com a mesma regra de quem começa.
+#
+# simular_lote() joga um lote inteiro de partidas em conjunto com NumPy: n e m
+# são vetores (uma partida por posição) e a cada passo todas as partidas ainda
+# em andamento fazem uma jogada ao mesmo tempo. As estratégias vetoriais
+# recebem (pecas, limites, rng) como vetores e devolvem o vetor de jogadas.
+#
+# As partidas são separadas uma única vez por quem começa. Dentro de cada
+# grupo todas as partidas alternam juntas, então a cada passo só um jogador
+# joga, e só a sua estratégia é calculada. Partidas terminadas ficam nos
+# vetores (com zero peças e jogada zero) até que restem menos de
+# FRACAO_COMPACTAR delas em andamento; só então os vetores são compactados.
+# O vencedor sai da paridade do número de jogadas de cada partida. Quando
+# peças e limites cabem em int32, os vetores usam int32.
+
+ESTRATEGIAS = ('otima', 'gulosa', 'aleatoria')
+FRACAO_COMPACTAR = 0.75  # compactar quando as partidas em andamento caem abaixo desta fração dos vetores
+
+Jogador = Callable[[int, int], int]
+JogadorVetorial = Callable[[np.ndarray, np.ndarray, np.random.Generator], np.ndarray]
+
+
+def jogar(n: int, m: int, primeiro: Jogador, segundo: Jogador) -> int:
+    """Jogar uma partida; devolve 0 se o primeiro jogador tirou a última peça, 1 se foi o segundo"""
+    jogadores = (primeiro, segundo)
+    vez = 0
+    while True:
+        j = jogadores[vez](n, m)
+        if not nim_motor.jogada_valida(j, n, m):
+            raise ValueError(f"Jogada inválida do jogador {vez}: {j} com {n} peças e limite {m}")
+        n -= j
+        if n == 0:
+            return vez
+        vez = 1 - vez
+
+
+def simular(n: int, m: int, estrategia: Jogador, computador_comeca: bool = None) -> bool:
+    """Partida da estratégia contra o computador; devolve True se o computador venceu"""
+    if computador_comeca is None:
+        computador_comeca = nim_motor.quem_comeca(n, m) == nim_motor.COMPUTADOR
+    if computador_comeca:
+        return jogar(n, m, nim_motor.computador_escolhe_jogada, estrategia) == 0
+    return jogar(n, m, estrategia, nim_motor.computador_escolhe_jogada) == 1
+
+
+def gulosa(n: int, m: int) -> int:
+    """Tirar o máximo possível"""
+    return min(n, m)
+
+
+def aleatoria(semente=None) -> Jogador:
+    """Jogador que tira um número de peças sorteado entre as jogadas válidas"""
+    gerador = random.Random(semente)
+    return lambda n, m: gerador.randint(1, min(n, m))
+
+
+def otima_vetorial(n: np.ndarray, m: np.ndarray, rng: np.random.Generator = None) -> np.ndarray:
+    """computador_escolhe_jogada para vetores de partidas"""
+    resto = n % (m + 1)
+    return np.where(resto == 0, m, resto)
+
+
+def gulosa_vetorial(n: np.ndarray, m: np.ndarray, rng: np.random.Generator = None) -> np.ndarray:
+    return np.minimum(n, m)
+
+
+def aleatoria_vetorial(n: np.ndarray, m: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    return rng.integers(1, np.minimum(n, m) + 1)
+
+
+ESTRATEGIAS_VETORIAIS = {'otima': otima_vetorial, 'gulosa': gulosa_vetorial, 'aleatoria': aleatoria_vetorial}
+
+
+def _jogar_grupo(pecas: np.ndarray, limites: np.ndarray, jogadores, rng) -> np.ndarray:
+    """
+    Jogar em conjunto partidas em que jogadores[0] começa (pecas é alterado);
+    devolve True onde jogadores[0] tirou a última peça
+    """
+    primeiro_venceu = np.zeros(pecas.size, dtype=bool)
+    ativas = np.arange(pecas.size)
+    impar = np.zeros(pecas.size, dtype=bool)  # número ímpar de jogadas feitas
+    vivas = np.ones(pecas.size, dtype=bool)
+    n_vivas = pecas.size
+    vez = 0
+    while n_vivas:
+        jogar = jogadores[vez]
+        if n_vivas == pecas.size:
+            jogadas = jogar(pecas, limites, rng)
+        else:
+            # Partidas terminadas recebem uma posição válida qualquer e têm a jogada anulada
+            jogadas = np.multiply(jogar(np.maximum(pecas, 1), limites, rng), vivas)
+        # Em andamento: 1 <= jogada <= min(peças, limite); terminadas: jogada 0
+        invalidas = (jogadas < vivas) | (jogadas > np.minimum(pecas, limites))
+        if invalidas.any():
+            i = np.flatnonzero(invalidas)[0]
+            raise ValueError(f"Jogada inválida: {jogadas[i]} com {pecas[i]} peças e limite {limites[i]}")
+        pecas -= jogadas
+        np.logical_xor(impar, vivas, out=impar)
+        np.greater(pecas, 0, out=vivas)
+        n_vivas = np.count_nonzero(vivas)
+        if n_vivas < FRACAO_COMPACTAR * pecas.size:
+            terminadas = ~vivas
+            primeiro_venceu[ativas[terminadas]] = impar[terminadas]
+            ativas, pecas, limites, impar = ativas[vivas], pecas[vivas], limites[vivas], impar[vivas]
+            vivas = np.ones(n_vivas, dtype=bool)
+        vez = 1 - vez
+    return primeiro_venceu
+
+
+def simular_lote(n, m, estrategia: JogadorVetorial, computador_comeca=None,
+                 computador: JogadorVetorial = otima_vetorial, semente: Optional[int] = None) -> np.ndarray:
+    """
+    Partidas da estratégia contra o computador, uma por posição de n e m
+    (vetores ou escalares), jogadas em conjunto. Sem computador_comeca, vale a
+    regra de nim_motor.quem_comeca. Devolve um vetor booleano: True onde o
+    computador venceu.
+    """
+    n, m = np.broadcast_arrays(np.asarray(n, dtype=np.int64), np.asarray(m, dtype=np.int64))
+    pecas = n.ravel().copy()
+    limites = m.ravel()
+    if np.any(limites < 1) or np.any(pecas < 1):
+        raise ValueError("peças e limites devem ser positivos")
+    if pecas.size and max(pecas.max(), limites.max()) < np.iinfo(np.int32).max:
+        # Vetores com metade do tamanho: cada passo lê e escreve metade da memória
+        pecas, limites = pecas.astype(np.int32), limites.astype(np.int32)
+    if computador_comeca is None:
+        vez_computador = pecas % (limites + 1) != 0
+    else:
+        vez_computador = np.broadcast_to(np.asarray(computador_comeca, dtype=bool), pecas.shape).copy()
+    rng = np.random.default_rng(semente)
+
+    computador_venceu = np.empty(pecas.shape, dtype=bool)
+    comeca = np.flatnonzero(vez_computador)
+    computador_venceu[comeca] = _jogar_grupo(pecas[comeca], limites[comeca], (computador, estrategia), rng)
+    comeca = np.flatnonzero(~vez_computador)
+    computador_venceu[comeca] = ~_jogar_grupo(pecas[comeca], limites[comeca], (estrategia, computador), rng)
+    return computador_venceu.reshape(n.shape)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simular partidas de NIM de uma estratégia contra o computador")
+    parser.add_argument('--partidas', type=int, default=1_000_000)
+    parser.add_argument('--pecas', type=int, nargs=2, default=(1, 100), metavar=('MIN', 'MAX'),
+                        help="peças iniciais sorteadas neste intervalo")
+    parser.add_argument('--limite', type=int, nargs=2, default=(1, 10), metavar=('MIN', 'MAX'),
+                        help="limite por jogada sorteado neste intervalo")
+    parser.add_argument('--estrategia', choices=ESTRATEGIAS, default='aleatoria')
+    parser.add_argument('--semente', type=int)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.semente)
+    n = rng.integers(args.pecas[0], args.pecas[1] + 1, args.partidas)
+    m = rng.integers(args.limite[0], args.limite[1] + 1, args.partidas)
+    inicio = time.perf_counter()
+    venceu = simular_lote(n, m, ESTRATEGIAS_VETORIAIS[args.estrategia], semente=args.semente)
+    segundos = time.perf_counter() - inicio
+    print(f"{args.partidas} partidas em {segundos:.2f} s ({args.partidas / segundos:,.0f} partidas/s)")
+    print(f"Computador venceu {venceu.mean():.2%}; estratégia '{args.estrategia}' venceu {1 - venceu.mean():.2%}")
@@ -0,0 +1,175 @@
+import argparse
+import os
+from collections import defaultdict
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+import avaliacao_corpus
+import cache_assinaturas
+import cohpiah
+from indice_autores import IndiceAutores
+
+# Perfis de autores aprendidos de textos rotulados.
+#
+# Em vez de digitar a assinatura típica de um autor (le_assinatura), o perfil
+# é aprendido dos textos dele: a média das assinaturas e a variância de cada
+# traço. PerfilAutor guarda só estatísticas suficientes (número de textos,
+# média e soma dos quadrados dos desvios, como no algoritmo de Welford), que
+# podem ser combinadas exatamente (fórmula de Chan et al.); assim um perfil
+# cresce com textos novos sem rever os antigos, e perfis parciais calculados
+# em paralelo são somados no fim.
+#
+# O corpus rotulado tem um diretório por autor (autor/texto.txt), solto ou
+# dentro de um .zip/.tar. As assinaturas são calculadas em paralelo por
+# avaliacao_corpus (com o cache, se dado). Os perfis ficam no índice de
+# autores: a média é a assinatura indexada e os metadados guardam 'textos',
+# 'm2' e os 'arquivos' já incorporados, de modo que rodar de novo sobre o
+# mesmo corpus só processa os textos rotulados depois. Um autor indexado à
+# mão (indice_autores.py adicionar) tem a assinatura trocada pelo perfil.
+# Textos sem palavras também contam como incorporados: os de um autor que
+# ainda não tem perfil ficam em indice.sem_assinatura até ele ganhar um.
+# Textos soltos na raiz do corpus (sem diretório de autor) e textos ilegíveis
+# não são incorporados: são separados antes do cálculo e devolvidos em
+# `ignorados`, e voltam a ser considerados na próxima execução.
+
+
+class PerfilAutor:
+    """Média e variância por traço das assinaturas de um autor"""
+
+    def __init__(self, textos: int = 0, media=None, m2=None):
+        self.textos = textos
+        self.media = np.zeros(len(cohpiah.TRACOS)) if media is None else np.asarray(media, dtype=np.float64)
+        self.m2 = np.zeros(len(cohpiah.TRACOS)) if m2 is None else np.asarray(m2, dtype=np.float64)
+
+    def adicionar(self, assinatura):
+        """Incluir a assinatura de mais um texto"""
+        x = np.asarray(assinatura, dtype=np.float64)
+        self.textos += 1
+        delta = x - self.media
+        self.media = self.media + delta / self.textos
+        self.m2 = self.m2 + delta * (x - self.media)
+
+    def combinar(self, outro: 'PerfilAutor') -> 'PerfilAutor':
+        """Somar os textos de outro perfil do mesmo autor; devolve self"""
+        if outro.textos == 0:
+            return self
+        total = self.textos + outro.textos
+        delta = outro.media - self.media
+        self.media = self.media + delta * (outro.textos / total)
+        self.m2 = self.m2 + outro.m2 + delta ** 2 * (self.textos * outro.textos / total)
+        self.textos = total
+        return self
+
+    @property
+    def variancia(self) -> np.ndarray:
+        """Variância amostral de cada traço (zero com menos de dois textos)"""
+        return self.m2 / (self.textos - 1) if self.textos > 1 else np.zeros_like(self.m2)
+
+    def metadados(self) -> Dict:
+        """Estatísticas além da média, para guardar nos metadados do índice"""
+        return {'textos': self.textos, 'm2': self.m2.tolist(), 'variancia': self.variancia.tolist()}
+
+    @classmethod
+    def do_indice(cls, indice: IndiceAutores, autor: str) -> 'PerfilAutor':
+        """Perfil guardado no índice para um autor"""
+        metadados = indice.metadados_autor(autor)
+        return cls(metadados['textos'], indice.assinatura_autor(autor), metadados['m2'])
+
+
+def autor_do_texto(nome: str) -> str:
+    """Autor de um texto do corpus rotulado: o primeiro diretório do caminho"""
+    partes = nome.replace(os.sep, '/').split('/')
+    if len(partes) < 2:
+        raise ValueError(f"{nome}: o texto deve estar num diretório com o nome do autor")
+    return partes[0]
+
+
+def perfis(assinaturas: Iterable[Tuple[str, List[float]]]) -> Dict[str, PerfilAutor]:
+    """Perfis a partir de pares (autor, assinatura)"""
+    resultado = defaultdict(PerfilAutor)
+    for autor, assinatura in assinaturas:
+        resultado[autor].adicionar(assinatura)
+    return dict(resultado)
+
+
+def atualizar_indice(indice: IndiceAutores, origem: str, extensao: str = avaliacao_corpus.EXTENSAO_PADRAO,
+                     processos: int = None, cache: cache_assinaturas.CacheAssinaturas = None,
+                     ignorados: List[Tuple[str, str]] = None) -> Tuple[int, int]:
+    """
+    Incorporar ao índice os textos rotulados da origem que ainda não estão nos
+    perfis. Devolve (textos novos, autores criados ou alterados); os textos
+    fora de um diretório de autor ou ilegíveis vão para `ignorados`, se dada,
+    como (nome, motivo).
+    """
+    ignorados = [] if ignorados is None else ignorados
+    incorporados = {arquivo for metadados in indice.metadados for arquivo in metadados.get('arquivos', ())}
+    incorporados.update(arquivo for nomes in indice.sem_assinatura.values() for arquivo in nomes)
+    novos = []
+    for nome in avaliacao_corpus.listar_textos(origem, extensao):
+        if nome in incorporados:
+            continue
+        try:
+            autor_do_texto(nome)
+        except ValueError:
+            # Checado antes de calcular as assinaturas, para não perder o trabalho dos outros textos
+            ignorados.append((nome, "fora de um diretório de autor"))
+            continue
+        novos.append(nome)
+    if not novos:
+        return 0, 0
+
+    ilegiveis = len(ignorados)
+    assinaturas = avaliacao_corpus.calcular_assinaturas(origem, extensao, processos, cache=cache, nomes=novos,
+                                                        ignorados=ignorados)
+    ilegiveis = len(ignorados) - ilegiveis
+    arquivos = defaultdict(list)
+    validas = []
+    for nome, assinatura in assinaturas:
+        arquivos[autor_do_texto(nome)].append(nome)
+        if assinatura is not None:
+            validas.append((autor_do_texto(nome), assinatura))
+
+    novos_perfis = perfis(validas)
+    for autor, nomes_autor in arquivos.items():
+        perfil = novos_perfis.get(autor, PerfilAutor())
+        if autor in indice:
+            metadados = indice.metadados_autor(autor)
+            anteriores = metadados.get('arquivos', [])
+            if 'textos' in metadados:
+                perfil = PerfilAutor.do_indice(indice, autor).combinar(perfil)
+            if perfil.textos:
+                indice.substituir(autor, perfil.media, {**perfil.metadados(), 'arquivos': anteriores + nomes_autor})
+            else:
+                # Autor indexado à mão sem nenhum texto novo com palavras: a assinatura fica, os arquivos são registrados
+                metadados['arquivos'] = anteriores + nomes_autor
+            continue
+
+        # Textos lidos em execuções anteriores, quando o autor ainda não tinha nenhum com palavras
+        nomes_autor = indice.sem_assinatura.pop(autor, []) + nomes_autor
+        if perfil.textos:
+            indice.adicionar(autor, perfil.media, {**perfil.metadados(), 'arquivos': nomes_autor})
+        else:
+            indice.sem_assinatura[autor] = nomes_autor
+    return len(novos) - ilegiveis, len(arquivos)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Aprender perfis de autores a partir de textos rotulados")
+    parser.add_argument('indice', help="diretório do índice de autores")
+    parser.add_argument('origem', help="diretório ou .zip/.tar com um subdiretório por autor")
+    parser.add_argument('--extensao', default=avaliacao_corpus.EXTENSAO_PADRAO)
+    parser.add_argument('--processos', type=int, help="número de processos (padrão: todos os núcleos)")
+    parser.add_argument('--cache', help="banco SQLite do cache de assinaturas")
+    args = parser.parse_args()
+
+    indice = IndiceAutores.carregar(args.indice)
+    cache = cache_assinaturas.CacheAssinaturas(args.cache) if args.cache else None
+    ignorados = []
+    textos, autores = atualizar_indice(indice, args.origem, args.extensao, args.processos, cache, ignorados)
+    indice.salvar(args.indice)
+    print(f"✅ {textos} textos novos em {autores} perfis ({len(indice)} autores no índice)")
+    if ignorados:
+        print(f"⚠️  {len(ignorados)} textos ignorados:")
+        for nome, motivo in ignorados:
+            print(f"   {nome}: {motivo}")
@@ -0,0 +1,211 @@
+import argparse
+import zlib
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Set, Tuple
+
+import numpy as np
+
+import avaliacao_corpus
+import LabCohPiah2
+
+# Detecção de redações quase idênticas (cópias com pequenas alterações).
+#
+# Os seis traços de COH-PIAH não distinguem uma cópia de um texto apenas
+# parecido, e comparar todos os pares de textos é O(n²). Aqui cada texto vira
+# o conjunto dos seus shingles (sequências de k palavras consecutivas, com a
+# mesma tokenização de separa_sentencas / separa_frases / separa_palavras, em
+# minúsculas) e esse conjunto é resumido por uma assinatura MinHash: a
+# fração de posições iguais entre duas assinaturas estima a similaridade de
+# Jaccard entre os conjuntos.
+#
+# Para não comparar todos os pares, as assinaturas são divididas em `bandas`
+# faixas de `linhas` valores (LSH): dois textos viram candidatos quando
+# alguma faixa inteira coincide. A probabilidade disso para similaridade s é
+# 1 - (1 - s^linhas)^bandas, uma curva em S com o meio em cerca de
+# (1/bandas)^(1/linhas): 0,71 com o padrão de 16 faixas de 8 linhas. Só os
+# candidatos têm a similaridade estimada e comparada com o limiar, então o
+# custo é quase linear no número de textos.
+#
+# Textos que não podem ser lidos ou decodificados são pulados (e listados em
+# `ignorados`, se dada) sem interromper a varredura.
+
+SHINGLE = 5
+BANDAS = 16
+LINHAS = 8
+LIMIAR = 0.8
+SEMENTE = 20240601
+_BLOCO_SHINGLES = 4096  # shingles por bloco no cálculo da assinatura
+_MULTIPLICADOR = np.uint64(0x9E3779B97F4A7C15)
+
+
+def palavras_texto(texto: str) -> List[str]:
+    """Palavras do texto em minúsculas, com a tokenização do laboratório"""
+    palavras = []
+    for sentenca in LabCohPiah2.separa_sentencas(texto):
+        for frase in LabCohPiah2.separa_frases(sentenca):
+            palavras.extend(palavra.lower() for palavra in LabCohPiah2.separa_palavras(frase))
+    return palavras
+
+
+def misturar(x: np.ndarray) -> np.ndarray:
+    """Finalizador do splitmix64: espalha os bits de cada valor uint64"""
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+def shingles(palavras: List[str], k: int = SHINGLE) -> np.ndarray:
+    """Hashes de 64 bits dos shingles de k palavras (distintos); um texto curto é um único shingle"""
+    if not palavras:
+        return np.empty(0, dtype=np.uint64)
+    codigos = np.fromiter((zlib.crc32(p.encode('utf-8', 'surrogatepass')) for p in palavras),
+                          dtype=np.uint64, count=len(palavras))
+    k = min(k, len(codigos))
+    n = len(codigos) - k + 1
+    valores = np.zeros(n, dtype=np.uint64)
+    for j in range(k):
+        # Polinômio nas palavras da janela (aritmética módulo 2^64)
+        valores = valores * _MULTIPLICADOR + codigos[j:j + n]
+    return np.unique(misturar(valores))
+
+
+class MinHash:
+    """Família de n_permutacoes funções de hash (multiplicação-adição módulo 2^64)"""
+
+    def __init__(self, n_permutacoes: int = BANDAS * LINHAS, semente: int = SEMENTE):
+        gerador = np.random.default_rng(semente)
+        self.a = gerador.integers(0, 2 ** 64, n_permutacoes, dtype=np.uint64, endpoint=False) | np.uint64(1)
+        self.b = gerador.integers(0, 2 ** 64, n_permutacoes, dtype=np.uint64, endpoint=False)
+
+    def assinatura(self, valores: np.ndarray) -> np.ndarray:
+        """Mínimo de cada função sobre o conjunto de shingles"""
+        minimos = np.full(len(self.a), np.iinfo(np.uint64).max, dtype=np.uint64)
+        for inicio in range(0, len(valores), _BLOCO_SHINGLES):
+            bloco = valores[inicio:inicio + _BLOCO_SHINGLES, None]
+            np.minimum(minimos, (bloco * self.a + self.b).min(axis=0), out=minimos)
+        return minimos
+
+    def assinatura_texto(self, texto: str, k: int = SHINGLE) -> np.ndarray:
+        """Assinatura MinHash de um texto; None se o texto não tem palavras"""
+        valores = shingles(palavras_texto(texto), k)
+        return self.assinatura(valores) if len(valores) else None
+
+
+def similaridade(a: np.ndarray, b: np.ndarray) -> float:
+    """Similaridade de Jaccard estimada por duas assinaturas MinHash"""
+    return float(np.count_nonzero(a == b)) / len(a)
+
+
+class IndiceLSH:
+    """Índice LSH por faixas de assinaturas MinHash"""
+
+    def __init__(self, bandas: int = BANDAS, linhas: int = LINHAS):
+        self.bandas = bandas
+        self.linhas = linhas
+        self.assinaturas = {}
+        self._baldes = [defaultdict(list) for _ in range(bandas)]
+
+    def _faixas(self, assinatura: np.ndarray) -> Iterable[Tuple[int, bytes]]:
+        if len(assinatura) != self.bandas * self.linhas:
+            raise ValueError(f"Assinatura deve ter {self.bandas * self.linhas} valores, recebida {len(assinatura)}")
+        for banda in range(self.bandas):
+            yield banda, assinatura[banda * self.linhas:(banda + 1) * self.linhas].tobytes()
+
+    def adicionar(self, chave, assinatura: np.ndarray):
+        """Indexar a assinatura de um texto"""
+        self.assinaturas[chave] = assinatura
+        for banda, faixa in self._faixas(assinatura):
+            self._baldes[banda][faixa].append(chave)
+
+    def consultar(self, assinatura: np.ndarray) -> Set:
+        """Chaves que coincidem com a assinatura em pelo menos uma faixa"""
+        return {chave for banda, faixa in self._faixas(assinatura) for chave in self._baldes[banda].get(faixa, ())}
+
+    def pares_candidatos(self) -> Set[Tuple]:
+        """Pares (a, b) de chaves que dividem algum balde, com a antes de b na ordem de inserção"""
+        ordem = {chave: i for i, chave in enumerate(self.assinaturas)}
+        pares = set()
+        for baldes in self._baldes:
+            for chaves in baldes.values():
+                for i, a in enumerate(chaves):
+                    for b in chaves[i + 1:]:
+                        pares.add((a, b) if ordem[a] < ordem[b] else (b, a))
+        return pares
+
+    def quase_duplicados(self, limiar: float = LIMIAR) -> List[Tuple[object, object, float]]:
+        """Pares candidatos com similaridade estimada >= limiar, da maior para a menor"""
+        pares = []
+        for a, b in self.pares_candidatos():
+            s = similaridade(self.assinaturas[a], self.assinaturas[b])
+            if s >= limiar:
+                pares.append((a, b, s))
+        return sorted(pares, key=lambda par: -par[2])
+
+
+def _assinaturas_lote(origem: str, nomes: List[str], encoding: str, k: int, n_permutacoes: int,
+                      semente: int) -> Tuple[List[Tuple[str, np.ndarray]], List[Tuple[str, str]]]:
+    """Worker: assinaturas MinHash de um lote de textos e os textos ignorados, com o motivo"""
+    minhash = MinHash(n_permutacoes, semente)
+    resultados = []
+    ignorados = []
+    with avaliacao_corpus.abrir_origem(origem) as abrir:
+        for nome in nomes:
+            try:
+                with abrir(nome) as arquivo:
+                    texto = arquivo.read().decode(encoding)
+            except (UnicodeDecodeError, OSError) as erro:
+                ignorados.append((nome, f"{type(erro).__name__}: {erro}"))
+                continue
+            resultados.append((nome, minhash.assinatura_texto(texto, k)))
+    return resultados, ignorados
+
+
+def quase_duplicados_corpus(origem: str, extensao: str = avaliacao_corpus.EXTENSAO_PADRAO,
+                            limiar: float = LIMIAR, k: int = SHINGLE, bandas: int = BANDAS,
+                            linhas: int = LINHAS, processos: int = None, tamanho_lote: int = 256,
+                            encoding: str = 'utf-8',
+                            ignorados: List[Tuple[str, str]] = None) -> List[Tuple[str, str, float]]:
+    """
+    Pares de textos da origem com similaridade de Jaccard estimada >= limiar;
+    os textos ilegíveis vão para `ignorados`, se dada, como (nome, motivo)
+    """
+    nomes = avaliacao_corpus.listar_textos(origem, extensao)
+    lotes = [nomes[i:i + tamanho_lote] for i in range(0, len(nomes), tamanho_lote)]
+    indice = IndiceLSH(bandas, linhas)
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+        futuros = [executor.submit(_assinaturas_lote, origem, lote, encoding, k, bandas * linhas, SEMENTE)
+                   for lote in lotes]
+        for futuro in futuros:
+            resultados, ignorados_lote = futuro.result()
+            for nome, assinatura in resultados:
+                if assinatura is not None:
+                    indice.adicionar(nome, assinatura)
+            if ignorados is not None:
+                ignorados.extend(ignorados_lote)
+    return indice.quase_duplicados(limiar)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Encontrar redações quase idênticas num corpus (MinHash + LSH)")
+    parser.add_argument('origem', help="diretório ou arquivo .zip/.tar com os textos")
+    parser.add_argument('--extensao', default=avaliacao_corpus.EXTENSAO_PADRAO)
+    parser.add_argument('--limiar', type=float, default=LIMIAR, help="similaridade de Jaccard mínima")
+    parser.add_argument('--shingle', type=int, default=SHINGLE, help="palavras por shingle")
+    parser.add_argument('--bandas', type=int, default=BANDAS)
+    parser.add_argument('--linhas', type=int, default=LINHAS)
+    parser.add_argument('--processos', type=int, help="número de processos (padrão: todos os núcleos)")
+    parser.add_argument('--encoding', default='utf-8')
+    args = parser.parse_args()
+
+    ignorados = []
+    pares = quase_duplicados_corpus(args.origem, args.extensao, args.limiar, args.shingle,
+                                    args.bandas, args.linhas, args.processos, encoding=args.encoding,
+                                    ignorados=ignorados)
+    print(f"{len(pares)} pares de textos quase idênticos:")
+    for a, b, s in pares:
+        print(f"  {s:.2f}  {a}  ~  {b}")
+    if ignorados:
+        print(f"⚠️  {len(ignorados)} textos ignorados por não poderem ser lidos:")
+        for nome, motivo in ignorados:
+            print(f"   {nome}: {motivo}")
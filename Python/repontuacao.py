@@ -0,0 +1,233 @@
+import argparse
+import glob
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Tuple
+
+import instrumentos
+
+# Repontuação do histórico de triagens sob uma nova versão do instrumento.
+#
+# Quando pesos ou perguntas mudam, as pontuações gravadas ficam desatualizadas.
+# Como as respostas brutas são guardadas (no formato compacto de coorte ou no
+# campo 'respostas' dos JSON gravados pelas ferramentas), todas as pontuações
+# podem ser derivadas de novo. O trabalho é dividido em lotes processados em
+# paralelo; cada lote concluído é registrado no arquivo de progresso, então
+# rodar o mesmo comando outra vez continua de onde parou. Na coorte o progresso
+# é o índice de cada lote (as linhas não mudam); nos JSON são os nomes dos
+# arquivos já repontuados, então arquivos acrescentados entre as execuções
+# entram na próxima e os lotes podem mudar de tamanho. O arquivo de progresso
+# também acumula as contagens, para o resumo cobrir todas as execuções.
+#
+# Cada JSON é pontuado com o instrumento que ele mesmo registra ('instrumento'
+# ou 'instrument'), então um diretório com resultados em inglês e em português
+# é repontuado de uma vez. Arquivos de outro instrumento, ou cujas respostas
+# não correspondem às perguntas da versão alvo, são pulados e contados, como os
+# arquivos sem respostas brutas, em vez de interromper o lote.
+
+ARQUIVO_PROGRESSO = 'progresso.json'
+ARQUIVO_PONTUACOES = 'pontuacoes.npy'
+ARQUIVO_COLUNAS = 'colunas.json'
+
+
+def _carregar_progresso(destino: str, parametros: Dict, n_contagens: int) -> Tuple[List, List[int]]:
+    """
+    Ler o que já foi concluído (índices de lotes ou nomes de arquivos) e as
+    n_contagens acumuladas, conferindo se o trabalho é o mesmo
+    """
+    caminho = os.path.join(destino, ARQUIVO_PROGRESSO)
+    if not os.path.exists(caminho):
+        return [], [0] * n_contagens
+    with open(caminho, encoding='utf-8') as f:
+        progresso = json.load(f)
+    if progresso['parametros'] != parametros:
+        raise ValueError(f"{caminho} pertence a outra repontuação: {progresso['parametros']}")
+    # Progresso gravado antes das contagens acumuladas: só 'lotes_concluidos'
+    concluidos = progresso.get('concluidos', progresso.get('lotes_concluidos', []))
+    return concluidos, progresso.get('contagens', [0] * n_contagens)
+
+
+def _gravar_progresso(destino: str, parametros: Dict, concluidos: List, total: int, contagens: List[int]):
+    """Gravar o progresso de forma atômica (arquivo temporário + rename)"""
+    caminho = os.path.join(destino, ARQUIVO_PROGRESSO)
+    temporario = caminho + '.tmp'
+    with open(temporario, 'w', encoding='utf-8') as f:
+        json.dump({'parametros': parametros,
+                   'concluidos': sorted(concluidos),
+                   'total': total,
+                   'contagens': contagens}, f, indent=2)
+    os.replace(temporario, caminho)
+
+
+def _repontuar_lote_coorte(origem: str, destino: str, instrumento: str, versao: str, inicio: int, fim: int):
+    """Worker: pontuar as linhas [inicio, fim) da coorte e gravar na saída mapeada"""
+    import numpy as np
+    import coorte
+
+    _, respostas = coorte.carregar_coorte(origem)
+    saida = np.load(os.path.join(destino, ARQUIVO_PONTUACOES), mmap_mode='r+')
+    saida[inicio:fim] = instrumentos.pontuar_matriz(respostas[inicio:fim], instrumento, versao)
+    saida.flush()
+    return (fim - inicio,)
+
+
+def _instrumento_base(instrumento: str) -> str:
+    """Instrumento canônico de uma variante localizada (ex.: bipolar_pt -> bipolar)"""
+    return instrumentos.LOCALIZADOS.get(instrumento, (instrumento, None))[0]
+
+
+def _repontuar_lote_json(arquivos: List[str], destino: str, instrumento: str, versao: str):
+    """
+    Worker: repontuar um lote de resultados JSON, gravando cópias atualizadas no
+    destino. Devolve (repontuados, sem respostas brutas, incompatíveis).
+    """
+    sem_respostas = 0
+    incompativeis = 0
+    for arquivo in arquivos:
+        with open(arquivo, encoding='utf-8') as f:
+            resultado = json.load(f)
+        # Ferramentas em português gravam 'respostas'; a versão em inglês, 'raw_responses'
+        respostas = resultado.get('respostas') or resultado.get('raw_responses')
+        if not respostas:
+            sem_respostas += 1
+            continue
+
+        # O instrumento registrado no arquivo (variantes localizadas usam as chaves do seu idioma);
+        # resultados antigos, sem o campo, são do instrumento pedido
+        instrumento_arquivo = resultado.get('instrumento') or resultado.get('instrument') or instrumento
+        if _instrumento_base(instrumento_arquivo) != _instrumento_base(instrumento):
+            incompativeis += 1
+            continue
+
+        chave_pontuacoes = 'scores' if 'scores' in resultado else 'pontuacoes'
+        chave_versao = 'version' if 'version' in resultado else 'versao'
+        try:
+            resultado[chave_pontuacoes] = instrumentos.pontuar(respostas, instrumento_arquivo, versao)
+        except ValueError:
+            # Número de respostas diferente das perguntas da versão alvo
+            incompativeis += 1
+            continue
+        resultado['versao_original'] = resultado.get(chave_versao)
+        resultado[chave_versao] = versao
+
+        with open(os.path.join(destino, os.path.basename(arquivo)), 'w', encoding='utf-8') as f:
+            json.dump(resultado, f, indent=2, ensure_ascii=False)
+    return len(arquivos) - sem_respostas - incompativeis, sem_respostas, incompativeis
+
+
+def _executar_lotes(tarefas: List[Tuple[List, tuple]], funcao, destino: str, parametros: Dict,
+                    concluidos: List, contagens: List[int], total: int,
+                    processos: int = None) -> Tuple[List[int], List[int]]:
+    """
+    Rodar os lotes pendentes num pool de processos. Cada tarefa é (itens,
+    argumentos do worker); quando ela termina, os itens entram em concluidos e
+    as contagens devolvidas pelo worker (uma tupla) são somadas às acumuladas,
+    e o progresso é gravado. Devolve (contagens desta execução, acumuladas).
+    """
+    print(f"Progresso: {len(concluidos)}/{total} já concluídos, {len(tarefas)} lotes pendentes")
+
+    nesta_execucao = [0] * len(contagens)
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+        futuros = {executor.submit(funcao, *args): itens for itens, args in tarefas}
+        for futuro in as_completed(futuros):
+            resultado = futuro.result()
+            nesta_execucao = [a + b for a, b in zip(nesta_execucao, resultado)]
+            contagens = [a + b for a, b in zip(contagens, resultado)]
+            concluidos.extend(futuros[futuro])
+            _gravar_progresso(destino, parametros, concluidos, total, contagens)
+            print(f"  lote concluído ({len(concluidos)}/{total})")
+    return nesta_execucao, contagens
+
+
+def repontuar_coorte(origem: str, destino: str, versao: str = None,
+                     tamanho_lote: int = 100000, processos: int = None):
+    """
+    Repontuar uma coorte no formato compacto. As pontuações vão para
+    destino/pontuacoes.npy (n_respondentes x n_subescalas + 1).
+    """
+    import numpy as np
+    import coorte
+
+    meta, respostas = coorte.carregar_coorte(origem)
+    instrumento = meta['instrumento']
+    versao = versao or instrumentos.VERSAO_ATUAL[instrumento]
+    definicao = instrumentos.obter_versao(instrumento, versao)
+    if instrumentos.numero_perguntas(definicao) != respostas.shape[1]:
+        raise ValueError(f"A versão {versao} tem {instrumentos.numero_perguntas(definicao)} perguntas; "
+                         f"a coorte foi coletada com {respostas.shape[1]}")
+
+    os.makedirs(destino, exist_ok=True)
+    parametros = {'origem': os.path.abspath(origem), 'instrumento': instrumento, 'versao': versao,
+                  'tamanho_lote': tamanho_lote}
+    colunas = instrumentos.colunas_pontuacao(instrumento, versao)
+
+    caminho_saida = os.path.join(destino, ARQUIVO_PONTUACOES)
+    if not os.path.exists(caminho_saida):
+        np.lib.format.open_memmap(caminho_saida, mode='w+', dtype=np.float64,
+                                  shape=(respostas.shape[0], len(colunas))).flush()
+        with open(os.path.join(destino, ARQUIVO_COLUNAS), 'w', encoding='utf-8') as f:
+            json.dump({'colunas': colunas, 'instrumento': instrumento, 'versao': versao}, f, indent=2)
+
+    concluidos, contagens = _carregar_progresso(destino, parametros, 1)
+    feitos = set(concluidos)
+    inicios = range(0, respostas.shape[0], tamanho_lote)
+    tarefas = [([i], (origem, destino, instrumento, versao, inicio, min(inicio + tamanho_lote, respostas.shape[0])))
+               for i, inicio in enumerate(inicios) if i not in feitos]
+
+    nesta_execucao, contagens = _executar_lotes(tarefas, _repontuar_lote_coorte, destino, parametros,
+                                                concluidos, contagens, len(inicios), processos)
+    print(f"✅ {contagens[0]} respondentes repontuados com a versão {versao} ({nesta_execucao[0]} nesta execução)")
+
+
+def repontuar_resultados(origem: str, destino: str, instrumento: str, versao: str = None,
+                         tamanho_lote: int = 1000, processos: int = None):
+    """Repontuar um diretório de resultados JSON gravados pelas ferramentas de triagem"""
+    versao = versao or instrumentos.VERSAO_ATUAL[instrumento]
+    instrumentos.obter_versao(instrumento, versao)
+
+    os.makedirs(destino, exist_ok=True)
+    # O progresso é por arquivo, então o tamanho do lote pode mudar entre as execuções
+    parametros = {'origem': os.path.abspath(origem), 'instrumento': instrumento, 'versao': versao}
+    concluidos, contagens = _carregar_progresso(destino, parametros, 3)
+
+    # Com destino == origem, o arquivo de progresso também está no diretório
+    arquivos = [a for a in sorted(glob.glob(os.path.join(origem, '*.json')))
+                if os.path.basename(a) != ARQUIVO_PROGRESSO]
+    feitos = set(concluidos)
+    pendentes = [a for a in arquivos if os.path.basename(a) not in feitos]
+    tarefas = []
+    for inicio in range(0, len(pendentes), tamanho_lote):
+        lote = pendentes[inicio:inicio + tamanho_lote]
+        tarefas.append(([os.path.basename(a) for a in lote], (lote, destino, instrumento, versao)))
+
+    nesta_execucao, contagens = _executar_lotes(tarefas, _repontuar_lote_json, destino, parametros,
+                                                concluidos, contagens, len(feitos) + len(pendentes), processos)
+    repontuados, sem_respostas, incompativeis = contagens
+    print(f"✅ {repontuados} resultados repontuados com a versão {versao} ({nesta_execucao[0]} nesta execução)")
+    if sem_respostas:
+        print(f"⚠️  {sem_respostas} resultados sem respostas brutas não puderam ser repontuados")
+    if incompativeis:
+        print(f"⚠️  {incompativeis} resultados de outro instrumento ou com respostas incompatíveis "
+              f"com a versão {versao} foram pulados")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Repontuar o histórico de triagens sob uma nova versão do instrumento")
+    parser.add_argument('origem', help="diretório da coorte compacta ou dos resultados JSON")
+    parser.add_argument('destino', help="diretório de saída (também guarda o progresso)")
+    parser.add_argument('--instrumento', choices=instrumentos.nomes_instrumentos(),
+                        help="obrigatório para resultados JSON; coortes já registram o instrumento")
+    parser.add_argument('--versao', help="versão alvo (padrão: a atual)")
+    parser.add_argument('--lote', type=int, help="tamanho de cada lote")
+    parser.add_argument('--processos', type=int, help="número de processos (padrão: todos os núcleos)")
+    args = parser.parse_args()
+
+    # Coortes compactas têm meta.json (veja coorte.py); o resto é tratado como diretório de JSON
+    if os.path.exists(os.path.join(args.origem, 'meta.json')):
+        repontuar_coorte(args.origem, args.destino, args.versao, args.lote or 100000, args.processos)
+    elif args.instrumento:
+        repontuar_resultados(args.origem, args.destino, args.instrumento, args.versao,
+                             args.lote or 1000, args.processos)
+    else:
+        parser.error("--instrumento é obrigatório para diretórios de resultados JSON")
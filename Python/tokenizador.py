@@ -0,0 +1,63 @@
+import re
+from typing import Iterator, Tuple
+
+# Tokenização do COH-PIAH por intervalos, sem cópias do texto.
+#
+# separa_sentencas, separa_frases e separa_palavras devolvem listas de
+# substrings novas a cada chamada. As funções daqui percorrem o texto original
+# com expressões pré-compiladas (finditer com pos/endpos) e devolvem apenas
+# intervalos [inicio, fim); quem precisa só de tamanhos nunca cria as
+# substrings. Os limites são exatamente os das funções do laboratório:
+#   sentencas -> re.split(r'[.!?]+') sem o '' final
+#   frases    -> re.split(r'[,:;]+')
+#   palavras  -> str.split()
+# tokens() divide o texto em sequências máximas de uma só classe (palavra,
+# separador de sentença, separador de frase ou espaço), a base de
+# cohpiah.ContadorAssinatura.
+
+ESPACO = 0
+PALAVRA = 1
+SEPARADOR_SENTENCA = 2
+SEPARADOR_FRASE = 3
+
+# O grupo que casou é o tipo do token; espaço não tem grupo (lastindex None)
+TOKEN = re.compile(r'([^\s.!?,:;]+)|([.!?]+)|([,:;]+)|\s+')
+SEQUENCIA_PALAVRA = re.compile(r'[^\s.!?,:;]+')
+SEQUENCIA_SENTENCA = re.compile(r'[.!?]+')
+SEQUENCIA_FRASE = re.compile(r'[,:;]+')
+_NAO_ESPACO = re.compile(r'\S+')
+
+
+def tokens(texto: str, inicio: int = 0, fim: int = None) -> Iterator[Tuple[int, int, int]]:
+    """(tipo, inicio, fim) de cada token de texto[inicio:fim]"""
+    for token in TOKEN.finditer(texto, inicio, len(texto) if fim is None else fim):
+        yield token.lastindex or ESPACO, token.start(), token.end()
+
+
+def _entre_separadores(separador, texto: str, inicio: int, fim: int) -> Iterator[Tuple[int, int]]:
+    """Intervalos entre as ocorrências do separador, como re.split"""
+    anterior = inicio
+    for ocorrencia in separador.finditer(texto, inicio, fim):
+        yield anterior, ocorrencia.start()
+        anterior = ocorrencia.end()
+    yield anterior, fim
+
+
+def sentencas(texto: str, inicio: int = 0, fim: int = None) -> Iterator[Tuple[int, int]]:
+    """Intervalos das sentenças, como separa_sentencas"""
+    fim = len(texto) if fim is None else fim
+    for a, b in _entre_separadores(SEQUENCIA_SENTENCA, texto, inicio, fim):
+        # separa_sentencas descarta só a sentença vazia do fim
+        if a < b or b < fim:
+            yield a, b
+
+
+def frases(texto: str, inicio: int = 0, fim: int = None) -> Iterator[Tuple[int, int]]:
+    """Intervalos das frases de texto[inicio:fim], como separa_frases"""
+    return _entre_separadores(SEQUENCIA_FRASE, texto, inicio, len(texto) if fim is None else fim)
+
+
+def palavras(texto: str, inicio: int = 0, fim: int = None) -> Iterator[Tuple[int, int]]:
+    """Intervalos das palavras de texto[inicio:fim], como separa_palavras"""
+    for palavra in _NAO_ESPACO.finditer(texto, inicio, len(texto) if fim is None else fim):
+        yield palavra.span()
@@ -0,0 +1,762 @@
+import numpy as np
+import functools
+import math
+from typing import Dict, List
+import json
+from datetime import datetime
+
+import idiomas
+import instrumentos
+from aquecimento import Aquecimento, uma_vez
+from escores_preparados import EscoresPreparados
+
+# Triagem para transtorno bipolar, a mesma em todos os idiomas.
+#
+# bibpolar-assessment.py (inglês) e bibpolar-assessment-PT.py (português) só
+# chamam main('en') ou main('pt'). Aplicação das perguntas, verificação de
+# segurança, painéis do relatório, análise impressa, gravação do JSON e menu
+# ficam aqui uma única vez; tudo o que muda entre idiomas (textos, rótulos,
+# recursos de crise, nomes dos campos do JSON, tamanhos de fonte e o guia de
+# medicamentos do pacote português) vem da seção "interface" do pacote de
+# idioma (idiomas/bipolar.<idioma>.json).
+#
+# As pontuações usam as chaves localizadas do idioma, como nos JSON já
+# gravados; as subescalas com papel especial (episódios de humor, risco geral)
+# são encontradas pela chave canônica.
+
+# matplotlib, pandas e seaborn levam segundos para importar; eles são carregados
+# por _configurar_graficos(), que a triagem interativa executa numa thread em
+# segundo plano enquanto as perguntas são respondidas
+plt = None
+pd = None
+sns = None
+
+SUBESCALAS_HUMOR = ('Manic_Episodes', 'Depressive_Episodes', 'Mixed_Episodes',
+                    'Sleep_Patterns', 'Functional_Impairment')
+SUBESCALAS_IMPACTO = ('Functional_Impairment', 'Sleep_Patterns')
+
+# Pontuações de exemplo do modo demo, por chave canônica
+PONTUACOES_DEMO = {
+    'Manic_Episodes': 65,
+    'Depressive_Episodes': 75,
+    'Mixed_Episodes': 55,
+    'Functional_Impairment': 70,
+    'Family_History': 40,
+    'Substance_Use': 35,
+    'Sleep_Patterns': 80,
+    'Psychotic_Features': 25,
+    'Overall_Risk': 58
+}
+
+
+@uma_vez
+def _configurar_graficos():
+    """Importar as bibliotecas de gráficos e aplicar o estilo do relatório (uma única vez)"""
+    global plt, pd, sns
+    import matplotlib.pyplot as plt
+    import pandas as pd
+    import seaborn as sns
+
+    # Configuração do seaborn para melhores visualizações
+    sns.set_style("whitegrid")
+    sns.set_palette("Set2")
+    plt.style.use('seaborn-v0_8')
+
+    # Configurações do seaborn para melhores gráficos
+    sns.set_context("notebook", font_scale=1.1)
+    plt.rcParams['figure.facecolor'] = 'white'
+    plt.rcParams['axes.facecolor'] = '#FAFAFA'
+
+
+@functools.lru_cache(maxsize=None)
+def _normas_populacao():
+    """Pontuações simuladas da população para o painel de comparação (mesmo sorteio da semente 42)"""
+    populacao = np.random.RandomState(42).gamma(2, 8, 10000)  # Distribuição gamma para prevalência bipolar
+    return np.clip(populacao, 0, 100)
+
+
+def _faixa_risco(risco: float) -> int:
+    """0 = baixo (< 30), 1 = moderado (< 50), 2 = elevado (< 70), 3 = alto"""
+    return int(np.searchsorted((30, 50, 70), risco, side='right'))
+
+
+def _imprimir(linhas: List[str], largura: int):
+    """Imprimir linhas de texto do pacote; '=' e '-' sozinhos viram separadores da largura dada"""
+    for linha in linhas:
+        if linha.strip('\n') in ('=', '-'):
+            linha = linha.replace(linha.strip('\n'), linha.strip('\n') * largura)
+        print(linha)
+
+
+class TriagemBipolar:
+    """
+    Ferramenta de Triagem para Transtorno Bipolar
+
+    Baseada em pesquisas psicológicas estabelecidas incluindo o Questionário
+    de Transtorno do Humor (MDQ), Escala Diagnóstica do Espectro Bipolar (BSDS),
+    e literatura clínica. Esta ferramenta faz triagem para transtornos do espectro bipolar.
+
+    ⚠️  AVISOS CRÍTICOS:
+    - Esta NÃO é uma ferramenta diagnóstica para Transtorno Bipolar
+    - Apenas profissionais de saúde mental licenciados podem diagnosticar transtorno bipolar
+    - Pontuações altas indicam necessidade de avaliação profissional
+    - Transtorno bipolar é uma condição médica séria que requer tratamento
+    - Se você está tendo pensamentos de autolesão, procure ajuda imediata
+    - Esta ferramenta é apenas para fins educativos e de triagem
+    - Resultados devem ser discutidos com um profissional de saúde
+    """
+
+    def __init__(self, idioma: str = 'pt'):
+        self.idioma = idioma
+        self.textos = idiomas.interface('bipolar', idioma)
+        self.instrumento = self.textos['instrumento']
+        self.chaves = idiomas.chaves('bipolar', idioma)
+        self.perguntas = idiomas.perguntas('bipolar', idioma)
+        self.descricoes_subescalas = idiomas.descricoes('bipolar', idioma)
+        self.risco_geral = self.chaves['Overall_Risk']
+        # Guia de medicamentos: só nos pacotes que o trazem
+        self.medicamentos = self.textos.get('medicamentos')
+        self.respostas_brutas = None
+
+    def administrar_triagem(self) -> Dict[str, float]:
+        """
+        Administrar a ferramenta de triagem de transtorno bipolar interativamente.
+        Retorna pontuações para cada subescala e avaliação geral de risco.
+        """
+        t = self.textos
+        _imprimir(t['apresentacao'], t['largura'])
+
+        # Carregar as bibliotecas de gráficos e as normas populacionais enquanto o usuário responde
+        Aquecimento(_configurar_graficos, _normas_populacao).iniciar()
+
+        respostas_brutas = []
+        pontuacoes = {}
+
+        for subescala, perguntas in self.perguntas.items():
+            print(f"\n{subescala.replace('_', ' ').upper()}: {self.descricoes_subescalas[subescala]}")
+            print("-" * t['largura_subescala'])
+
+            respostas_subescala = []
+            for i, (texto, _) in enumerate(perguntas, 1):
+                while True:
+                    try:
+                        pontuacao = int(input(f"{i}. {texto}: "))
+                        if 1 <= pontuacao <= 5:
+                            # Guardar a resposta bruta; a inversão é aplicada pela definição do instrumento
+                            respostas_subescala.append(pontuacao)
+                            break
+                        else:
+                            print(t['fora_da_escala'])
+                    except ValueError:
+                        print(t['numero_invalido'])
+
+            # Pontuação normalizada (0-100), calculada assim que a subescala é concluída
+            respostas_brutas.extend(respostas_subescala)
+            pontuacoes[subescala] = instrumentos.pontuar_subescala(respostas_subescala, self.instrumento, subescala)
+
+        # Risco geral ponderado da versão atual do instrumento (os pesos ficam em instrumentos.py)
+        self.respostas_brutas = respostas_brutas
+        pontuacoes[self.risco_geral] = instrumentos.pontuacao_geral(pontuacoes, self.instrumento)
+
+        # Adicionar verificação de segurança imediata
+        self._verificacao_seguranca(pontuacoes)
+
+        return pontuacoes
+
+    def _verificacao_seguranca(self, pontuacoes):
+        """Realizar avaliação imediata de segurança"""
+        t = self.textos
+        if pontuacoes[self.risco_geral] > 70 or pontuacoes[self.chaves['Depressive_Episodes']] > 80:
+            _imprimir(t['alerta_risco'], t['largura'])
+
+            if input(t['continuar']).lower() != t['sim']:
+                print(t['priorize_seguranca'])
+                exit()
+
+    def pontuacoes_demo(self) -> Dict[str, float]:
+        """Gerar pontuações demo para visualização"""
+        return idiomas.localizar(PONTUACOES_DEMO, 'bipolar', self.idioma)
+
+    def criar_relatorio_abrangente(self, pontuacoes: Dict[str, float], titulo: str = None):
+        """Criar visualização e análise abrangentes"""
+        _configurar_graficos()
+        t = self.textos
+
+        # Criar figura com estilo seaborn aprimorado
+        plt.style.use('seaborn-v0_8-darkgrid')
+        fig = plt.figure(figsize=tuple(t['figura']))
+        fig.patch.set_facecolor('white')
+
+        # Subescalas, faixas de risco e cores preparadas uma vez para todos os painéis
+        preparados = self._preparar_pontuacoes(pontuacoes)
+
+        # 1. Medidor de Risco Geral
+        ax1 = plt.subplot(3, 4, 1)
+        self._criar_medidor_risco(ax1, preparados.geral)
+
+        # 2. Padrões de Episódios de Humor
+        ax2 = plt.subplot(3, 4, (2, 3), projection='polar')
+        self._criar_radar_humor(ax2, preparados)
+
+        # 3. Avaliação do Nível de Risco
+        ax3 = plt.subplot(3, 4, 4)
+        self._criar_grafico_nivel_risco(ax3, preparados)
+
+        # 4. Detalhamento das Subescalas
+        ax4 = plt.subplot(3, 4, (5, 7))
+        self._criar_detalhamento_subescalas(ax4, preparados)
+
+        # 5. Mapa de Calor de Gravidade
+        ax5 = plt.subplot(3, 4, 8)
+        self._criar_mapa_calor_gravidade(ax5, preparados)
+
+        # 6. Linha do Tempo do Humor Simulada
+        ax6 = plt.subplot(3, 4, (9, 10))
+        self._criar_linha_tempo_humor(ax6, pontuacoes)
+
+        # 7. Comparação Populacional
+        ax7 = plt.subplot(3, 4, 11)
+        self._criar_comparacao_populacional(ax7, preparados.geral)
+
+        # 8. Recomendações de Tratamento
+        ax8 = plt.subplot(3, 4, 12)
+        self._criar_painel_recomendacoes(ax8, preparados)
+
+        plt.suptitle(titulo or t['relatorio']['titulo'], fontsize=t['fonte_titulo'], fontweight='bold', y=0.98)
+        plt.tight_layout()
+        plt.subplots_adjust(top=0.94)
+        plt.show()
+
+    def _preparar_pontuacoes(self, pontuacoes) -> EscoresPreparados:
+        """Montar os dados de pontuação compartilhados por todos os painéis do relatório"""
+        humor, impacto, risco = self.textos['relatorio']['categorias']
+        canonicas = {v: k for k, v in self.chaves.items()}
+
+        def categoria(subescala):
+            canonica = canonicas.get(subescala, subescala)
+            if canonica.endswith('_Episodes'):
+                return humor
+            if canonica in SUBESCALAS_IMPACTO:
+                return impacto
+            return risco
+
+        cores_categorias = {
+            humor: '#E74C3C',
+            impacto: '#F39C12',
+            risco: '#3498DB'
+        }
+        return EscoresPreparados(pontuacoes, self.risco_geral, (30, 50, 70), (30, 50, 70, 85),
+                                 categoria, cores_categorias)
+
+    def _criar_medidor_risco(self, ax, risco_geral):
+        """Criar medidor estilo velocímetro para risco geral"""
+        r = self.textos['relatorio']
+        theta = np.linspace(0, np.pi, 100)
+
+        # Paleta de cores aprimorada para níveis de risco
+        cores_risco = sns.color_palette("RdYlBu_r", 4)
+
+        cores = []
+        for angulo in theta:
+            risco_no_angulo = (angulo / np.pi) * 100
+            if risco_no_angulo < 30:
+                cores.append(cores_risco[3])  # Baixo - Azul
+            elif risco_no_angulo < 50:
+                cores.append(cores_risco[2])  # Moderado - Amarelo
+            elif risco_no_angulo < 70:
+                cores.append(cores_risco[1])  # Alto - Laranja
+            else:
+                cores.append(cores_risco[0])  # Muito Alto - Vermelho
+
+        # Plotar fundo do medidor
+        for i in range(len(theta)-1):
+            ax.fill_between([theta[i], theta[i+1]], [0.8, 0.8], [1, 1],
+                           color=cores[i], alpha=0.9)
+
+        # Plotar ponteiro
+        angulo_ponteiro = (risco_geral / 100) * np.pi
+        ax.arrow(angulo_ponteiro, 0, 0, 0.9, head_width=0.06, head_length=0.06,
+                fc='#2C3E50', ec='#2C3E50', linewidth=5)
+
+        # Adicionar texto da pontuação
+        ax.text(np.pi/2, 0.5, f'{risco_geral:.0f}', ha='center', va='center',
+               fontsize=self.textos['fonte_medidor'], fontweight='bold', color='#2C3E50')
+        ax.text(np.pi/2, 0.25, r['medidor_rotulo'], ha='center', va='center',
+               fontsize=14, fontweight='bold', color='#34495E')
+
+        # Rótulos aprimorados
+        ax.set_ylim(0, 1)
+        ax.set_xlim(0, np.pi)
+        ax.set_xticks([0, np.pi/4, np.pi/2, 3*np.pi/4, np.pi])
+        ax.set_xticklabels(r['faixas'], fontsize=11)
+        ax.set_yticks([])
+        ax.set_title(r['medidor_titulo'], fontweight='bold', pad=30, fontsize=16)
+
+    def _criar_radar_humor(self, ax, preparados):
+        """Criar gráfico radar para subescalas relacionadas ao humor"""
+        subescalas_humor = [self.chaves[s] for s in SUBESCALAS_HUMOR]
+        # Valores do polígono fechado, ângulos em cache e rótulos
+        valores, angulos, rotulos = preparados.radar(subescalas_humor)
+
+        # Estilo aprimorado do gráfico radar
+        cores = sns.color_palette("viridis", 3)
+
+        # Plotar com preenchimento gradiente
+        ax.plot(angulos, valores, 'o-', linewidth=4, color=cores[0],
+               markersize=10, markerfacecolor=cores[1], markeredgecolor=cores[0],
+               markeredgewidth=3)
+        ax.fill(angulos, valores, alpha=0.4, color=cores[0])
+
+        # Personalizar
+        ax.set_xticks(angulos[:-1])
+        ax.set_xticklabels(rotulos, fontsize=12, fontweight='bold')
+        ax.set_ylim(0, 100)
+        ax.set_yticks([25, 50, 75, 100])
+        ax.set_yticklabels(['25', '50', '75', '100'], fontsize=11)
+        ax.grid(True, alpha=0.7)
+        ax.set_title(self.textos['relatorio']['radar_titulo'], fontweight='bold', pad=30, fontsize=16)
+
+        # Adicionar rótulos de pontuação com estilo aprimorado
+        for angulo, valor in zip(angulos[:-1], valores[:-1]):
+            offset = 8 if valor > 85 else 6
+            ax.text(angulo, valor + offset, f'{valor:.0f}',
+                   horizontalalignment='center', fontsize=11, fontweight='bold',
+                   bbox=dict(boxstyle="round,pad=0.3", facecolor='white',
+                           alpha=0.9, edgecolor=cores[0], linewidth=2))
+
+    def _criar_grafico_nivel_risco(self, ax, preparados):
+        """Criar avaliação aprimorada do nível de risco"""
+        r = self.textos['relatorio']
+        risco_geral = preparados.geral
+        valores_risco = [30, 20, 20, 15, 15]
+
+        # Paleta de cores aprimorada
+        cores_risco = sns.color_palette("RdYlBu_r", 5)
+
+        # Nível de risco atual (0-4), classificado uma vez nos dados preparados
+        risco_atual = preparados.faixa_geral
+
+        # Criar barras aprimoradas
+        barras = ax.bar(r['faixas'], valores_risco, color=cores_risco, alpha=0.8,
+                       edgecolor='white', linewidth=3)
+
+        # Destacar nível de risco atual
+        barras[risco_atual].set_alpha(1.0)
+        barras[risco_atual].set_edgecolor('#2C3E50')
+        barras[risco_atual].set_linewidth(5)
+
+        # Estilo aprimorado
+        ax.set_ylabel(r['eixo_faixa'], fontweight='bold', fontsize=13)
+        ax.set_title(r['classificacao_titulo'], fontweight='bold', fontsize=16, pad=25)
+        ax.set_ylim(0, 35)
+
+        # Indicador do nível atual
+        ax.text(risco_atual, barras[risco_atual].get_height() + 2,
+               r['seu_nivel'].format(risco=risco_geral), ha='center', va='bottom',
+               fontweight='bold', fontsize=12,
+               bbox=dict(boxstyle="round,pad=0.6", facecolor='yellow',
+                        alpha=0.95, edgecolor='orange', linewidth=3))
+
+        ax.grid(True, alpha=0.4, axis='y')
+        ax.set_facecolor('#FAFAFA')
+        plt.setp(ax.get_xticklabels(), fontsize=11, fontweight='bold')
+
+    def _criar_detalhamento_subescalas(self, ax, preparados):
+        """Criar gráfico de barras horizontais de todas as subescalas"""
+        r = self.textos['relatorio']
+        valores = preparados.valores
+        cores = preparados.cores
+
+        # Criar gráfico de barras horizontais
+        pos_y = np.arange(len(valores))
+        barras = ax.barh(pos_y, valores, color=cores, alpha=0.85,
+                        edgecolor='white', linewidth=2)
+
+        # Adicionar rótulos de valor
+        for barra, valor in zip(barras, valores):
+            largura = barra.get_width()
+            ax.text(largura + 1.5, barra.get_y() + barra.get_height()/2,
+                   f'{valor:.0f}', ha='left', va='center', fontweight='bold',
+                   fontsize=12, color='#2C3E50')
+
+        # Estilo aprimorado
+        ax.set_yticks(pos_y)
+        ax.set_yticklabels(preparados.rotulos, fontsize=12, fontweight='bold')
+        ax.set_xlabel(r['eixo_pontuacao'], fontweight='bold', fontsize=14)
+        ax.set_title(r['subescalas_titulo'], fontweight='bold', fontsize=16, pad=25)
+        ax.set_xlim(0, 110)
+
+        # Linhas de referência
+        ax.axvline(x=50, color='gray', linestyle='--', alpha=0.8, linewidth=2)
+        ax.axvline(x=70, color='red', linestyle='--', alpha=0.8, linewidth=2)
+
+        # Legenda aprimorada
+        from matplotlib.patches import Patch
+        elementos_legenda = [Patch(facecolor=cor, label=categoria)
+                            for categoria, cor in preparados.cores_categorias.items()]
+        ax.legend(handles=elementos_legenda, loc='lower right', frameon=True,
+                 fancybox=True, shadow=True, fontsize=11)
+
+        ax.grid(True, alpha=0.4, axis='x')
+        ax.set_facecolor('#FAFAFA')
+
+    def _criar_mapa_calor_gravidade(self, ax, preparados):
+        """Criar mapa de calor mostrando gravidade entre domínios"""
+        r = self.textos['relatorio']
+        # Linhas são níveis cumulativos de gravidade: Baixo [1,0,0,0] ... Muito Alto [1,1,1,1]
+        sns.heatmap(preparados.matriz_faixas,
+                   yticklabels=preparados.rotulos_quebrados,
+                   xticklabels=r['gravidade'],
+                   cmap='Reds', cbar=False, ax=ax,
+                   linewidths=1, linecolor='white')
+
+        ax.set_title(r['mapa_titulo'], fontweight='bold', fontsize=14, pad=20)
+        ax.set_xlabel(r['eixo_gravidade'], fontweight='bold', fontsize=12)
+        ax.tick_params(axis='both', labelsize=10)
+
+    def _criar_linha_tempo_humor(self, ax, pontuacoes):
+        """Criar linha do tempo simulada do humor baseada nas pontuações"""
+        r = self.textos['relatorio']
+        # Gerar dados simulados de humor baseados nas pontuações
+        datas = pd.date_range(start='2024-01-01', end='2025-08-14', freq='W')
+
+        # Linha base do humor
+        humor_base = 5  # Humor neutro
+
+        # Adicionar variações baseadas nas pontuações
+        intensidade_maniaca = pontuacoes[self.chaves['Manic_Episodes']] / 100
+        intensidade_depressiva = pontuacoes[self.chaves['Depressive_Episodes']] / 100
+        fator_misto = pontuacoes[self.chaves['Mixed_Episodes']] / 100
+
+        linha_tempo_humor = []
+        for i, data in enumerate(datas):
+            # Simular episódios de humor
+            posicao_ciclo = (i / len(datas)) * 4 * np.pi  # Múltiplos ciclos
+
+            componente_maniaco = intensidade_maniaca * 3 * np.sin(posicao_ciclo + np.pi/4)
+            componente_depressivo = -intensidade_depressiva * 3 * np.sin(posicao_ciclo + np.pi)
+            ruido_misto = fator_misto * np.random.normal(0, 1)
+
+            humor = humor_base + componente_maniaco + componente_depressivo + ruido_misto
+            humor = np.clip(humor, 1, 10)  # Manter na faixa 1-10
+            linha_tempo_humor.append(humor)
+
+        # Criar gráfico aprimorado da linha do tempo
+        cores = sns.color_palette("RdBu_r", 256)
+
+        # Plotar linha do humor com gradiente de cor
+        for i in range(len(datas)-1):
+            indice_cor = int((linha_tempo_humor[i] - 1) / 9 * 255)
+            ax.plot([datas[i], datas[i+1]], [linha_tempo_humor[i], linha_tempo_humor[i+1]],
+                   color=cores[indice_cor], linewidth=3, alpha=0.8)
+
+        # Adicionar zonas de nível de humor
+        maniaca, normal, depressiva = r['zonas_humor']
+        ax.axhspan(7, 10, alpha=0.2, color='red', label=maniaca)
+        ax.axhspan(4, 6, alpha=0.2, color='green', label=normal)
+        ax.axhspan(1, 3, alpha=0.2, color='blue', label=depressiva)
+
+        # Estilo aprimorado
+        ax.set_xlabel(r['eixo_data'], fontweight='bold', fontsize=12)
+        ax.set_ylabel(r['eixo_humor'], fontweight='bold', fontsize=12)
+        ax.set_title(r['linha_tempo_titulo'], fontweight='bold', fontsize=14, pad=20)
+        ax.set_ylim(1, 10)
+        ax.legend(loc='upper right', frameon=True, fancybox=True, shadow=True)
+        ax.grid(True, alpha=0.4)
+
+        # Formatar eixo x
+        import matplotlib.dates as mdates
+        ax.xaxis.set_major_formatter(mdates.DateFormatter('%m/%y'))
+        ax.tick_params(axis='x', rotation=45)
+
+    def _criar_comparacao_populacional(self, ax, risco_geral):
+        """Criar visualização de comparação populacional"""
+        r = self.textos['relatorio']
+        # Distribuição populacional simulada (em cache)
+        populacao = _normas_populacao()
+
+        # Calcular percentil
+        percentil = (np.sum(populacao < risco_geral) / len(populacao)) * 100
+
+        # Criar histograma aprimorado
+        cores = sns.color_palette("viridis", 3)
+        ax.hist(populacao, bins=40, alpha=0.7, color=cores[0],
+                edgecolor='white', linewidth=1, density=True)
+
+        # Adicionar aproximação de curva suave
+        x = np.linspace(0, 100, 100)
+        # Aproximação simplificada da distribuição gamma
+        forma, escala = 2, 8
+        y = (x**(forma-1) * np.exp(-x/escala)) / (escala**forma * math.gamma(forma))
+        ax.plot(x, y, color=cores[1], linewidth=4, alpha=0.9, label=r['curva_populacao'])
+
+        # Linha da sua pontuação
+        ax.axvline(risco_geral, color='#E74C3C', linewidth=5, alpha=0.9,
+                  label=r['sua_pontuacao'].format(risco=risco_geral), linestyle='-')
+
+        # Estilo aprimorado
+        ax.set_xlabel(r['eixo_risco'], fontweight='bold', fontsize=12)
+        ax.set_ylabel(r['eixo_densidade'], fontweight='bold', fontsize=12)
+        ax.set_title(r['comparacao_titulo'].format(percentil=percentil),
+                    fontweight='bold', fontsize=14, pad=20)
+        ax.legend(frameon=True, fancybox=True, shadow=True)
+        ax.grid(True, alpha=0.4)
+        ax.set_facecolor('#FAFAFA')
+
+        # Adicionar informação do percentil
+        props = dict(boxstyle='round', facecolor='lightblue', alpha=0.8)
+        ax.text(0.05, 0.95, r['percentil'].format(percentil=percentil), transform=ax.transAxes, fontsize=11,
+                verticalalignment='top', bbox=props, fontweight='bold')
+
+    def texto_recomendacoes(self, preparados) -> str:
+        """Texto do painel de recomendações para o nível de risco"""
+        r = self.textos['recomendacoes']
+        risco_geral = preparados.geral
+        faixa = _faixa_risco(risco_geral)
+
+        # Obter áreas de maior risco
+        principais_preocupacoes = preparados.maiores(3)
+        nomes = [s.replace('_', ' ') for s, _ in principais_preocupacoes]
+
+        linhas = [l.format(nivel=r['niveis'][faixa], risco=risco_geral) for l in r['cabecalho']]
+        linhas += [f"{i}. {nome}: {valor:.0f}" for i, (nome, (_, valor)) in
+                   enumerate(zip(nomes, principais_preocupacoes), 1)]
+        linhas += ['', *(l.format(principal=nomes[0], principais=', '.join(nomes[:2]))
+                         for l in r['listas'][faixa]), '']
+        if self.medicamentos:
+            linhas += [self.medicamentos['painel_titulo'], *self.medicamentos['painel'][faixa], '']
+        linhas += r['rodape']
+        return '\n'.join(linhas)
+
+    def _criar_painel_recomendacoes(self, ax, preparados):
+        """Criar painel de recomendações de tratamento"""
+        ax.axis('off')
+
+        # Escolher cor de fundo baseada no risco
+        cor_fundo = ('lightgreen', 'lightyellow', 'orange', 'lightcoral')[_faixa_risco(preparados.geral)]
+
+        ax.text(0.05, 0.95, self.texto_recomendacoes(preparados), transform=ax.transAxes,
+               fontsize=self.textos['fonte_recomendacoes'], verticalalignment='top', fontfamily='monospace',
+               bbox=dict(boxstyle="round,pad=0.6", facecolor=cor_fundo, alpha=0.9,
+                        edgecolor='gray', linewidth=2))
+
+    def criar_guia_medicamentos(self, pontuacoes: Dict[str, float]):
+        """Criar guia detalhado de medicamentos baseado nas pontuações"""
+        if not self.medicamentos:
+            raise ValueError(f"O pacote '{self.idioma}' não tem guia de medicamentos")
+        _configurar_graficos()
+
+        fig, axes = plt.subplots(2, 2, figsize=(20, 14))
+        fig.suptitle(self.medicamentos['guia_titulo'],
+                    fontsize=18, fontweight='bold', y=0.98)
+
+        risco_geral = pontuacoes[self.risco_geral]
+
+        # Estabilizadores de humor, antipsicóticos e antidepressivos, um painel cada;
+        # ansiolíticos e terapias adjuvantes juntos no último
+        *categorias, ansioliticos, adjuvantes = self.medicamentos['opcoes']
+        for ax, categoria in zip(axes.flat, categorias):
+            self._criar_grafico_medicamentos(ax, categoria, risco_geral, estabilizadores=categoria == categorias[0])
+        self._criar_grafico_adjuvantes(axes[1, 1], ansioliticos, adjuvantes, risco_geral)
+
+        plt.tight_layout()
+        plt.subplots_adjust(top=0.94)
+        plt.show()
+
+    def _criar_grafico_medicamentos(self, ax, categoria, risco_geral, estabilizadores=False):
+        """Criar gráfico de medicamentos por categoria"""
+        medicamentos = list(self.medicamentos['opcoes'][categoria].keys())
+
+        # Pontuações de adequação baseadas no risco geral
+        faixa = _faixa_risco(risco_geral)
+        if estabilizadores:
+            adequacao = ([20, 30, 10, 25], [40, 60, 30, 50], [80, 85, 60, 70], [95, 90, 75, 80])[faixa]
+        else:
+            adequacao = ([15, 10, 20, 25], [35, 30, 40, 45], [70, 65, 75, 70], [85, 90, 80, 75])[faixa]
+
+        # Ajustar para o número real de medicamentos
+        adequacao = adequacao[:len(medicamentos)]
+
+        # Cores baseadas na adequação
+        cores = ['#27AE60' if a >= 70 else '#F39C12' if a >= 40 else '#E74C3C' for a in adequacao]
+
+        # Criar gráfico de barras
+        barras = ax.bar(range(len(medicamentos)), adequacao, color=cores, alpha=0.8,
+                       edgecolor='white', linewidth=2)
+
+        # Adicionar valores
+        for barra, valor in zip(barras, adequacao):
+            altura = barra.get_height()
+            ax.text(barra.get_x() + barra.get_width()/2., altura + 2,
+                   f'{valor}%', ha='center', va='bottom', fontweight='bold')
+
+        # Personalizar
+        ax.set_xticks(range(len(medicamentos)))
+        nomes_curtos = [med.split('(')[0][:15] + '...' if len(med) > 15 else med.split('(')[0]
+                       for med in medicamentos]
+        ax.set_xticklabels(nomes_curtos, rotation=45, ha='right', fontsize=10)
+        ax.set_ylabel(self.medicamentos['eixo_adequacao'], fontweight='bold')
+        ax.set_title(categoria.replace('_', ' '), fontweight='bold', fontsize=14)
+        ax.set_ylim(0, 105)
+        ax.grid(True, alpha=0.3, axis='y')
+
+    def _criar_grafico_adjuvantes(self, ax, ansioliticos, adjuvantes, risco_geral):
+        """Criar gráfico combinado para ansiolíticos e terapias adjuvantes"""
+        medicamentos_ansi = list(self.medicamentos['opcoes'][ansioliticos].keys())
+        medicamentos_adj = list(self.medicamentos['opcoes'][adjuvantes].keys())
+
+        todos_medicamentos = medicamentos_ansi + medicamentos_adj
+        cores_categoria = ['#3498DB'] * len(medicamentos_ansi) + ['#9B59B6'] * len(medicamentos_adj)
+
+        # Adequação baseada no risco
+        if risco_geral < 50:
+            adequacao = [30, 25, 80, 70]  # Baixa para ansiolíticos, alta para adjuvantes
+        else:
+            adequacao = [70, 60, 85, 75]  # Maior para ansiolíticos em alto risco
+
+        # Criar gráfico
+        barras = ax.bar(range(len(todos_medicamentos)), adequacao, color=cores_categoria,
+                       alpha=0.8, edgecolor='white', linewidth=2)
+
+        # Adicionar valores
+        for barra, valor in zip(barras, adequacao):
+            altura = barra.get_height()
+            ax.text(barra.get_x() + barra.get_width()/2., altura + 2,
+                   f'{valor}%', ha='center', va='bottom', fontweight='bold')
+
+        # Personalizar
+        ax.set_xticks(range(len(todos_medicamentos)))
+        nomes_curtos = [med.split('(')[0][:12] + '...' if len(med) > 12 else med.split('(')[0]
+                       for med in todos_medicamentos]
+        ax.set_xticklabels(nomes_curtos, rotation=45, ha='right', fontsize=10)
+        ax.set_ylabel(self.medicamentos['eixo_adequacao'], fontweight='bold')
+        ax.set_title(self.medicamentos['adjuvantes_titulo'], fontweight='bold', fontsize=14)
+        ax.set_ylim(0, 105)
+        ax.grid(True, alpha=0.3, axis='y')
+
+        # Legenda
+        from matplotlib.patches import Patch
+        rotulo_ansi, rotulo_adj = self.medicamentos['adjuvantes_legenda']
+        elementos_legenda = [Patch(facecolor='#3498DB', label=rotulo_ansi),
+                            Patch(facecolor='#9B59B6', label=rotulo_adj)]
+        ax.legend(handles=elementos_legenda, loc='upper right')
+
+    def imprimir_analise_detalhada(self, pontuacoes):
+        """Imprimir análise abrangente dos resultados"""
+        t = self.textos
+        a = t['analise']
+        print("\n" + "=" * t['largura_analise'])
+        print(a['titulo'])
+        print("=" * t['largura_analise'])
+
+        risco_geral = pontuacoes[self.risco_geral]
+        print(a['pontuacao_geral'].format(risco=risco_geral))
+
+        # Interpretação do risco
+        faixa = _faixa_risco(risco_geral)
+        print(a['interpretacoes'][faixa])
+        print(f"   {a['descricoes'][faixa]}")
+
+        # Análise das subescalas
+        print(a['subescalas'])
+        baixo, moderado, alto = a['niveis']
+        subescalas = {k: v for k, v in pontuacoes.items() if k != self.risco_geral}
+        for subescala, pontuacao in sorted(subescalas.items(), key=lambda x: x[1], reverse=True):
+            nivel = alto if pontuacao >= 70 else moderado if pontuacao >= 50 else baixo
+            print(f"   • {subescala.replace('_', ' ')}: {pontuacao:.1f} ({nivel})")
+            print(f"     {self.descricoes_subescalas[subescala]}")
+
+        # Avaliação de crise
+        print(a['seguranca'])
+        if pontuacoes[self.chaves['Depressive_Episodes']] > 70 or risco_geral > 85:
+            _imprimir(a['alerta_seguranca'], t['largura'])
+        else:
+            print(a['sem_alerta'])
+
+        # Recomendações de medicamentos
+        if self.medicamentos:
+            print(self.medicamentos['analise_titulo'])
+            _imprimir(self.medicamentos['analise'][2 if risco_geral >= 70 else 1 if risco_geral >= 50 else 0],
+                      t['largura'])
+
+        # Próximos passos
+        print(a['proximos_passos'])
+        _imprimir(a['passos_risco'] if risco_geral >= 50 else a['passos_baixo_risco'], t['largura'])
+
+        _imprimir(a['recursos'], t['largura'])
+
+    def salvar_resultados(self, pontuacoes: Dict[str, float], nome_arquivo: str = None,
+                          respostas: List[int] = None):
+        """Salvar resultados da triagem em arquivo JSON (as respostas brutas permitem repontuar depois)"""
+        r = self.textos['resultado']
+        campos = r['campos']
+        nome_arquivo = nome_arquivo or r['arquivo_padrao']
+        resultados = {
+            'timestamp': datetime.now().isoformat(),
+            campos['pontuacoes']: pontuacoes,
+            campos['tipo']: r['tipo'],
+            campos['instrumento']: self.instrumento,
+            campos['versao']: instrumentos.VERSAO_ATUAL[self.instrumento],
+            campos['respostas']: respostas,
+            'disclaimer': r['disclaimer'],
+            campos['recursos']: r['recursos']
+        }
+
+        with open(nome_arquivo, 'w', encoding='utf-8') as f:
+            json.dump(resultados, f, indent=2, ensure_ascii=False)
+
+        print(r['salvo'].format(arquivo=nome_arquivo))
+
+
+def main(idioma: str):
+    """Menu interativo da triagem no idioma dado"""
+    triagem = TriagemBipolar(idioma)
+    t = triagem.textos
+    medicamentos = triagem.medicamentos
+
+    _imprimir(t['abertura'], t['largura'])
+    _imprimir(t['menu'], t['largura'])
+
+    while True:
+        escolha = input(t['escolha']).strip()
+        if escolha == "1":
+            _imprimir(t['antes_de_comecar'], t['largura'])
+
+            if input(t['pronto']).lower() == t['sim']:
+                pontuacoes = triagem.administrar_triagem()
+                respostas = triagem.respostas_brutas
+                titulo = t['titulo_triagem']
+                nome_arquivo = t['arquivo_triagem']
+                mostrar_medicamentos = True
+            else:
+                print(t['cancelada'])
+                exit()
+            break
+        elif escolha == "2":
+            pontuacoes = triagem.pontuacoes_demo()
+            respostas = None
+            titulo = t['titulo_demo']
+            nome_arquivo = t['arquivo_demo']
+            mostrar_medicamentos = False
+            print(t['aviso_demo'])
+            break
+        elif medicamentos and escolha == medicamentos['opcao_menu']:
+            print(medicamentos['aviso_demo'])
+            triagem.criar_guia_medicamentos(triagem.pontuacoes_demo())
+        else:
+            print(t['escolha_invalida'])
+
+    # Criar relatório abrangente
+    triagem.criar_relatorio_abrangente(pontuacoes, titulo)
+
+    # Mostrar guia de medicamentos se solicitado
+    if medicamentos and (mostrar_medicamentos or input(medicamentos['perguntar_guia']).lower() == t['sim']):
+        triagem.criar_guia_medicamentos(pontuacoes)
+
+    # Imprimir análise detalhada
+    triagem.imprimir_analise_detalhada(pontuacoes)
+
+    # Salvar resultados
+    triagem.salvar_resultados(pontuacoes, nome_arquivo, respostas)
+
+    _imprimir(t['conclusao'], t['largura'])
@@ -0,0 +1,185 @@
+import argparse
+import heapq
+from typing import Iterator, List, NamedTuple, Tuple
+
+import cohpiah
+import LabCohPiah2
+import tokenizador
+
+# Localização de trechos suspeitos dentro de um texto longo.
+#
+# avalia_textos() compara textos inteiros. Aqui o texto é dividido em
+# sentenças (cada uma vai do fim da anterior até o fim da sua sequência
+# [.!?], como em separa_sentencas) e uma janela de n sentenças desliza sobre
+# elas. A assinatura de cada janela é exatamente a de calcula_assinatura()
+# aplicada ao trecho, mas não é recalculada: ao avançar, a sentença que entra
+# é somada e a que sai é subtraída dos contadores. Palavras diferentes e
+# hapax são mantidos junto com a tabela de frequências (uma palavra que passa
+# de 1 para 2 ocorrências deixa de ser hapax, e assim por diante), então cada
+# passo custa o número de palavras das duas sentenças e a varredura inteira
+# é linear no tamanho do texto.
+
+
+class Sentenca(NamedTuple):
+    """Contagens de uma sentença do texto (intervalo [inicio, fim) em caracteres)"""
+    inicio: int
+    fim: int
+    caracteres: int
+    letras: int
+    palavras: Tuple[int, ...]  # identificadores das palavras em minúsculas
+    separadores_sentenca: int
+    caracteres_sentenca: int
+    separadores_frase: int
+    caracteres_frase: int
+
+
+def separa_sentencas(texto: str) -> Tuple[List[Sentenca], List[str]]:
+    """Sentenças do texto e o vocabulário (identificador -> palavra em minúsculas), em uma passada"""
+    sentencas = []
+    vocabulario = {}
+    inicio = 0
+    contagens = [0] * 6
+    palavras = []
+    for tipo, a, b in tokenizador.tokens(texto):
+        tamanho = b - a
+        contagens[0] += tamanho
+        if tipo == tokenizador.PALAVRA:
+            contagens[1] += tamanho
+            palavras.append(vocabulario.setdefault(texto[a:b].lower(), len(vocabulario)))
+        elif tipo == tokenizador.SEPARADOR_FRASE:
+            contagens[4] += 1
+            contagens[5] += tamanho
+        elif tipo == tokenizador.SEPARADOR_SENTENCA:
+            contagens[2] += 1
+            contagens[3] += tamanho
+            sentencas.append(Sentenca(inicio, b, contagens[0], contagens[1], tuple(palavras), *contagens[2:]))
+            inicio = b
+            contagens = [0] * 6
+            palavras = []
+    if inicio < len(texto):
+        # Resto sem [.!?] no fim: também é uma sentença, como em separa_sentencas
+        sentencas.append(Sentenca(inicio, len(texto), contagens[0], contagens[1], tuple(palavras), *contagens[2:]))
+    return sentencas, list(vocabulario)
+
+
+class JanelaSentencas:
+    """Contadores de uma sequência de sentenças consecutivas, com inclusão e remoção em O(palavras)"""
+
+    def __init__(self, tamanho_vocabulario: int):
+        self.frequencias = [0] * tamanho_vocabulario
+        self.distintas = 0
+        self.hapax = 0
+        self.termina_em_sentenca = False
+        self.caracteres = self.letras = self.palavras = 0
+        self.separadores_sentenca = self.caracteres_sentenca = 0
+        self.separadores_frase = self.caracteres_frase = 0
+
+    def _somar(self, sentenca: Sentenca, sinal: int):
+        self.caracteres += sinal * sentenca.caracteres
+        self.letras += sinal * sentenca.letras
+        self.palavras += sinal * len(sentenca.palavras)
+        self.separadores_sentenca += sinal * sentenca.separadores_sentenca
+        self.caracteres_sentenca += sinal * sentenca.caracteres_sentenca
+        self.separadores_frase += sinal * sentenca.separadores_frase
+        self.caracteres_frase += sinal * sentenca.caracteres_frase
+
+    def incluir(self, sentenca: Sentenca):
+        """Acrescentar uma sentença no fim da janela"""
+        self._somar(sentenca, 1)
+        frequencias = self.frequencias
+        for palavra in sentenca.palavras:
+            n = frequencias[palavra]
+            if n == 0:
+                self.distintas += 1
+                self.hapax += 1
+            elif n == 1:
+                self.hapax -= 1
+            frequencias[palavra] = n + 1
+        self.termina_em_sentenca = sentenca.separadores_sentenca > 0
+
+    def remover(self, sentenca: Sentenca):
+        """Retirar a sentença do início da janela"""
+        self._somar(sentenca, -1)
+        frequencias = self.frequencias
+        for palavra in sentenca.palavras:
+            n = frequencias[palavra]
+            if n == 1:
+                self.distintas -= 1
+                self.hapax -= 1
+            elif n == 2:
+                self.hapax += 1
+            frequencias[palavra] = n - 1
+
+    def assinatura(self) -> List[float]:
+        """Os seis traços do trecho formado pelas sentenças da janela"""
+        vazia_no_fim = self.caracteres == 0 or self.termina_em_sentenca
+        n_sentencas = self.separadores_sentenca + (0 if vazia_no_fim else 1)
+        n_frases = self.separadores_frase + n_sentencas
+        chars_sentencas = self.caracteres - self.caracteres_sentenca
+        chars_frases = chars_sentencas - self.caracteres_frase
+        return [self.letras / self.palavras, self.distintas / self.palavras, self.hapax / self.palavras,
+                chars_sentencas / n_sentencas, n_frases / n_sentencas, chars_frases / n_frases]
+
+
+def varrer(texto: str, tamanho_janela: int = 5, passo: int = 1) -> Iterator[Tuple[int, int, List[float]]]:
+    """
+    (inicio, fim, assinatura) de cada janela de tamanho_janela sentenças,
+    avançando passo sentenças por vez. Janelas sem palavras são puladas.
+    """
+    if tamanho_janela < 1 or passo < 1:
+        raise ValueError("tamanho_janela e passo devem ser positivos")
+    sentencas, vocabulario = separa_sentencas(texto)
+    janela = JanelaSentencas(len(vocabulario))
+    for i, sentenca in enumerate(sentencas):
+        janela.incluir(sentenca)
+        if i >= tamanho_janela:
+            janela.remover(sentencas[i - tamanho_janela])
+        primeira = i - tamanho_janela + 1
+        if primeira >= 0 and primeira % passo == 0 and janela.palavras:
+            yield sentencas[primeira].inicio, sentenca.fim, janela.assinatura()
+    if len(sentencas) < tamanho_janela and janela.palavras:
+        # Texto mais curto que a janela: um único trecho, o texto inteiro
+        yield 0, len(texto), janela.assinatura()
+
+
+def trechos_suspeitos(texto: str, ass_cp: List[float], tamanho_janela: int = 5, k: int = 5,
+                      passo: int = 1, sobrepostos: bool = False) -> List[Tuple[float, int, int]]:
+    """
+    Os k trechos cuja assinatura está mais próxima de ass_cp: (grau, inicio, fim),
+    do menor grau ao maior. Sem sobrepostos, cada trecho escolhido exclui os
+    que se sobrepõem a ele.
+    """
+    graus = ((LabCohPiah2.compara_assinatura(assinatura, ass_cp), inicio, fim)
+             for inicio, fim, assinatura in varrer(texto, tamanho_janela, passo))
+    if sobrepostos:
+        return heapq.nsmallest(k, graus)
+
+    escolhidos = []
+    for grau, inicio, fim in sorted(graus):
+        if all(fim <= a or inicio >= b for _, a, b in escolhidos):
+            escolhidos.append((grau, inicio, fim))
+            if len(escolhidos) == k:
+                break
+    return escolhidos
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Localizar os trechos de um texto mais parecidos com a assinatura COH-PIAH")
+    parser.add_argument('arquivo', help="texto a examinar (UTF-8)")
+    parser.add_argument('--assinatura', type=float, nargs=6, metavar=cohpiah.TRACOS,
+                        help="assinatura do aluno infectado (padrão: perguntar no console)")
+    parser.add_argument('--janela', type=int, default=5, help="sentenças por trecho")
+    parser.add_argument('--passo', type=int, default=1, help="sentenças entre o início de dois trechos")
+    parser.add_argument('--top', type=int, default=5, help="quantos trechos mostrar")
+    parser.add_argument('--sobrepostos', action='store_true', help="permitir trechos sobrepostos")
+    args = parser.parse_args()
+
+    with open(args.arquivo, encoding='utf-8', newline='') as f:
+        texto = f.read()
+    ass_cp = args.assinatura or LabCohPiah2.le_assinatura()
+
+    for posicao, (grau, inicio, fim) in enumerate(
+            trechos_suspeitos(texto, ass_cp, args.janela, args.top, args.passo, args.sobrepostos), 1):
+        trecho = ' '.join(texto[inicio:fim].split())
+        print(f"{posicao:3d}. caracteres {inicio}-{fim}  (similaridade {grau:.4f})")
+        print(f"     {trecho[:200]}{'...' if len(trecho) > 200 else ''}")